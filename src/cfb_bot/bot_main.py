@@ -48,6 +48,7 @@ bot = commands.Bot(
 )
 
 # Import utilities after bot setup to avoid circular imports
+from .utils.api_retry import close_session
 from .utils.server_config import server_config
 
 # ==================== COG LOADING ====================
@@ -573,7 +574,11 @@ async def main():
     # Load cogs
     async with bot:
         await load_cogs()
-        await bot.start(token)
+        try:
+            await bot.start(token)
+        finally:
+            # Release the pooled aiohttp session shared by api_retry callers
+            await close_session()
 
 
 def run():
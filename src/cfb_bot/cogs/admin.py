@@ -14,21 +14,293 @@ Commands:
 - /admin config - Configure modules
 - /admin sync - Force sync slash commands
 - /admin channels - Manage channel whitelist
+- /admin zyte / ai / budget - API usage and cost reports
+- /admin cache - Cache stats and clearing
+- /admin digest - Weekly summary digest
+- /admin schedule_reload - Reload schedule.json
+
+Every command defers first (@deferred_admin); admin-only commands are then
+gated by @require_admin, which replies with a followup when access is denied.
+
+The usage/budget views send the largest embeds in the bot. With the optional
+`orjson` package installed, discord.py serializes them with orjson instead of
+the stdlib json module - no code changes needed here.
 """
 
+import asyncio
+import functools
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from ..config import Colors, Footers
+from ..utils.cache import get_cache
+from ..utils.cost_tracker import get_cost_tracker
 from ..utils.server_config import server_config, FeatureModule
+from ..utils.weekly_digest import get_weekly_digest
+from .recruiting import get_recruiting_scraper
 
 logger = logging.getLogger('CFB26Bot.Admin')
 
+# Module lookup by its /admin config value (avoids Enum.__call__ + try/except per call)
+_MODULE_BY_VALUE: Dict[str, FeatureModule] = {m.value: m for m in FeatureModule}
+
+# Every module /admin config enable_all turns on (CORE is always on anyway)
+_ALL_NON_CORE = frozenset(m for m in FeatureModule if m is not FeatureModule.CORE)
+
+# Static /admin config embed text (built once, not per invocation)
+_MORE_COMMANDS_VALUE = (
+    "`/admin list` - View admins\n"
+    "`/admin blocked` - View blocked channels\n"
+    "`/recruiting source` - Change recruiting source\n"
+    "`/league week` - View current season/week"
+)
+_ENABLE_ALL_DESC = (
+    f"Enabled **{len(_ALL_NON_CORE)}** modules:\n"
+    "• AI Chat\n"
+    "• CFB Data\n"
+    "• League\n"
+    "• HS Stats\n"
+    "• Recruiting\n"
+    "• Fun & Games"
+)
+_DISABLE_ALL_DESC = (
+    f"Disabled **{len(_ALL_NON_CORE)}** modules.\n\n"
+    "✅ **CORE** remains active (/help, /whats_new, etc.)\n\n"
+    "Use `/admin config enable_all` to restore."
+)
+_CONFIG_VIEW_HINT = "Use /admin config view to see full status"
+_NO_CHANNELS_TEXT = "None"
+
+# Single-module enable/disable for /admin config. The ServerConfigManager method is
+# looked up by name so it always resolves against the current server_config.
+_MODULE_ACTIONS: Dict[str, Dict] = {
+    "enable": {
+        "method": "enable_module",
+        "enabled": True,
+        "title": "✅ Module Enabled!",
+        "verb": "is now enabled!",
+        "color": Colors.SUCCESS,
+        "core": "Core features are always enabled!",
+        "schedule": (
+            "✅ Schedule Announcement On",
+            "Week matchups (bye week + games) will be sent when the timer starts or advances.",
+        ),
+    },
+    "disable": {
+        "method": "disable_module",
+        "enabled": False,
+        "title": "❌ Module Disabled",
+        "verb": "is now disabled.",
+        "color": Colors.WARNING,
+        "core": "Can't disable core features!",
+        "schedule": (
+            "❌ Schedule Announcement Off",
+            "Week matchups will no longer be sent when the timer starts or advances.",
+        ),
+    },
+}
+
+# Slash command choice lists, built once at import
+_CONFIG_ACTION_CHOICES = [
+    app_commands.Choice(name="view", value="view"),
+    app_commands.Choice(name="enable", value="enable"),
+    app_commands.Choice(name="disable", value="disable"),
+    app_commands.Choice(name="enable_all - Turn on all modules", value="enable_all"),
+    app_commands.Choice(name="disable_all - Turn off all modules", value="disable_all"),
+]
+
+_CONFIG_MODULE_CHOICES = [
+    app_commands.Choice(name="ai_chat - /harry, /ask, @mentions", value="ai_chat"),
+    app_commands.Choice(name="cfb_data - Player lookup, rankings", value="cfb_data"),
+    app_commands.Choice(name="league - Timer, charter, rules", value="league"),
+    app_commands.Choice(name="hs_stats - High school stats", value="hs_stats"),
+    app_commands.Choice(name="recruiting - On3/247 rankings", value="recruiting"),
+    app_commands.Choice(name="fun_games - Rivalry responses (Fuck Oregon!)", value="fun_games"),
+    app_commands.Choice(name="schedule_announcement - Week matchups when timer starts", value="schedule_announcement"),
+]
+
+_CHANNELS_ACTION_CHOICES = [
+    app_commands.Choice(name="view - Show current channel status", value="view"),
+    app_commands.Choice(name="enable - Enable Harry in this channel", value="enable"),
+    app_commands.Choice(name="disable - Disable Harry in this channel", value="disable"),
+    app_commands.Choice(name="toggle_rivalry - Toggle rivalry auto-responses", value="toggle_rivalry"),
+]
+
+_ZYTE_VIEW_CHOICES = [
+    app_commands.Choice(name="📊 Bot Tracked (This Session)", value="local"),
+    app_commands.Choice(name="🌐 Zyte API (Official - Last 30 Days)", value="api"),
+    app_commands.Choice(name="📋 Both (Side by Side)", value="both"),
+]
+
+_AI_VIEW_CHOICES = [
+    app_commands.Choice(name="📊 Bot Tracked (All Time)", value="local"),
+    app_commands.Choice(name="🌐 OpenAI API (Official - Today Only)", value="api"),
+    app_commands.Choice(name="📋 Both (Side by Side)", value="both"),
+]
+
+_CACHE_ACTION_CHOICES = [
+    app_commands.Choice(name="📊 View Stats", value="stats"),
+    app_commands.Choice(name="🗑️ Clear Recruiting Cache", value="clear_recruiting"),
+    app_commands.Choice(name="🗑️ Clear All Cache", value="clear_all"),
+]
+
+_BUDGET_ACTION_CHOICES = [
+    app_commands.Choice(name="View (current)", value="view"),
+    app_commands.Choice(name="Reconcile from Zyte & OpenAI", value="reconcile"),
+]
+
+_DIGEST_ACTION_CHOICES = [
+    app_commands.Choice(name="📊 View Now", value="view"),
+    app_commands.Choice(name="📧 Send to All Admins", value="send"),
+]
+
+# Frequent error replies, shared rather than rebuilt per call
+_ONLY_ADMIN_TEXT = "❌ Only admins can do that!"
+_NO_ADMIN_MANAGER_TEXT = "❌ Admin manager not available"
+_NO_CHANNEL_MANAGER_TEXT = "❌ Channel manager not available"
+
+# How long a fetched discord.User stays cached for /admin list
+USER_CACHE_TTL = 600  # 10 minutes
+
+# External usage dashboards change slowly - reuse their responses briefly.
+# Stored in the shared SimpleCache, so /admin cache clear_all also forces a refresh.
+USAGE_CACHE_NAMESPACE = 'admin_usage'
+ZYTE_STATS_TTL = 120
+OPENAI_USAGE_TTL = 300
+
+# Minimum gap between outbound usage/cost API calls per guild
+ADMIN_API_COOLDOWN = 30
+
+# How long an admin check result is reused, and how many are kept
+ADMIN_CHECK_TTL = 30
+ADMIN_CHECK_CACHE_SIZE = 256
+
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# Budget status lookups indexed by whole percent (0-100) / tenths filled (0-10)
+_BUDGET_EMOJI = ("🟢",) * 50 + ("🟡",) * 30 + ("🔴",) * 21
+_PROGRESS_BARS = tuple(f"[{'█' * i}{'░' * (10 - i)}]" for i in range(11))
+
+
+def _budget_emoji(percent: float) -> str:
+    """🟢 under 50%, 🟡 under 80%, 🔴 otherwise"""
+    return _BUDGET_EMOJI[min(max(int(percent), 0), 100)]
+
+
+def _progress_bar(percent: float) -> str:
+    """10-segment text progress bar"""
+    return _PROGRESS_BARS[min(max(int(percent / 10), 0), 10)]
+
+
+def _budget_summary(status: Dict, kind: str) -> str:
+    """Spent / budget / percent / remaining lines for one budget ('ai', 'zyte' or 'total')"""
+    return (f"**${status['costs'][kind]:.4f}** / ${status['budgets'][kind]:.2f}\n"
+            f"**{status['percentages'][kind]:.1f}%** used • ${status['remaining'][kind]:.2f} left")
+
+
+def _build_embed(title: str, description: Optional[str], color: int, fields, footer: Optional[str] = None) -> discord.Embed:
+    """Build an embed in one shot from (name, value, inline) field tuples"""
+    payload = {
+        "title": title,
+        "description": description,
+        "color": color,
+        "fields": [{"name": name, "value": value, "inline": inline} for name, value, inline in fields],
+    }
+    if footer:
+        payload["footer"] = {"text": footer}
+    return discord.Embed.from_dict(payload)
+
+
+# Setup/unavailable replies never change - build them once and share them
+_ZYTE_NOT_CONFIGURED_EMBED = _build_embed(
+    "⚠️ Zyte Not Configured",
+    "Zyte API is not currently configured.",
+    Colors.WARNING,
+    [("⚠️ Setup Required", "Add `ZYTE_API_KEY` to environment variables first.", False)]
+)
+_ZYTE_STATS_UNAVAILABLE_EMBED = _build_embed(
+    "⚠️ Zyte Stats API Unavailable",
+    "Could not retrieve data from Zyte Stats API.",
+    Colors.WARNING,
+    [
+        ("📝 Setup Required",
+         "To enable official Zyte stats:\n"
+         "1. Get your **Dashboard API Key** (different from regular API key!)\n"
+         "   Go to: https://app.zyte.com/o/YOUR_ORG_ID/settings/apikeys\n"
+         "2. Add `ZYTE_DASHBOARD_API_KEY` to environment variables\n"
+         "3. Add `ZYTE_ORG_ID` from your dashboard URL\n"
+         "   (e.g., if URL is `app.zyte.com/o/123456`, use `123456`)", False),
+        ("💡 Alternative", "Use 'Bot Tracked' view or check your [Zyte Dashboard](https://app.zyte.com)", False),
+    ]
+)
+_AI_NOT_AVAILABLE_EMBED = _build_embed(
+    "ℹ️ AI Not Available",
+    "AI integration is not currently configured.",
+    Colors.WARNING,
+    [("⚠️ Setup Required",
+      "Add `OPENAI_API_KEY` or `ANTHROPIC_API_KEY` to environment variables to enable AI features.", False)]
+)
+_OPENAI_USAGE_UNAVAILABLE_EMBED = _build_embed(
+    "⚠️ API Data Unavailable",
+    "Could not retrieve data from OpenAI Usage API. This may be due to:\n"
+    "- API endpoint not available yet\n"
+    "- Account permissions\n"
+    "- Network issues\n"
+    "- No usage data for today",
+    Colors.WARNING,
+    [("💡 Alternative",
+      "Try the 'Bot Tracked' view or check your [OpenAI Dashboard](https://platform.openai.com/usage) for historical data",
+      False)]
+)
+
+
+def deferred_admin(func):
+    """
+    Defer the interaction (ephemeral) before running the command body.
+
+    Admin commands touch storage and Discord APIs before replying, which can
+    blow past the 3-second ACK window. Deferring first buys 15 minutes, so
+    every reply in a wrapped command must go through interaction.followup.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+        await interaction.response.defer(ephemeral=True)
+        return await func(self, interaction, *args, **kwargs)
+    return wrapper
+
+
+def require_admin(allow_guild_admins: bool = True, message: str = _ONLY_ADMIN_TEXT):
+    """
+    Only run the command body for admins; everyone else gets an ephemeral denial.
+
+    Args:
+        allow_guild_admins: Let Discord Administrators through even when no
+            admin manager is configured
+        message: Denial text sent to non-admins
+
+    Apply below @deferred_admin - the denial is sent as a followup.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            if not self._has_admin(interaction, allow_guild_admins):
+                await interaction.followup.send(message, ephemeral=True)
+                return
+            return await func(self, interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 class AdminCog(commands.Cog):
     """Administrative commands"""
@@ -39,8 +311,20 @@ class AdminCog(commands.Cog):
         self.admin_manager = None
         self.channel_manager = None
         self.timekeeper_manager = None
+        # user_id -> (fetched_at, discord.User), see _fetch_user_cached
+        self._user_cache: Dict[int, Tuple[float, discord.User]] = {}
+        # guild_id -> (cache key, rendered embed) for /admin config view
+        self._view_embed_cache: Dict[int, Tuple[tuple, discord.Embed]] = {}
+        # (user_id, guild_id, allow_guild_admins) -> (checked_at, admin_manager.version, result)
+        self._admin_check_cache: "OrderedDict[Tuple[int, int, bool], Tuple[float, int, bool]]" = OrderedDict()
+        # (api name, guild_id) -> monotonic time of the last outbound call, see _api_cooldown
+        self._rate_limits: Dict[Tuple[str, int], float] = {}
         logger.info("🔧 AdminCog initialized")
 
+    async def cog_unload(self):
+        """Persist any config changes still waiting on the debounced writer"""
+        await server_config.flush()
+
     def set_dependencies(self, admin_manager=None, channel_manager=None, timekeeper_manager=None, ai_assistant=None, schedule_manager=None):
         """Set dependencies after bot is ready"""
         self.admin_manager = admin_manager
@@ -51,10 +335,84 @@ class AdminCog(commands.Cog):
         if ai_assistant:
             self.bot.ai_assistant = ai_assistant
 
+    def _has_admin(self, interaction: discord.Interaction, allow_guild_admins: bool = True) -> bool:
+        """Check whether the invoking user may run admin commands (cached for ADMIN_CHECK_TTL)"""
+        key = (interaction.user.id, interaction.guild.id, allow_guild_admins)
+        now = time.monotonic()
+        version = self.admin_manager.version if self.admin_manager else 0
+        cached = self._admin_check_cache.get(key)
+        if cached and cached[1] == version and now - cached[0] < ADMIN_CHECK_TTL:
+            return cached[2]
+
+        result = False
+        if allow_guild_admins:
+            perms = getattr(interaction.user, 'guild_permissions', None)
+            result = perms is not None and perms.administrator
+        if not result:
+            result = self.admin_manager is not None and self.admin_manager.is_admin(interaction.user, interaction)
+
+        self._admin_check_cache[key] = (now, version, result)
+        self._admin_check_cache.move_to_end(key)
+        # Drop the least recently checked users rather than flushing everyone at once
+        while len(self._admin_check_cache) > ADMIN_CHECK_CACHE_SIZE:
+            self._admin_check_cache.popitem(last=False)
+        return result
+
+    async def _fetch_user_cached(self, user_id: int) -> discord.User:
+        """Resolve a user from the client cache, our TTL cache, or the API (in that order)"""
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+
+        cached = self._user_cache.get(user_id)
+        now = time.monotonic()
+        if cached and now - cached[0] < USER_CACHE_TTL:
+            return cached[1]
+
+        user = await self.bot.fetch_user(user_id)
+        self._user_cache[user_id] = (now, user)
+        return user
+
+    def _api_cooldown(self, name: str, guild_id: int) -> float:
+        """
+        Seconds left before this guild may call the named external API again.
+
+        Returns 0 (and starts a new cooldown) when the call is allowed.
+        """
+        key = (name, guild_id)
+        now = time.monotonic()
+        remaining = ADMIN_API_COOLDOWN - (now - self._rate_limits.get(key, float('-inf')))
+        if remaining > 0:
+            return remaining
+        self._rate_limits[key] = now
+        return 0
+
+    async def _cached_usage(self, key: str, ttl: int, fetch, guild_id: int) -> Tuple[Optional[dict], float]:
+        """
+        Return (usage API payload, cooldown seconds left), awaiting fetch() on a miss.
+
+        Failures aren't cached, so a miss is also rate limited per guild. While
+        cooling down the payload is None and the wait is non-zero, so callers can
+        tell "try again shortly" apart from a failed or unconfigured fetch.
+        """
+        cache = get_cache()
+        data = cache.get(key, namespace=USAGE_CACHE_NAMESPACE)
+        if data is None:
+            wait = self._api_cooldown(key, guild_id)
+            if wait:
+                logger.info(f"⏳ Skipping {key} usage fetch for guild {guild_id} (cooldown)")
+                return None, wait
+            data = await fetch()
+            if data:
+                cache.set(key, data, ttl_seconds=ttl, namespace=USAGE_CACHE_NAMESPACE)
+        return data, 0
+
     # Command group
+    # Guild-only: Discord never delivers these from DMs, so interaction.guild is always set
     admin_group = app_commands.Group(
         name="admin",
-        description="🔧 Admin commands for managing Harry"
+        description="🔧 Admin commands for managing Harry",
+        guild_only=True
     )
 
     @admin_group.command(name="set_channel", description="Set the channel for admin outputs")
@@ -62,6 +420,8 @@ class AdminCog(commands.Cog):
         channel="Select a channel",
         channel_id="Or paste a channel ID"
     )
+    @deferred_admin
+    @require_admin(allow_guild_admins=False, message="❌ Only admins can set the admin channel!")
     async def set_channel(
         self,
         interaction: discord.Interaction,
@@ -69,32 +429,32 @@ class AdminCog(commands.Cog):
         channel_id: Optional[str] = None
     ):
         """Set the admin notification channel"""
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Only admins can set the admin channel!", ephemeral=True)
-            return
-
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
         if channel:
             target_channel_id = channel.id
             channel_name = f"#{channel.name}"
         elif channel_id:
             try:
                 target_channel_id = int(channel_id.strip())
-                fetched = interaction.guild.get_channel(target_channel_id)
-                channel_name = f"#{fetched.name}" if fetched else f"<#{target_channel_id}>"
             except ValueError:
-                await interaction.response.send_message("❌ Invalid channel ID!", ephemeral=True)
+                await interaction.followup.send("❌ Invalid channel ID!", ephemeral=True)
                 return
+
+            # Reject IDs that aren't a channel in this server rather than saving an unusable ID
+            fetched = interaction.guild.get_channel(target_channel_id)
+            if fetched is None:
+                try:
+                    fetched = await interaction.guild.fetch_channel(target_channel_id)
+                except (discord.NotFound, discord.Forbidden, discord.InvalidData):
+                    await interaction.followup.send("❌ No channel with that ID in this server!", ephemeral=True)
+                    return
+            channel_name = f"#{fetched.name}"
         else:
-            await interaction.response.send_message("❌ Provide a channel or channel_id!", ephemeral=True)
+            await interaction.followup.send("❌ Provide a channel or channel_id!", ephemeral=True)
             return
 
         guild_id = interaction.guild.id
         server_config.set_admin_channel(guild_id, target_channel_id)
-        await server_config.save_to_discord()
+        server_config.mark_dirty(guild_id)
 
         embed = discord.Embed(
             title="🔧 Admin Channel Set!",
@@ -102,69 +462,44 @@ class AdminCog(commands.Cog):
             color=Colors.SUCCESS
         )
         embed.set_footer(text=Footers.CONFIG)
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="add", description="Add a user as bot admin")
     @app_commands.describe(user="The user to make a bot admin")
+    @deferred_admin
+    @require_admin(allow_guild_admins=False, message="❌ You need to be a bot admin!")
     async def add(self, interaction: discord.Interaction, user: discord.Member):
         """Add a bot admin"""
-        if not self.admin_manager:
-            await interaction.response.send_message("❌ Admin manager not available", ephemeral=True)
-            return
-
-        if not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ You need to be a bot admin!", ephemeral=True)
-            return
-
         success = self.admin_manager.add_admin(user.id)
 
-        if success:
-            embed = discord.Embed(
-                title="✅ Bot Admin Added!",
-                description=f"**{user.display_name}** is now a bot admin!",
-                color=Colors.SUCCESS
-            )
-        else:
-            embed = discord.Embed(
-                title="ℹ️ Already an Admin",
-                description=f"{user.display_name} is already a bot admin!",
-                color=Colors.WARNING
-            )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        title, description, color = (
+            ("✅ Bot Admin Added!", f"**{user.display_name}** is now a bot admin!", Colors.SUCCESS) if success
+            else ("ℹ️ Already an Admin", f"{user.display_name} is already a bot admin!", Colors.WARNING)
+        )
+        embed = discord.Embed(title=title, description=description, color=color)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="remove", description="Remove a user as bot admin")
     @app_commands.describe(user="The user to remove as bot admin")
+    @deferred_admin
+    @require_admin(allow_guild_admins=False, message="❌ You need to be a bot admin!")
     async def remove(self, interaction: discord.Interaction, user: discord.Member):
         """Remove a bot admin"""
-        if not self.admin_manager:
-            await interaction.response.send_message("❌ Admin manager not available", ephemeral=True)
-            return
-
-        if not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ You need to be a bot admin!", ephemeral=True)
-            return
-
         success = self.admin_manager.remove_admin(user.id)
 
-        if success:
-            embed = discord.Embed(
-                title="✅ Bot Admin Removed",
-                description=f"**{user.display_name}** is no longer a bot admin.",
-                color=Colors.ERROR
-            )
-        else:
-            embed = discord.Embed(
-                title="ℹ️ Not an Admin",
-                description=f"{user.display_name} isn't a bot admin!",
-                color=0x808080
-            )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        title, description, color = (
+            ("✅ Bot Admin Removed", f"**{user.display_name}** is no longer a bot admin.", Colors.ERROR) if success
+            else ("ℹ️ Not an Admin", f"{user.display_name} isn't a bot admin!", 0x808080)
+        )
+        embed = discord.Embed(title=title, description=description, color=color)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="list", description="List all bot admins")
+    @deferred_admin
     async def list_admins(self, interaction: discord.Interaction):
         """List all bot admins"""
         if not self.admin_manager:
-            await interaction.response.send_message("❌ Admin manager not available", ephemeral=True)
+            await interaction.followup.send(_NO_ADMIN_MANAGER_TEXT, ephemeral=True)
             return
 
         admin_ids = self.admin_manager.get_admin_list()
@@ -176,13 +511,16 @@ class AdminCog(commands.Cog):
                 color=0x808080
             )
         else:
-            admin_info = []
-            for aid in admin_ids:
-                try:
-                    user = await self.bot.fetch_user(aid)
-                    admin_info.append(f"• **{user.display_name}** (`{user.name}`)")
-                except Exception:
-                    admin_info.append(f"• User ID: {aid}")
+            # Fetch all admins concurrently - failures come back as exceptions
+            users = await asyncio.gather(
+                *(self._fetch_user_cached(aid) for aid in admin_ids),
+                return_exceptions=True
+            )
+            admin_info = [
+                f"• User ID: {aid}" if isinstance(user, Exception)
+                else f"• **{user.display_name}** (`{user.name}`)"
+                for aid, user in zip(admin_ids, users)
+            ]
 
             embed = discord.Embed(
                 title="🔐 Bot Admins",
@@ -190,69 +528,52 @@ class AdminCog(commands.Cog):
                 color=Colors.SUCCESS
             )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="block", description="Block unprompted responses in a channel")
     @app_commands.describe(channel="The channel to block")
+    @deferred_admin
+    @require_admin(allow_guild_admins=False, message="❌ Only admins can block channels!")
     async def block(self, interaction: discord.Interaction, channel: discord.TextChannel):
         """Block unprompted responses"""
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Only admins can block channels!", ephemeral=True)
-            return
-
         if not self.channel_manager:
-            await interaction.response.send_message("❌ Channel manager not available", ephemeral=True)
+            await interaction.followup.send(_NO_CHANNEL_MANAGER_TEXT, ephemeral=True)
             return
 
         was_blocked = self.channel_manager.block_channel(channel.id)
 
-        if was_blocked:
-            embed = discord.Embed(
-                title="🔇 Channel Blocked!",
-                description=f"I won't make unprompted responses in {channel.mention}.\n\n**@mentions still work!**",
-                color=Colors.WARNING
-            )
-        else:
-            embed = discord.Embed(
-                title="ℹ️ Already Blocked",
-                description=f"{channel.mention} is already blocked!",
-                color=0x808080
-            )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        title, description, color = (
+            ("🔇 Channel Blocked!", f"I won't make unprompted responses in {channel.mention}.\n\n**@mentions still work!**", Colors.WARNING) if was_blocked
+            else ("ℹ️ Already Blocked", f"{channel.mention} is already blocked!", 0x808080)
+        )
+        embed = discord.Embed(title=title, description=description, color=color)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="unblock", description="Allow unprompted responses in a channel")
     @app_commands.describe(channel="The channel to unblock")
+    @deferred_admin
+    @require_admin(allow_guild_admins=False, message="❌ Only admins can unblock channels!")
     async def unblock(self, interaction: discord.Interaction, channel: discord.TextChannel):
         """Allow unprompted responses"""
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Only admins can unblock channels!", ephemeral=True)
-            return
-
         if not self.channel_manager:
-            await interaction.response.send_message("❌ Channel manager not available", ephemeral=True)
+            await interaction.followup.send(_NO_CHANNEL_MANAGER_TEXT, ephemeral=True)
             return
 
         was_unblocked = self.channel_manager.unblock_channel(channel.id)
 
-        if was_unblocked:
-            embed = discord.Embed(
-                title="🔊 Channel Unblocked!",
-                description=f"I can respond in {channel.mention} again!",
-                color=Colors.SUCCESS
-            )
-        else:
-            embed = discord.Embed(
-                title="ℹ️ Not Blocked",
-                description=f"{channel.mention} wasn't blocked!",
-                color=0x808080
-            )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        title, description, color = (
+            ("🔊 Channel Unblocked!", f"I can respond in {channel.mention} again!", Colors.SUCCESS) if was_unblocked
+            else ("ℹ️ Not Blocked", f"{channel.mention} wasn't blocked!", 0x808080)
+        )
+        embed = discord.Embed(title=title, description=description, color=color)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="blocked", description="Show all blocked channels")
+    @deferred_admin
     async def blocked(self, interaction: discord.Interaction):
         """Show all blocked channels"""
         if not self.channel_manager:
-            await interaction.response.send_message("❌ Channel manager not available", ephemeral=True)
+            await interaction.followup.send(_NO_CHANNEL_MANAGER_TEXT, ephemeral=True)
             return
 
         blocked_ids = self.channel_manager.get_blocked_channels()
@@ -264,13 +585,10 @@ class AdminCog(commands.Cog):
                 color=Colors.SUCCESS
             )
         else:
-            channel_info = []
-            for cid in blocked_ids:
-                ch = self.bot.get_channel(cid)
-                if ch:
-                    channel_info.append(f"• {ch.mention}")
-                else:
-                    channel_info.append(f"• Channel ID: {cid}")
+            channel_info = [
+                f"• {ch.mention}" if (ch := self.bot.get_channel(cid)) else f"• Channel ID: {cid}"
+                for cid in blocked_ids
+            ]
 
             embed = discord.Embed(
                 title="🔇 Blocked Channels",
@@ -278,29 +596,15 @@ class AdminCog(commands.Cog):
                 color=Colors.WARNING
             )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="config", description="Configure Harry's features for this server")
     @app_commands.describe(
         action="What to do: view, enable, disable, or bulk actions",
         module="Which module to toggle (not needed for enable_all/disable_all)"
     )
-    @app_commands.choices(action=[
-        app_commands.Choice(name="view", value="view"),
-        app_commands.Choice(name="enable", value="enable"),
-        app_commands.Choice(name="disable", value="disable"),
-        app_commands.Choice(name="enable_all - Turn on all modules", value="enable_all"),
-        app_commands.Choice(name="disable_all - Turn off all modules", value="disable_all"),
-    ])
-    @app_commands.choices(module=[
-        app_commands.Choice(name="ai_chat - /harry, /ask, @mentions", value="ai_chat"),
-        app_commands.Choice(name="cfb_data - Player lookup, rankings", value="cfb_data"),
-        app_commands.Choice(name="league - Timer, charter, rules", value="league"),
-        app_commands.Choice(name="hs_stats - High school stats", value="hs_stats"),
-        app_commands.Choice(name="recruiting - On3/247 rankings", value="recruiting"),
-        app_commands.Choice(name="fun_games - Rivalry responses (Fuck Oregon!)", value="fun_games"),
-        app_commands.Choice(name="schedule_announcement - Week matchups when timer starts", value="schedule_announcement"),
-    ])
+    @app_commands.choices(action=_CONFIG_ACTION_CHOICES, module=_CONFIG_MODULE_CHOICES)
+    @deferred_admin
     async def config(
         self,
         interaction: discord.Interaction,
@@ -308,253 +612,168 @@ class AdminCog(commands.Cog):
         module: Optional[str] = None
     ):
         """Configure which features are enabled"""
-        # Defer IMMEDIATELY to prevent timeout (building the embed is slow)
-        if action == "view":
-            await interaction.response.defer(ephemeral=True)
-
-        if not interaction.guild:
-            if action == "view":
-                await interaction.followup.send("❌ This only works in servers!", ephemeral=True)
-            else:
-                await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
         guild_id = interaction.guild.id
 
         if action in ["enable", "disable", "enable_all", "disable_all"]:
-            is_admin = (
-                interaction.user.guild_permissions.administrator or
-                (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-            )
-            if not is_admin:
-                await interaction.response.send_message("❌ Only admins can change settings!", ephemeral=True)
+            if not self._has_admin(interaction):
+                await interaction.followup.send("❌ Only admins can change settings!", ephemeral=True)
                 return
 
         if action == "view":
-            enabled = server_config.get_enabled_modules(guild_id)
-
-            embed = discord.Embed(
-                title="⚙️ Harry's Configuration",
-                description=f"Settings for **{interaction.guild.name}**",
-                color=Colors.PRIMARY
+            # Live values that aren't part of server_config - fold them into the cache key
+            timekeeper_manager = self.timekeeper_manager
+            admin_manager = self.admin_manager
+            channel_manager = self.channel_manager
+
+            season_info = timekeeper_manager.get_season_week() if timekeeper_manager else None
+            if not (season_info and season_info.get('season')):
+                season_info = None
+            admin_count = admin_manager.get_admin_count() if admin_manager else None
+            blocked_count = channel_manager.get_blocked_count() if channel_manager else 0
+
+            cache_key = (
+                server_config.version(guild_id),
+                interaction.guild.name,
+                season_info and (season_info['season'], season_info.get('week'), season_info.get('week_name')),
+                admin_count,
+                blocked_count,
             )
+            cached = self._view_embed_cache.get(guild_id)
+            if cached and cached[0] == cache_key:
+                await interaction.followup.send(embed=cached[1], ephemeral=True)
+                return
 
-            # Module statuses
-            for mod in FeatureModule:
-                is_enabled = mod.value in enabled
-                status = "✅ Enabled" if is_enabled else "❌ Disabled"
-                if mod == FeatureModule.CORE:
-                    status = "✅ Always On"
+            enabled = server_config.get_enabled_modules(guild_id)
 
-                desc = server_config.get_module_description(mod)
-                embed.add_field(name=f"{desc}", value=f"**Status:** {status}", inline=False)
+            # Module statuses
+            fields = [
+                (
+                    server_config.get_module_description(mod),
+                    "**Status:** ✅ Always On" if mod == FeatureModule.CORE
+                    else f"**Status:** {'✅ Enabled' if mod.value in enabled else '❌ Disabled'}",
+                    False
+                )
+                for mod in FeatureModule
+            ]
 
             # Server settings section
-            embed.add_field(name="━━━━━━━━━━━━━━━", value="", inline=False)  # Divider
+            fields.append(("━━━━━━━━━━━━━━━", "", False))  # Divider
 
             # Recruiting source
             rec_source = server_config.get_recruiting_source(guild_id)
             rec_name = "On3/Rivals" if rec_source == "on3" else "247Sports"
-            embed.add_field(
-                name="⭐ Recruiting Data Source",
-                value=f"**Source:** {rec_name}",
-                inline=True
-            )
+            fields.append(("⭐ Recruiting Data Source", f"**Source:** {rec_name}", True))
 
             # Schedule announcement (week matchups when timer starts/advances)
             sched_on = server_config.get_setting(guild_id, "schedule_announcement", True)
-            embed.add_field(
-                name="📅 Schedule Announcement",
-                value=f"**Week matchups:** {'✅ On' if sched_on else '❌ Off'}\n(Toggle with enable/disable this module)",
-                inline=True
-            )
+            fields.append((
+                "📅 Schedule Announcement",
+                f"**Week matchups:** {'✅ On' if sched_on else '❌ Off'}\n(Toggle with enable/disable this module)",
+                True
+            ))
 
             # Season/Week info (if timekeeper available)
-            if self.timekeeper_manager:
-                season_info = self.timekeeper_manager.get_season_week()
-                if season_info and season_info.get('season'):
-                    week_name = season_info.get('week_name', f"Week {season_info.get('week', '?')}")
-                    embed.add_field(
-                        name="🏈 Current Season",
-                        value=f"**S{season_info['season']}{week_name}**",
-                        inline=True
-                    )
+            if season_info:
+                week_name = season_info.get('week_name', f"Week {season_info.get('week', '?')}")
+                fields.append(("🏈 Current Season", f"**S{season_info['season']}{week_name}**", True))
 
             # Bot admins count
-            if self.admin_manager:
-                admin_count = self.admin_manager.get_admin_count()
-                embed.add_field(
-                    name="🔧 Bot Admins",
-                    value=f"**{admin_count}** configured\nUse `/admin list` to view",
-                    inline=True
-                )
+            if admin_count is not None:
+                fields.append(("🔧 Bot Admins", f"**{admin_count}** configured\nUse `/admin list` to view", True))
 
             # Blocked channels (global, not per-guild)
-            if self.channel_manager:
-                blocked_count = self.channel_manager.get_blocked_count()
-                if blocked_count > 0:
-                    embed.add_field(
-                        name="🚫 Blocked Channels",
-                        value=f"**{blocked_count}** blocked (global)\nUse `/admin blocked` to view",
-                        inline=True
-                    )
-
-            embed.add_field(
-                name="ℹ️ More Commands",
-                value="`/admin list` - View admins\n"
-                      "`/admin blocked` - View blocked channels\n"
-                      "`/recruiting source` - Change recruiting source\n"
-                      "`/league week` - View current season/week",
-                inline=False
-            )
-
-            embed.set_footer(text=Footers.CONFIG)
-            await interaction.followup.send(embed=embed, ephemeral=True)
-
-        elif action == "enable":
-            if not module:
-                await interaction.response.send_message("❌ Specify a module to enable!", ephemeral=True)
-                return
-
-            if module == "schedule_announcement":
-                server_config.set_setting(guild_id, "schedule_announcement", True)
-                await server_config.save_to_discord()
-                embed = discord.Embed(
-                    title="✅ Schedule Announcement On",
-                    description="Week matchups (bye week + games) will be sent when the timer starts or advances.",
-                    color=Colors.SUCCESS
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-
-            try:
-                mod = FeatureModule(module)
-            except ValueError:
-                await interaction.response.send_message(f"❌ Unknown module: {module}", ephemeral=True)
-                return
+            if blocked_count > 0:
+                fields.append((
+                    "🚫 Blocked Channels",
+                    f"**{blocked_count}** blocked (global)\nUse `/admin blocked` to view",
+                    True
+                ))
 
-            if mod == FeatureModule.CORE:
-                await interaction.response.send_message("Core features are always enabled!", ephemeral=True)
-                return
-
-            server_config.enable_module(guild_id, mod)
-            await server_config.save_to_discord()
+            fields.append(("ℹ️ More Commands", _MORE_COMMANDS_VALUE, False))
 
             embed = discord.Embed(
-                title="✅ Module Enabled!",
-                description=f"**{mod.value.upper()}** is now enabled!",
-                color=Colors.SUCCESS
+                title="⚙️ Harry's Configuration",
+                description=f"Settings for **{interaction.guild.name}**",
+                color=Colors.PRIMARY
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            for name, value, inline in fields:
+                embed.add_field(name=name, value=value, inline=inline)
+            embed.set_footer(text=Footers.CONFIG)
 
-        elif action == "disable":
+            self._view_embed_cache[guild_id] = (cache_key, embed)
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+        elif action in _MODULE_ACTIONS:
+            spec = _MODULE_ACTIONS[action]
             if not module:
-                await interaction.response.send_message("❌ Specify a module to disable!", ephemeral=True)
+                await interaction.followup.send(f"❌ Specify a module to {action}!", ephemeral=True)
                 return
 
             if module == "schedule_announcement":
-                server_config.set_setting(guild_id, "schedule_announcement", False)
-                await server_config.save_to_discord()
-                embed = discord.Embed(
-                    title="❌ Schedule Announcement Off",
-                    description="Week matchups will no longer be sent when the timer starts or advances.",
-                    color=Colors.WARNING
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                server_config.set_setting(guild_id, "schedule_announcement", spec["enabled"])
+                server_config.mark_dirty(guild_id)
+                title, description = spec["schedule"]
+                embed = discord.Embed(title=title, description=description, color=spec["color"])
+                await interaction.followup.send(embed=embed, ephemeral=True)
                 return
 
-            try:
-                mod = FeatureModule(module)
-            except ValueError:
-                await interaction.response.send_message(f"❌ Unknown module: {module}", ephemeral=True)
+            mod = _MODULE_BY_VALUE.get(module)
+            if mod is None:
+                await interaction.followup.send(f"❌ Unknown module: {module}", ephemeral=True)
                 return
 
-            if mod == FeatureModule.CORE:
-                await interaction.response.send_message("Can't disable core features!", ephemeral=True)
+            if mod is FeatureModule.CORE:
+                await interaction.followup.send(spec["core"], ephemeral=True)
                 return
 
-            server_config.disable_module(guild_id, mod)
-            await server_config.save_to_discord()
+            getattr(server_config, spec["method"])(guild_id, mod)
+            server_config.mark_dirty(guild_id)
 
             embed = discord.Embed(
-                title="❌ Module Disabled",
-                description=f"**{mod.value.upper()}** is now disabled.",
-                color=Colors.WARNING
+                title=spec["title"],
+                description=f"**{mod.value.upper()}** {spec['verb']}",
+                color=spec["color"]
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
         elif action == "enable_all":
             # Enable all modules except CORE (which is always on)
-            enabled_count = 0
-            for mod in FeatureModule:
-                if mod != FeatureModule.CORE:
-                    server_config.enable_module(guild_id, mod)
-                    enabled_count += 1
-
-            await server_config.save_to_discord()
+            server_config.set_enabled_modules(guild_id, _ALL_NON_CORE)
+            server_config.mark_dirty(guild_id)
 
             embed = discord.Embed(
                 title="✅ All Modules Enabled!",
-                description=f"Enabled **{enabled_count}** modules:\n"
-                           f"• AI Chat\n"
-                           f"• CFB Data\n"
-                           f"• League\n"
-                           f"• HS Stats\n"
-                           f"• Recruiting\n"
-                           f"• Fun & Games",
+                description=_ENABLE_ALL_DESC,
                 color=Colors.SUCCESS
             )
-            embed.set_footer(text="Use /admin config view to see full status")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            embed.set_footer(text=_CONFIG_VIEW_HINT)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
         elif action == "disable_all":
             # Disable all modules except CORE (which can't be disabled)
-            disabled_count = 0
-            for mod in FeatureModule:
-                if mod != FeatureModule.CORE:
-                    server_config.disable_module(guild_id, mod)
-                    disabled_count += 1
-
-            await server_config.save_to_discord()
+            server_config.set_enabled_modules(guild_id, {FeatureModule.CORE})
+            server_config.mark_dirty(guild_id)
 
             embed = discord.Embed(
                 title="❌ All Modules Disabled",
-                description=f"Disabled **{disabled_count}** modules.\n\n"
-                           f"✅ **CORE** remains active (/help, /whats_new, etc.)\n\n"
-                           f"Use `/admin config enable_all` to restore.",
+                description=_DISABLE_ALL_DESC,
                 color=Colors.WARNING
             )
-            embed.set_footer(text="Use /admin config view to see full status")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            embed.set_footer(text=_CONFIG_VIEW_HINT)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="sync", description="Force sync slash commands")
+    @deferred_admin
+    @require_admin(message="❌ Only admins can sync commands!")
     async def sync_commands(self, interaction: discord.Interaction):
         """Force sync slash commands"""
-        is_admin = (
-            interaction.user.guild_permissions.administrator or
-            (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-        )
-        if not is_admin:
-            await interaction.response.send_message("❌ Only admins can sync commands!", ephemeral=True)
-            return
-
-        await interaction.response.defer(ephemeral=True)
-
         try:
-            if interaction.guild:
-                synced = await self.bot.tree.sync(guild=interaction.guild)
-                embed = discord.Embed(
-                    title="✅ Commands Synced!",
-                    description=f"Synced **{len(synced)}** command(s) to this server.",
-                    color=Colors.SUCCESS
-                )
-            else:
-                synced = await self.bot.tree.sync()
-                embed = discord.Embed(
-                    title="✅ Global Sync Complete!",
-                    description=f"Synced **{len(synced)}** command(s) globally.",
-                    color=Colors.SUCCESS
-                )
+            synced = await self.bot.tree.sync(guild=interaction.guild)
+            embed = discord.Embed(
+                title="✅ Commands Synced!",
+                description=f"Synced **{len(synced)}** command(s) to this server.",
+                color=Colors.SUCCESS
+            )
             await interaction.followup.send(embed=embed, ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"❌ Sync failed: {str(e)}", ephemeral=True)
@@ -564,12 +783,8 @@ class AdminCog(commands.Cog):
         action="What to do (leave empty to view)",
         channel="Which channel to configure"
     )
-    @app_commands.choices(action=[
-        app_commands.Choice(name="view - Show current channel status", value="view"),
-        app_commands.Choice(name="enable - Enable Harry in this channel", value="enable"),
-        app_commands.Choice(name="disable - Disable Harry in this channel", value="disable"),
-        app_commands.Choice(name="toggle_rivalry - Toggle rivalry auto-responses", value="toggle_rivalry"),
-    ])
+    @app_commands.choices(action=_CHANNELS_ACTION_CHOICES)
+    @deferred_admin
     async def channels(
         self,
         interaction: discord.Interaction,
@@ -577,16 +792,10 @@ class AdminCog(commands.Cog):
         channel: Optional[discord.TextChannel] = None
     ):
         """Manage channel whitelist"""
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
         guild_id = interaction.guild.id
         target_channel = channel or interaction.channel
 
         if action is None or action == "view":
-            await interaction.response.defer(ephemeral=True)
-
             enabled_channels = server_config.get_enabled_channels(guild_id)
             is_enabled = server_config.is_channel_enabled(guild_id, target_channel.id)
             rivalry_on = server_config.auto_responses_enabled(guild_id, target_channel.id)
@@ -603,14 +812,14 @@ class AdminCog(commands.Cog):
             )
 
             if enabled_channels:
-                ch_list = []
-                for cid in enabled_channels[:10]:
-                    ch = interaction.guild.get_channel(cid)
-                    if ch:
-                        ch_list.append(f"• #{ch.name}")
+                get_channel = interaction.guild.get_channel
+                ch_list = "\n".join(
+                    f"• #{ch.name}" for cid in enabled_channels[:10]
+                    if (ch := get_channel(cid)) is not None
+                )
                 embed.add_field(
                     name="Enabled Channels",
-                    value="\n".join(ch_list) if ch_list else "None",
+                    value=ch_list or _NO_CHANNELS_TEXT,
                     inline=False
                 )
 
@@ -618,17 +827,13 @@ class AdminCog(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=True)
 
         elif action in ["enable", "disable", "toggle_rivalry"]:
-            is_admin = (
-                interaction.user.guild_permissions.administrator or
-                (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-            )
-            if not is_admin:
-                await interaction.response.send_message("❌ Only admins can change channel settings!", ephemeral=True)
+            if not self._has_admin(interaction):
+                await interaction.followup.send("❌ Only admins can change channel settings!", ephemeral=True)
                 return
 
             if action == "enable":
                 server_config.enable_channel(guild_id, target_channel.id)
-                await server_config.save_to_discord()
+                server_config.mark_dirty(guild_id)
                 embed = discord.Embed(
                     title="✅ Channel Enabled!",
                     description=f"Harry is now enabled in **#{target_channel.name}**",
@@ -637,7 +842,7 @@ class AdminCog(commands.Cog):
 
             elif action == "disable":
                 server_config.disable_channel(guild_id, target_channel.id)
-                await server_config.save_to_discord()
+                server_config.mark_dirty(guild_id)
                 embed = discord.Embed(
                     title="❌ Channel Disabled",
                     description=f"Harry is now disabled in **#{target_channel.name}**",
@@ -647,7 +852,7 @@ class AdminCog(commands.Cog):
             elif action == "toggle_rivalry":
                 # Toggle rivalry auto-responses
                 is_on = server_config.toggle_auto_responses(guild_id, target_channel.id)
-                await server_config.save_to_discord()
+                server_config.mark_dirty(guild_id)
                 status = "ON 🦆" if is_on else "OFF"
                 embed = discord.Embed(
                     title=f"🏈 Rivalry Responses: {status}",
@@ -655,36 +860,18 @@ class AdminCog(commands.Cog):
                     color=Colors.SUCCESS if is_on else Colors.WARNING
                 )
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="zyte", description="Check Zyte API usage and estimated costs")
     @app_commands.describe(
         view="Choose which stats to view"
     )
-    @app_commands.choices(view=[
-        app_commands.Choice(name="📊 Bot Tracked (This Session)", value="local"),
-        app_commands.Choice(name="🌐 Zyte API (Official - Last 30 Days)", value="api"),
-        app_commands.Choice(name="📋 Both (Side by Side)", value="both")
-    ])
+    @app_commands.choices(view=_ZYTE_VIEW_CHOICES)
+    @deferred_admin
+    @require_admin(message="❌ Only admins can view Zyte usage!")
     async def zyte_usage(self, interaction: discord.Interaction, view: str = "local"):
         """Check Zyte API usage statistics"""
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
-        # Check if user is admin
-        is_admin = (
-            interaction.user.guild_permissions.administrator or
-            (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-        )
-        if not is_admin:
-            await interaction.response.send_message("❌ Only admins can view Zyte usage!", ephemeral=True)
-            return
-
-        await interaction.response.defer(ephemeral=True)
-
         # Get On3 scraper usage
-        from .recruiting import get_recruiting_scraper
         guild_id = interaction.guild.id
         scraper, source_name = get_recruiting_scraper(guild_id)
 
@@ -694,103 +881,49 @@ class AdminCog(commands.Cog):
 
             if view == "local":
                 # Show only bot-tracked stats
-                embed = discord.Embed(
-                    title="💰 Zyte Usage Report (Bot Tracked)",
-                    description=f"Stats tracked this session for **{interaction.guild.name}**",
-                    color=Colors.PRIMARY
-                )
-
-                # Availability
-                status = "✅ Available" if local_usage['is_available'] else "❌ Not configured"
-                embed.add_field(
-                    name="📡 Status",
-                    value=status,
-                    inline=False
-                )
-
                 if local_usage['is_available']:
-                    # Usage stats
-                    embed.add_field(
-                        name="📊 Requests This Session",
-                        value=f"**{local_usage['request_count']}** requests",
-                        inline=True
-                    )
-
-                    # Cost
-                    embed.add_field(
-                        name="💵 Estimated Cost",
-                        value=f"**${local_usage['estimated_cost']:.4f}**",
-                        inline=True
-                    )
-
-                    # Rate
-                    embed.add_field(
-                        name="💳 Rate",
-                        value=f"${local_usage['cost_per_1k']:.3f} per 1K requests",
-                        inline=True
-                    )
-
-                    # Info
-                    embed.add_field(
-                        name="ℹ️ How It Works",
-                        value="Zyte only triggers when free methods (Playwright, Cloudscraper) are blocked by Cloudflare. "
-                              "This keeps costs minimal while ensuring reliability.",
-                        inline=False
-                    )
+                    fields = [
+                        ("📡 Status", "✅ Available", False),
+                        ("📊 Requests This Session", f"**{local_usage['request_count']}** requests", True),
+                        ("💵 Estimated Cost", f"**${local_usage['estimated_cost']:.4f}**", True),
+                        ("💳 Rate", f"${local_usage['cost_per_1k']:.3f} per 1K requests", True),
+                        ("ℹ️ How It Works",
+                         "Zyte only triggers when free methods (Playwright, Cloudscraper) are blocked by Cloudflare. "
+                         "This keeps costs minimal while ensuring reliability.", False),
+                    ]
                 else:
-                    embed.add_field(
-                        name="⚠️ Setup Required",
-                        value="Add `ZYTE_API_KEY` to environment variables to enable premium bypass.",
-                        inline=False
-                    )
-
-                embed.set_footer(text="💡 Session stats | Resets on bot restart")
+                    fields = [
+                        ("📡 Status", "❌ Not configured", False),
+                        ("⚠️ Setup Required",
+                         "Add `ZYTE_API_KEY` to environment variables to enable premium bypass.", False),
+                    ]
+
+                embed = _build_embed(
+                    "💰 Zyte Usage Report (Bot Tracked)",
+                    f"Stats tracked this session for **{interaction.guild.name}**",
+                    Colors.PRIMARY,
+                    fields,
+                    footer="💡 Session stats | Resets on bot restart"
+                )
 
             elif view == "api":
                 # Query Zyte Stats API
                 if not local_usage['is_available']:
-                    embed = discord.Embed(
-                        title="⚠️ Zyte Not Configured",
-                        description="Zyte API is not currently configured.",
-                        color=Colors.WARNING
-                    )
-                    embed.add_field(
-                        name="⚠️ Setup Required",
-                        value="Add `ZYTE_API_KEY` to environment variables first.",
-                        inline=False
-                    )
+                    embed = _ZYTE_NOT_CONFIGURED_EMBED
                 else:
-                    api_data = await scraper.get_zyte_usage_from_api(days=30)
+                    api_data, wait = await self._cached_usage(
+                        "zyte:30d", ZYTE_STATS_TTL, lambda: scraper.get_zyte_usage_from_api(days=30),
+                        guild_id
+                    )
 
-                    if not api_data:
-                        embed = discord.Embed(
-                            title="⚠️ Zyte Stats API Unavailable",
-                            description="Could not retrieve data from Zyte Stats API.",
-                            color=Colors.WARNING
-                        )
-                        embed.add_field(
-                            name="📝 Setup Required",
-                            value="To enable official Zyte stats:\n"
-                                  "1. Get your **Dashboard API Key** (different from regular API key!)\n"
-                                  "   Go to: https://app.zyte.com/o/YOUR_ORG_ID/settings/apikeys\n"
-                                  "2. Add `ZYTE_DASHBOARD_API_KEY` to environment variables\n"
-                                  "3. Add `ZYTE_ORG_ID` from your dashboard URL\n"
-                                  "   (e.g., if URL is `app.zyte.com/o/123456`, use `123456`)",
-                            inline=False
-                        )
-                        embed.add_field(
-                            name="💡 Alternative",
-                            value="Use 'Bot Tracked' view or check your [Zyte Dashboard](https://app.zyte.com)",
-                            inline=False
+                    if wait:
+                        await interaction.followup.send(
+                            f"⏳ Zyte Stats API was just queried - try again in {wait:.0f}s.", ephemeral=True
                         )
+                        return
+                    if not api_data:
+                        embed = _ZYTE_STATS_UNAVAILABLE_EMBED
                     else:
-                        # Display API data
-                        embed = discord.Embed(
-                            title="🌐 Zyte API Usage (Official)",
-                            description=f"Last 30 days from Zyte Stats API\n*(Includes ALL usage on this API key)*",
-                            color=Colors.PRIMARY
-                        )
-
                         # Parse Zyte Stats API response
                         results = api_data.get('results', [])
                         if results:
@@ -802,47 +935,29 @@ class AdminCog(commands.Cog):
                             request_count = result.get('request_count', 0)
                             avg_response_time = float(result.get('response_time_sec_avg', 0))
 
-                            embed.add_field(
-                                name="📊 Request Count",
-                                value=f"**{request_count:,}** requests",
-                                inline=True
-                            )
-
-                            embed.add_field(
-                                name="💰 Total Cost",
-                                value=f"**${total_cost_usd:.6f}**",
-                                inline=True
-                            )
-
-                            embed.add_field(
-                                name="💵 Avg Cost",
-                                value=f"${avg_cost_usd:.6f}/request",
-                                inline=True
-                            )
-
-                            embed.add_field(
-                                name="⏱️ Avg Response Time",
-                                value=f"{avg_response_time:.2f} seconds",
-                                inline=True
-                            )
+                            fields = [
+                                ("📊 Request Count", f"**{request_count:,}** requests", True),
+                                ("💰 Total Cost", f"**${total_cost_usd:.6f}**", True),
+                                ("💵 Avg Cost", f"${avg_cost_usd:.6f}/request", True),
+                                ("⏱️ Avg Response Time", f"{avg_response_time:.2f} seconds", True),
+                            ]
 
                             # Status codes
                             status_codes = result.get('status_codes', [])
                             if status_codes:
-                                status_summary = "\n".join([f"**{sc.get('code', 'N/A')}**: {sc.get('count', 0)}" for sc in status_codes])
-                                embed.add_field(
-                                    name="📈 Status Codes",
-                                    value=status_summary,
-                                    inline=True
-                                )
+                                status_summary = "\n".join(f"**{sc.get('code', 'N/A')}**: {sc.get('count', 0)}" for sc in status_codes)
+                                fields.append(("📈 Status Codes", status_summary, True))
                         else:
-                            embed.add_field(
-                                name="ℹ️ No Data",
-                                value="No usage data available for the last 30 days.",
-                                inline=False
-                            )
+                            fields = [("ℹ️ No Data", "No usage data available for the last 30 days.", False)]
 
-                        embed.set_footer(text="💡 From Zyte Stats API | Last 30 days")
+                        # Display API data
+                        embed = _build_embed(
+                            "🌐 Zyte API Usage (Official)",
+                            "Last 30 days from Zyte Stats API\n*(Includes ALL usage on this API key)*",
+                            Colors.PRIMARY,
+                            fields,
+                            footer="💡 From Zyte Stats API | Last 30 days"
+                        )
 
             else:  # view == "both"
                 # Show both side by side
@@ -862,8 +977,17 @@ class AdminCog(commands.Cog):
                     )
 
                     # Try to get API data
-                    api_data = await scraper.get_zyte_usage_from_api(days=30)
-                    if api_data:
+                    api_data, wait = await self._cached_usage(
+                        "zyte:30d", ZYTE_STATS_TTL, lambda: scraper.get_zyte_usage_from_api(days=30),
+                        guild_id
+                    )
+                    if wait:
+                        embed.add_field(
+                            name="🌐 Zyte Stats API",
+                            value=f"*Rate limited*\nTry again in {wait:.0f}s",
+                            inline=True
+                        )
+                    elif api_data:
                         embed.add_field(
                             name="🌐 Zyte API (Last 30 Days)",
                             value=f"*Official data from Zyte*\n"
@@ -903,110 +1027,71 @@ class AdminCog(commands.Cog):
     @app_commands.describe(
         view="Choose which stats to view"
     )
-    @app_commands.choices(view=[
-        app_commands.Choice(name="📊 Bot Tracked (All Time)", value="local"),
-        app_commands.Choice(name="🌐 OpenAI API (Official - Today Only)", value="api"),
-        app_commands.Choice(name="📋 Both (Side by Side)", value="both")
-    ])
+    @app_commands.choices(view=_AI_VIEW_CHOICES)
+    @deferred_admin
+    @require_admin(message="❌ Only admins can view AI usage!")
     async def ai_usage(self, interaction: discord.Interaction, view: str = "local"):
         """Check AI token usage and cost statistics"""
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
-        # Check if user is admin
-        is_admin = (
-            interaction.user.guild_permissions.administrator or
-            (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-        )
-        if not is_admin:
-            await interaction.response.send_message("❌ Only admins can view AI usage!", ephemeral=True)
-            return
-
-        await interaction.response.defer(ephemeral=True)
-
         # Get AI integration from bot
         if not hasattr(self.bot, 'ai_assistant') or not self.bot.ai_assistant:
-            embed = discord.Embed(
-                title="ℹ️ AI Not Available",
-                description="AI integration is not currently configured.",
-                color=Colors.WARNING
-            )
-            embed.add_field(
-                name="⚠️ Setup Required",
-                value="Add `OPENAI_API_KEY` or `ANTHROPIC_API_KEY` to environment variables to enable AI features.",
-                inline=False
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=_AI_NOT_AVAILABLE_EMBED, ephemeral=True)
             return
 
         # Get local usage stats
         local_usage = self.bot.ai_assistant.get_token_usage()
+        local_requests, local_tokens, local_cost = (
+            local_usage['total_requests'], local_usage['total_tokens'], local_usage['total_cost']
+        )
 
         # Decide what to show based on view parameter
         if view == "local":
             # Show only bot-tracked stats
-            embed = discord.Embed(
-                title="🤖 AI Usage Report (Bot Tracked)",
-                description=f"Stats tracked by this bot (all time)",
-                color=Colors.PRIMARY
+            fields = [
+                ("📊 Total Requests", f"**{local_requests:,}** queries", True),
+                ("🎯 Total Tokens", f"**{local_tokens:,}** tokens", True),
+                ("💰 Total Cost", f"**${local_cost:.4f}**", True),
+            ]
+
+            # Per-provider breakdown
+            openai_tokens, openai_cost, anthropic_tokens, anthropic_cost = (
+                local_usage['openai_tokens'], local_usage['openai_cost'],
+                local_usage['anthropic_tokens'], local_usage['anthropic_cost']
             )
-
-            embed.add_field(
-                name="📊 Total Requests",
-                value=f"**{local_usage['total_requests']:,}** queries",
-                inline=True
+            if openai_tokens > 0:
+                fields.append((
+                    "🟢 OpenAI (GPT-3.5-turbo)",
+                    f"**{openai_tokens:,}** tokens\n${openai_cost:.4f}",
+                    True
+                ))
+            if anthropic_tokens > 0:
+                fields.append((
+                    "🔵 Anthropic (Claude 3 Haiku)",
+                    f"**{anthropic_tokens:,}** tokens\n${anthropic_cost:.4f}",
+                    True
+                ))
+
+            embed = _build_embed(
+                "🤖 AI Usage Report (Bot Tracked)",
+                "Stats tracked by this bot (all time)",
+                Colors.PRIMARY,
+                fields,
+                footer="💡 Bot-tracked stats | Persists across restarts"
             )
 
-            embed.add_field(
-                name="🎯 Total Tokens",
-                value=f"**{local_usage['total_tokens']:,}** tokens",
-                inline=True
-            )
-
-            embed.add_field(
-                name="💰 Total Cost",
-                value=f"**${local_usage['total_cost']:.4f}**",
-                inline=True
-            )
-
-            # OpenAI breakdown
-            if local_usage['openai_tokens'] > 0:
-                embed.add_field(
-                    name="🟢 OpenAI (GPT-3.5-turbo)",
-                    value=f"**{local_usage['openai_tokens']:,}** tokens\n${local_usage['openai_cost']:.4f}",
-                    inline=True
-                )
-
-            # Anthropic breakdown
-            if local_usage['anthropic_tokens'] > 0:
-                embed.add_field(
-                    name="🔵 Anthropic (Claude 3 Haiku)",
-                    value=f"**{local_usage['anthropic_tokens']:,}** tokens\n${local_usage['anthropic_cost']:.4f}",
-                    inline=True
-                )
-
-            embed.set_footer(text="💡 Bot-tracked stats | Persists across restarts")
-
         elif view == "api":
             # Query OpenAI Usage API
-            api_data = await self.bot.ai_assistant.get_openai_usage_from_api()
+            api_data, wait = await self._cached_usage(
+                "openai:today", OPENAI_USAGE_TTL, self.bot.ai_assistant.get_openai_usage_from_api,
+                interaction.guild.id
+            )
 
-            if not api_data:
-                embed = discord.Embed(
-                    title="⚠️ API Data Unavailable",
-                    description="Could not retrieve data from OpenAI Usage API. This may be due to:\n"
-                               "- API endpoint not available yet\n"
-                               "- Account permissions\n"
-                               "- Network issues\n"
-                               "- No usage data for today",
-                    color=Colors.WARNING
-                )
-                embed.add_field(
-                    name="💡 Alternative",
-                    value="Try the 'Bot Tracked' view or check your [OpenAI Dashboard](https://platform.openai.com/usage) for historical data",
-                    inline=False
+            if wait:
+                await interaction.followup.send(
+                    f"⏳ OpenAI Usage API was just queried - try again in {wait:.0f}s.", ephemeral=True
                 )
+                return
+            if not api_data:
+                embed = _OPENAI_USAGE_UNAVAILABLE_EMBED
             else:
                 # Parse API response and display
                 embed = discord.Embed(
@@ -1019,19 +1104,12 @@ class AdminCog(commands.Cog):
                 data = api_data.get('data', [])
 
                 if data:
-                    # Aggregate usage across all entries
-                    total_tokens = 0
-                    total_requests = 0
-
-                    for entry in data:
-                        # OpenAI API returns usage in different formats
-                        # Try to extract token counts
-                        if 'n_context_tokens_total' in entry:
-                            total_tokens += entry.get('n_context_tokens_total', 0)
-                        if 'n_generated_tokens_total' in entry:
-                            total_tokens += entry.get('n_generated_tokens_total', 0)
-                        if 'num_requests' in entry:
-                            total_requests += entry.get('num_requests', 0)
+                    # Aggregate usage across all entries (fields may be missing depending on format)
+                    total_tokens = sum(
+                        entry.get('n_context_tokens_total', 0) + entry.get('n_generated_tokens_total', 0)
+                        for entry in data
+                    )
+                    total_requests = sum(entry.get('num_requests', 0) for entry in data)
 
                     if total_requests > 0:
                         embed.add_field(
@@ -1080,15 +1158,24 @@ class AdminCog(commands.Cog):
             # Bot tracked section
             embed.add_field(
                 name="📊 Bot Tracked (This Bot Only)",
-                value=f"**Requests:** {local_usage['total_requests']:,}\n"
-                      f"**Tokens:** {local_usage['total_tokens']:,}\n"
-                      f"**Cost:** ${local_usage['total_cost']:.4f}",
+                value=f"**Requests:** {local_requests:,}\n"
+                      f"**Tokens:** {local_tokens:,}\n"
+                      f"**Cost:** ${local_cost:.4f}",
                 inline=True
             )
 
             # Try to get API data
-            api_data = await self.bot.ai_assistant.get_openai_usage_from_api()
-            if api_data:
+            api_data, wait = await self._cached_usage(
+                "openai:today", OPENAI_USAGE_TTL, self.bot.ai_assistant.get_openai_usage_from_api,
+                interaction.guild.id
+            )
+            if wait:
+                embed.add_field(
+                    name="🌐 OpenAI API",
+                    value=f"*Rate limited*\nTry again in {wait:.0f}s",
+                    inline=True
+                )
+            elif api_data:
                 embed.add_field(
                     name="🌐 OpenAI API (Today)",
                     value=f"*Official data from OpenAI*\n"
@@ -1105,9 +1192,9 @@ class AdminCog(commands.Cog):
             embed.set_footer(text="💡 Use view:api or view:local for detailed breakdowns")
 
         # Add common info
-        if local_usage['total_requests'] > 0 and view == "local":
-            avg_tokens_per_request = local_usage['total_tokens'] / local_usage['total_requests']
-            avg_cost_per_request = local_usage['total_cost'] / local_usage['total_requests']
+        if local_requests > 0 and view == "local":
+            avg_tokens_per_request = local_tokens / local_requests
+            avg_cost_per_request = local_cost / local_requests
 
             # Estimate based on 100 requests/month (conservative)
             monthly_requests = 100
@@ -1126,85 +1213,50 @@ class AdminCog(commands.Cog):
     @app_commands.describe(
         action="Action to perform"
     )
-    @app_commands.choices(action=[
-        app_commands.Choice(name="📊 View Stats", value="stats"),
-        app_commands.Choice(name="🗑️ Clear Recruiting Cache", value="clear_recruiting"),
-        app_commands.Choice(name="🗑️ Clear All Cache", value="clear_all")
-    ])
+    @app_commands.choices(action=_CACHE_ACTION_CHOICES)
+    @deferred_admin
+    @require_admin(message="❌ Only admins can manage cache!")
     async def cache_management(self, interaction: discord.Interaction, action: str = "stats"):
         """Manage bot cache"""
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
-        # Check if user is admin
-        is_admin = (
-            interaction.user.guild_permissions.administrator or
-            (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-        )
-        if not is_admin:
-            await interaction.response.send_message("❌ Only admins can manage cache!", ephemeral=True)
-            return
-
-        await interaction.response.defer(ephemeral=True)
-
-        from ..utils.cache import get_cache
         cache = get_cache()
 
         if action == "stats":
             # Show cache statistics
             stats = cache.get_stats()
 
-            embed = discord.Embed(
-                title="📦 Cache Statistics",
-                description=f"Performance and usage statistics",
-                color=Colors.PRIMARY
-            )
-
-            # Overall stats
-            embed.add_field(
-                name="📊 Requests",
-                value=f"**Total:** {stats['total_requests']:,}\n"
-                      f"**Hits:** {stats['hits']:,}\n"
-                      f"**Misses:** {stats['misses']:,}",
-                inline=True
-            )
-
-            embed.add_field(
-                name="✅ Hit Rate",
-                value=f"**{stats['hit_rate']:.1f}%**\n"
-                      f"(Higher = more savings!)",
-                inline=True
-            )
-
-            embed.add_field(
-                name="💾 Cache Size",
-                value=f"**{stats['cache_size']:,}** entries\n"
-                      f"**{stats['evictions']:,}** evicted",
-                inline=True
-            )
+            fields = [
+                ("📊 Requests",
+                 f"**Total:** {stats['total_requests']:,}\n"
+                 f"**Hits:** {stats['hits']:,}\n"
+                 f"**Misses:** {stats['misses']:,}", True),
+                ("✅ Hit Rate", f"**{stats['hit_rate']:.1f}%**\n(Higher = more savings!)", True),
+                ("💾 Cache Size",
+                 f"**{stats['cache_size']:,}** entries\n"
+                 f"**{stats['evictions']:,}** evicted", True),
+            ]
 
             # Per-namespace breakdown
             if stats['namespaces']:
-                namespace_text = "\n".join([f"**{ns}**: {count}" for ns, count in stats['namespaces'].items()])
-                embed.add_field(
-                    name="📂 By Type",
-                    value=namespace_text,
-                    inline=False
-                )
+                namespace_text = "\n".join(f"**{ns}**: {count}" for ns, count in stats['namespaces'].items())
+                fields.append(("📂 By Type", namespace_text, False))
 
             # Cost savings estimate
             if stats['hits'] > 0:
                 # Assume each cache hit saves ~$0.00023 (one Zyte request)
                 estimated_savings = stats['hits'] * 0.00023
-                embed.add_field(
-                    name="💰 Estimated Savings",
-                    value=f"~${estimated_savings:.4f}\n"
-                          f"({stats['hits']} API calls avoided!)",
-                    inline=False
-                )
-
-            embed.set_footer(text="💡 Cache helps reduce API costs by reusing recent data")
+                fields.append((
+                    "💰 Estimated Savings",
+                    f"~${estimated_savings:.4f}\n({stats['hits']} API calls avoided!)",
+                    False
+                ))
+
+            embed = _build_embed(
+                "📦 Cache Statistics",
+                "Performance and usage statistics",
+                Colors.PRIMARY,
+                fields,
+                footer="💡 Cache helps reduce API costs by reusing recent data"
+            )
             await interaction.followup.send(embed=embed, ephemeral=True)
 
         elif action == "clear_recruiting":
@@ -1221,8 +1273,7 @@ class AdminCog(commands.Cog):
 
         elif action == "clear_all":
             # Clear all cache
-            count = cache.get_stats()['cache_size']
-            cache.clear()
+            count = cache.clear()
 
             embed = discord.Embed(
                 title="🗑️ All Cache Cleared",
@@ -1234,58 +1285,50 @@ class AdminCog(commands.Cog):
 
     @admin_group.command(name="budget", description="View monthly API cost budget and spending")
     @app_commands.describe(action="View current status or reconcile from Zyte/OpenAI APIs")
-    @app_commands.choices(action=[
-        app_commands.Choice(name="View (current)", value="view"),
-        app_commands.Choice(name="Reconcile from Zyte & OpenAI", value="reconcile"),
-    ])
+    @app_commands.choices(action=_BUDGET_ACTION_CHOICES)
+    @deferred_admin
+    @require_admin(message="❌ Only admins can view budget!")
     async def budget_status(self, interaction: discord.Interaction, action: str = "view"):
         """View monthly budget status, or reconcile from provider APIs."""
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
-        # Check if user is admin
-        is_admin = (
-            interaction.user.guild_permissions.administrator or
-            (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-        )
-        if not is_admin:
-            await interaction.response.send_message("❌ Only admins can view budget!", ephemeral=True)
-            return
-
-        await interaction.response.defer(ephemeral=True)
-
-        from ..utils.cost_tracker import get_cost_tracker
-        from datetime import datetime as dt, date, time
-
         tracker = get_cost_tracker()
+        now = datetime.now()  # One timestamp for both the reconcile window and the title
 
         if action == "reconcile":
+            wait = self._api_cooldown("reconcile", interaction.guild.id)
+            if wait:
+                await interaction.followup.send(
+                    f"⏳ Budget was just reconciled - try again in {wait:.0f}s.", ephemeral=True
+                )
+                return
+
             # Fetch current month costs from Zyte and OpenAI, then overwrite stored values
-            ai_cost = None
-            zyte_cost = None
-            first_day = date.today().replace(day=1)
-            start_dt = dt.combine(first_day, time.min)
-            end_dt = dt.now()
+            start_dt = datetime(now.year, now.month, 1)
+            end_dt = now
 
-            # Zyte: official cost from Stats API (current month to date)
-            try:
-                from .recruiting import get_recruiting_scraper
-                scraper, source_name = get_recruiting_scraper(interaction.guild.id)
-                if source_name == "On3/Rivals" and hasattr(scraper, 'get_zyte_usage_from_api'):
-                    api_data = await scraper.get_zyte_usage_from_api(start_time=start_dt, end_time=end_dt)
-                    if api_data and api_data.get('results'):
-                        result = api_data['results'][0]
-                        zyte_cost = float(result.get('cost_microusd_total', 0)) / 1_000_000
-            except Exception as e:
-                logger.warning(f"Zyte reconcile failed: {e}")
-
-            # OpenAI: official usage API (sum tokens for each day this month, then estimate cost)
-            try:
-                if getattr(self.bot, 'ai_assistant', None) and hasattr(self.bot.ai_assistant, 'get_openai_cost_for_current_month'):
-                    ai_cost = await self.bot.ai_assistant.get_openai_cost_for_current_month()
-            except Exception as e:
-                logger.warning(f"OpenAI reconcile failed: {e}")
+            async def _fetch_zyte() -> Optional[float]:
+                # Official cost from Zyte Stats API (current month to date)
+                try:
+                    scraper, source_name = get_recruiting_scraper(interaction.guild.id)
+                    if source_name == "On3/Rivals" and hasattr(scraper, 'get_zyte_usage_from_api'):
+                        api_data = await scraper.get_zyte_usage_from_api(start_time=start_dt, end_time=end_dt)
+                        if api_data and api_data.get('results'):
+                            result = api_data['results'][0]
+                            return float(result.get('cost_microusd_total', 0)) / 1_000_000
+                except Exception as e:
+                    logger.warning(f"Zyte reconcile failed: {e}")
+                return None
+
+            async def _fetch_openai() -> Optional[float]:
+                # Official usage API (sum tokens for each day this month, then estimate cost)
+                try:
+                    if getattr(self.bot, 'ai_assistant', None) and hasattr(self.bot.ai_assistant, 'get_openai_cost_for_current_month'):
+                        return await self.bot.ai_assistant.get_openai_cost_for_current_month()
+                except Exception as e:
+                    logger.warning(f"OpenAI reconcile failed: {e}")
+                return None
+
+            # Independent network calls - run them side by side
+            zyte_cost, ai_cost = await asyncio.gather(_fetch_zyte(), _fetch_openai())
 
             if ai_cost is not None or zyte_cost is not None:
                 await tracker.set_monthly_costs(ai_cost=ai_cost, zyte_cost=zyte_cost)
@@ -1306,60 +1349,21 @@ class AdminCog(commands.Cog):
         status = await tracker.get_budget_status()
         reconciled_this_turn = (action == "reconcile")
 
-        embed = discord.Embed(
-            title="💰 Monthly Budget Status",
-            description=f"API costs for {datetime.now().strftime('%B %Y')}"
-                        + ("\n*Reconciled from Zyte & OpenAI APIs just now.*" if reconciled_this_turn else ""),
-            color=Colors.PRIMARY
-        )
-
         # AI costs
         ai_percent = status['percentages']['ai']
-        ai_emoji = "🟢" if ai_percent < 50 else "🟡" if ai_percent < 80 else "🔴"
-        embed.add_field(
-            name=f"{ai_emoji} AI (OpenAI/Anthropic)",
-            value=f"**${status['costs']['ai']:.4f}** / ${status['budgets']['ai']:.2f}\n"
-                  f"**{ai_percent:.1f}%** used • ${status['remaining']['ai']:.2f} left",
-            inline=True
-        )
+        ai_emoji = _budget_emoji(ai_percent)
 
         # Zyte costs (include spend cap if set)
         zyte_percent = status['percentages']['zyte']
-        zyte_emoji = "🟢" if zyte_percent < 50 else "🟡" if zyte_percent < 80 else "🔴"
-        zyte_value = (f"**${status['costs']['zyte']:.4f}** / ${status['budgets']['zyte']:.2f}\n"
-                      f"**{zyte_percent:.1f}%** used • ${status['remaining']['zyte']:.2f} left")
+        zyte_emoji = _budget_emoji(zyte_percent)
+        zyte_value = _budget_summary(status, 'zyte')
         if getattr(tracker, 'zyte_spend_limit', 0) > 0:
             over_limit = await tracker.is_zyte_over_limit()
             zyte_value += f"\n🛑 Cap: ${tracker.zyte_spend_limit:.0f}" + (" (disabled)" if over_limit else "")
-        embed.add_field(
-            name=f"{zyte_emoji} Zyte API",
-            value=zyte_value,
-            inline=True
-        )
 
         # Total
         total_percent = status['percentages']['total']
-        total_emoji = "🟢" if total_percent < 50 else "🟡" if total_percent < 80 else "🔴"
-        embed.add_field(
-            name=f"{total_emoji} Total Budget",
-            value=f"**${status['costs']['total']:.4f}** / ${status['budgets']['total']:.2f}\n"
-                  f"**{total_percent:.1f}%** used • ${status['remaining']['total']:.2f} left",
-            inline=True
-        )
-
-        # Progress bars
-        def progress_bar(percent: float, length: int = 10) -> str:
-            filled = int(percent / 100 * length)
-            empty = length - filled
-            return f"[{'█' * filled}{'░' * empty}]"
-
-        embed.add_field(
-            name="📊 Progress",
-            value=f"**AI:** {progress_bar(ai_percent)} {ai_percent:.0f}%\n"
-                  f"**Zyte:** {progress_bar(zyte_percent)} {zyte_percent:.0f}%\n"
-                  f"**Total:** {progress_bar(total_percent)} {total_percent:.0f}%",
-            inline=False
-        )
+        total_emoji = _budget_emoji(total_percent)
 
         # Budget info
         budget_note = ("Budgets are configured in environment variables:\n"
@@ -1369,41 +1373,37 @@ class AdminCog(commands.Cog):
             budget_note += f"\n**ZYTE_SPEND_LIMIT**=${tracker.zyte_spend_limit:.0f} disables Zyte API when reached."
         if status['costs']['ai'] == 0 and status['costs']['zyte'] == 0:
             budget_note += "\n*Costs are recorded when AI and Zyte are used; use the bot to see numbers update.*"
-        embed.add_field(
-            name="ℹ️ About Budgets",
-            value=budget_note,
-            inline=False
-        )
 
-        embed.set_footer(text="💡 Resets monthly • Same storage as bot config (Discord/Supabase)")
+        fields = [
+            (f"{ai_emoji} AI (OpenAI/Anthropic)", _budget_summary(status, 'ai'), True),
+            (f"{zyte_emoji} Zyte API", zyte_value, True),
+            (f"{total_emoji} Total Budget", _budget_summary(status, 'total'), True),
+            ("📊 Progress",
+             f"**AI:** {_progress_bar(ai_percent)} {ai_percent:.0f}%\n"
+             f"**Zyte:** {_progress_bar(zyte_percent)} {zyte_percent:.0f}%\n"
+             f"**Total:** {_progress_bar(total_percent)} {total_percent:.0f}%", False),
+            ("ℹ️ About Budgets", budget_note, False),
+        ]
+
+        embed = _build_embed(
+            "💰 Monthly Budget Status",
+            f"API costs for {_MONTH_NAMES[now.month - 1]} {now.year}"
+            + ("\n*Reconciled from Zyte & OpenAI APIs just now.*" if reconciled_this_turn else ""),
+            Colors.PRIMARY,
+            fields,
+            footer="💡 Resets monthly • Same storage as bot config (Discord/Supabase)"
+        )
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_group.command(name="digest", description="View or send weekly summary digest")
     @app_commands.describe(
         action="Action to perform"
     )
-    @app_commands.choices(action=[
-        app_commands.Choice(name="📊 View Now", value="view"),
-        app_commands.Choice(name="📧 Send to All Admins", value="send")
-    ])
+    @app_commands.choices(action=_DIGEST_ACTION_CHOICES)
+    @deferred_admin
+    @require_admin(message="❌ Only admins can view digest!")
     async def weekly_digest(self, interaction: discord.Interaction, action: str = "view"):
         """View or send the weekly digest"""
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This only works in servers!", ephemeral=True)
-            return
-
-        # Check if user is admin
-        is_admin = (
-            interaction.user.guild_permissions.administrator or
-            (self.admin_manager and self.admin_manager.is_admin(interaction.user, interaction))
-        )
-        if not is_admin:
-            await interaction.response.send_message("❌ Only admins can view digest!", ephemeral=True)
-            return
-
-        await interaction.response.defer(ephemeral=True)
-
-        from ..utils.weekly_digest import get_weekly_digest
         digest = get_weekly_digest(self.bot)
 
         if action == "view":
@@ -1419,27 +1419,24 @@ class AdminCog(commands.Cog):
             )
 
     @admin_group.command(name="schedule_reload", description="Reload the league schedule from file (Admin only)")
+    @deferred_admin
+    @require_admin(allow_guild_admins=False, message="❌ Only admins can reload the schedule!")
     async def schedule_reload(self, interaction: discord.Interaction):
         """Reload the schedule from schedule.json without restarting the bot"""
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Only admins can reload the schedule!", ephemeral=True)
-            return
-
         if not self.schedule_manager:
-            await interaction.response.send_message("❌ Schedule manager not available", ephemeral=True)
+            await interaction.followup.send("❌ Schedule manager not available", ephemeral=True)
             return
 
-        await interaction.response.defer(ephemeral=True)
-
         # Reload the schedule
         success = self.schedule_manager.reload_schedule()
 
         if success:
-            # Get schedule info
+            # Snapshot once - a later reload swaps these attributes wholesale
             season = self.schedule_manager.season
-            team_count = len(self.schedule_manager.teams)
-            teams_list = ", ".join(self.schedule_manager.teams)
-            
+            teams = self.schedule_manager.teams
+            team_count = len(teams)
+            teams_list = ", ".join(teams)
+
             embed = discord.Embed(
                 title="📅 Schedule Reloaded!",
                 description=f"Successfully reloaded schedule from `data/schedule.json`",
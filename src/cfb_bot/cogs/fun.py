@@ -8,13 +8,20 @@ Commands:
 - /fun untarget - Stop trolling a user (admin only)
 - /fun timeout - Set timeout between troll messages (admin only)
 - /fun status - Check who's being trolled (admin only)
+- /fun toggle_engage, target_all, untarget_all, roast (admin only)
+
+The group is guild-only; every command is wrapped in @admin_guarded, which drops
+duplicate interactions and denies non-admins before the command body runs.
 """
 
+import asyncio
+import functools
 import logging
 import random
 import re
 import time
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 
 import discord
 from discord import app_commands
@@ -24,6 +31,183 @@ from ..config import Colors
 
 logger = logging.getLogger('CFB26Bot.Fun')
 
+# How long an admin check result is reused for the same user and server
+ADMIN_CHECK_TTL = 30
+ADMIN_CHECK_CACHE_SIZE = 256
+
+# What non-admins get back from any /fun command
+ADMIN_DENIED_TEXT = "❌ Nice try, but no."
+
+# User mentions in /fun target_all, e.g. <@123> or <@!123>
+MENTION_RE = re.compile(r'<@!?(\d+)>')
+
+# Seconds target_all waits on any single member fetch before skipping that user
+FETCH_MEMBER_TIMEOUT = 2.0
+
+# Embed descriptions max out at 4096 chars; keep headroom for the "and N more" line
+STATUS_DESCRIPTION_LIMIT = 4000
+
+# How many comebacks Harry fires at one target before he gives up arguing
+MAX_ARGUMENTS = 5
+
+# Seconds per duplicate-interaction bucket; ids are remembered for one to two windows
+DUPLICATE_WINDOW = 5
+
+# How many of Harry's troll messages we remember for reply detection
+MAX_TROLL_MESSAGES = 100
+
+# Building blocks for _generate_dynamic_insult - only the chosen template gets formatted
+_INSULT_PHRASES = (
+    "Fuck you", "Oi", "Look at this", "Absolute", "What a", "You're a",
+    "Shut your face", "Piss off", "Sod off", "Get lost", "Hey", "Oh look",
+    "Listen here", "Cry more", "Try harder", "Fuck off", "Yeah right",
+    "You absolute", "Check out this", "State of this", "Imagine being a",
+    "Holy shit it's", "Everybody look at", "Christ alive,", "Do one",
+    "Get stuffed", "Jog on", "Wind your neck in",
+)
+_INSULT_SWEARS = (
+    "fucking", "shit", "bloody", "sodding", "goddamn", "damn",
+    "wank", "bellend", "twat", "muppet", "pillock", "plonker",
+    "cockwomble", "thundercunt", "shitgibbon", "spunkbubble",
+    "fudgepacking", "tosspot", "numpty", "minging", "gormless",
+    "clapped", "noncey", "daft", "useless",
+)
+_INSULT_OBJECTS = (
+    "muppet", "donut", "pillock", "waste of space", "chocolate teapot",
+    "bag of rocks", "wet wipe", "absolute weapon", "wanker", "bellend",
+    "twat", "plonker", "numpty", "melon", "div",
+    "knobhead", "dickhead", "tosser", "berk", "prat",
+    "nincompoop", "dipstick", "ninny", "wazzock",
+    "broken condom", "failed abortion", "inbred cabbage",
+    "sentient wank sock", "moldy cum rag", "village idiot",
+    "oxygen thief", "damp towel", "ham sandwich", "window licker",
+    "mouth breather", "fart in a jar", "stale biscuit",
+)
+_INSULT_EMOJIS = ("🖕", "💩", "🤬", "😈", "😂", "🗑️", "🔥", "🤡", "🤢", "🤏", "💀")
+
+# Templates when talking straight back at someone ("you") vs. calling out a mention
+_YOU_TEMPLATES = (
+    "{p}, you {s} {o}! {e}",
+    "You're a {s} {o}. {p}! {e}",
+    "What a {s} {o}. {p}! {e}",
+    "Oi! You {s} {o}. {p}! {e}",
+    "Look at you, the {s} {o}. {e}",
+    "{p} you {s} {o}! {e}",
+)
+_MENTION_TEMPLATES = (
+    "{p} {m}, you {s} {o}! {e}",
+    "{m} {p} you {s} {o}! {e}",
+    "Oi {m}! You're a {s} {o}. {e}",
+    "{p} {m}. What a {s} {o}! {e}",
+    "Look at {m}, the {s} {o}. {e}",
+    "{p} you {s} {o}, {m}! {e}",
+    "{m} — you {s} {o}. {p}! {e}",
+    "What a {s} {o}. {p} {m}! {e}",
+)
+
+# AI comeback prompt - only the names and message change per call
+COMEBACK_MAX_CHARS = 200
+TRUNCATION_SUFFIX = "..."
+_COMEBACK_PROMPT = """You are Harry, an extremely vulgar and rude British football bot who just told {user_name} "Fuck you" and they responded with: "{user_message}"
+
+Generate a SHORT, BRUTAL comeback that:
+- Is EXTREMELY rude and vulgar (use fuck, shit, cunt, wanker, bellend, twat, etc. liberally)
+- Is British slang-heavy (mate, ya muppet, bollocks, piss off, sod off, etc.)
+- References what they said and roasts them for it
+- Is deliberately offensive and insulting
+- Is 1-2 sentences max
+- Ends with an emoji
+
+Example comebacks:
+- "Oh fuck off, you whiny little bitch. Nobody gives a shit about your feelings, mate. 🖕"
+- "Cry harder, you absolute bellend! 😂"
+- "Listen here you fucking muppet, your opinion is worth less than dog shit. 💩"
+- "What a load of bollocks! Shut your fucking mouth, wanker. 🤐"
+- "You're dumber than a bag of fucking rocks, mate. 💀"
+
+Your BRUTAL comeback (max {max_chars} chars):"""
+
+# /fun roast prompt
+_ROAST_PROMPT = """Generate a short, brutal, British slang-heavy roast for {user_name}.
+Make it vulgar, offensive, and funny. Max 2 sentences. End with an emoji.
+Do NOT start with "Oh," or "Look," - start directly with the roast."""
+
+# Case-insensitive "harry" without lowercasing a copy of every targeted message
+_HARRY_RE = re.compile("harry", re.IGNORECASE)
+
+# Words that count as a targeted user having a go at Harry
+_INSULT_KEYWORDS = ('fuck', 'shit', 'bot', 'ass', 'damn', 'hell', 'stupid', 'dumb', 'suck')
+# Substring match like `k in text.lower()`, but one case-insensitive pass and no lowercased copy
+_INSULT_RE = re.compile("|".join(_INSULT_KEYWORDS), re.IGNORECASE)
+_REACTION_EMOJIS = ("💩", "🤡", "👶", "🤢", "🤏", "🤥", "🖕", "🥱", "🚮", "🤨")
+
+FALLBACK_COMEBACKS = (
+    "Oh fuck off, you whiny little bitch. 🖕",
+    "Cry more, you absolute bellend! 😂",
+    "Listen here you fucking muppet, shut your mouth. 🤐",
+    "What a load of bollocks! Piss off, wanker! 💩",
+    "You're dumber than a bag of fucking rocks, mate. 💀",
+    "Aww, did I hurt your feelings? Fucking good! 😈",
+    "You're a proper twat, aren't ya? 🎯",
+    "Is that the best you've got, you useless cunt? 😴",
+    "Mate, you're an embarrassment. Sod off! 🔥",
+    "Oh no, are you gonna cry now? Fucking pathetic! 😭",
+    "Try harder, that was shit! 💩",
+    "You're about as useful as a chocolate teapot, ya muppet! 🍫",
+    "Shut your fucking gob before I do it for you! 🤬",
+    "You talk a lot of shite for someone so fucking stupid! 🗑️",
+    "Get absolutely fucked, you wanker! 🖕",
+)
+
+
+def admin_guarded(defer: bool = False):
+    """Drop duplicate interactions and deny non-admins before running a /fun command.
+
+    With defer=True the interaction is acknowledged first (ephemeral) and the
+    denial goes out as a followup, for commands that may run past Discord's 3s window.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            if self._is_duplicate_interaction(interaction):
+                return
+            if defer:
+                await interaction.response.defer(ephemeral=True)
+            if await self._deny_if_not_admin(interaction, deferred=defer):
+                return
+            return await func(self, interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TargetInfo:
+    """Trolling state for one targeted user in one server"""
+
+    __slots__ = (
+        'timeout', 'last_triggered', 'target_name', 'enabled_by',
+        'enabled_by_name', 'engage', 'argument_count', 'ai_lock',
+    )
+
+    def __init__(
+        self,
+        timeout: int,
+        target_name: str,
+        enabled_by: int,
+        enabled_by_name: str,
+        engage: bool = True,
+        last_triggered: Optional[float] = None,  # loop.time() of the last troll; None allows an immediate first one
+        argument_count: int = 0,  # How many times Harry has argued back
+    ):
+        self.timeout = timeout
+        self.target_name = target_name
+        self.enabled_by = enabled_by
+        self.enabled_by_name = enabled_by_name
+        self.engage = engage
+        self.last_triggered = last_triggered
+        self.argument_count = argument_count
+        # One AI comeback in flight per target; dropped along with the target
+        self.ai_lock = asyncio.Lock()
+
 
 class FunCog(commands.Cog):
     """Fun & trolling commands (admin only)"""
@@ -32,14 +216,22 @@ class FunCog(commands.Cog):
         self.bot = bot
         self.admin_manager = None
 
-        # Guild-scoped: {guild_id: {user_id: {'timeout': ..., 'last_triggered': ..., 'engage': bool}}}
-        self.targets: Dict[int, Dict[int, Dict]] = {}
+        # Guild-scoped: {guild_id: {user_id: TargetInfo}}
+        self.targets: Dict[int, Dict[int, TargetInfo]] = {}
 
         # Track Harry's troll messages for reply detection: {message_id: (guild_id, user_id)}
-        self.troll_messages: Dict[int, Tuple[int, int]] = {}
+        # Insertion-ordered so the oldest entry can be dropped in O(1) once we pass MAX_TROLL_MESSAGES
+        self.troll_messages: "OrderedDict[int, Tuple[int, int]]" = OrderedDict()
+
+        # Recently processed interaction ids in [previous, current] DUPLICATE_WINDOW buckets
+        self._recent_buckets: List[Set[int]] = [set(), set()]
+        self._bucket_epoch = 0
+
+        # on_message is only registered while someone is targeted - idle servers pay nothing per message
+        self._listener_attached = False
 
-        # Track processed interactions to prevent duplicates: {interaction_id: timestamp}
-        self._processed_interactions: Dict[int, float] = {}
+        # Admin check results: {(user_id, guild_id): (checked_at, admin_manager.version, is_admin)}
+        self._admin_cache: "OrderedDict[Tuple[int, Optional[int]], Tuple[float, int, bool]]" = OrderedDict()
 
         logger.info("🎭 FunCog initialized")
 
@@ -48,38 +240,101 @@ class FunCog(commands.Cog):
         self.admin_manager = admin_manager
         self.ai_assistant = ai_assistant
 
-    def _targets_for_guild(self, guild_id: int) -> Dict[int, Dict]:
-        """Get the targets dict for a guild (per-server targeting)."""
+    async def cog_unload(self):
+        """Drop the message listener if it's registered"""
+        self._detach_listener()
+
+    def _attach_listener(self):
+        """Start listening to messages (first target added)"""
+        if not self._listener_attached:
+            self.bot.add_listener(self.on_message, 'on_message')
+            self._listener_attached = True
+            logger.debug("🎭 FunCog message listener attached")
+
+    def _detach_listener(self):
+        """Stop listening to messages"""
+        if self._listener_attached:
+            self.bot.remove_listener(self.on_message, 'on_message')
+            self._listener_attached = False
+            logger.debug("🎭 FunCog message listener detached")
+
+    def _detach_if_idle(self):
+        """Drop emptied servers; detach the listener and leftover state once nobody is targeted anywhere"""
+        self.targets = {guild_id: targets for guild_id, targets in self.targets.items() if targets}
+        if self.targets:
+            return
+        # Replies only matter for live targets, so stale troll messages can go too
+        self.troll_messages.clear()
+        self._detach_listener()
+
+    def _targets_for_guild_ro(self, guild_id: int) -> Dict[int, TargetInfo]:
+        """Get a guild's targets for reading; an untracked guild gets a throwaway empty dict."""
+        return self.targets.get(guild_id) or {}
+
+    def _targets_for_guild_rw(self, guild_id: int) -> Dict[int, TargetInfo]:
+        """Get (creating if needed) the targets dict for a guild - only for paths that add targets."""
         return self.targets.setdefault(guild_id, {})
 
+    def _remember_troll(self, message_id: int, guild_id: int, user_id: int):
+        """Track a troll message for reply detection, dropping the oldest past MAX_TROLL_MESSAGES."""
+        self.troll_messages[message_id] = (guild_id, user_id)
+        while len(self.troll_messages) > MAX_TROLL_MESSAGES:
+            self.troll_messages.popitem(last=False)
+
+    def _check_admin(self, interaction: discord.Interaction) -> bool:
+        """Bot admin check, reused for ADMIN_CHECK_TTL seconds unless the admin list changes"""
+        if not self.admin_manager:
+            return False
+
+        key = (interaction.user.id, interaction.guild_id)
+        version = self.admin_manager.version
+        now = time.monotonic()
+        cached = self._admin_cache.get(key)
+        if cached and cached[1] == version and now - cached[0] < ADMIN_CHECK_TTL:
+            return cached[2]
+
+        result = self.admin_manager.is_admin(interaction.user, interaction)
+        self._admin_cache[key] = (now, version, result)
+        self._admin_cache.move_to_end(key)
+        # Drop the least recently checked users rather than flushing everyone at once
+        while len(self._admin_cache) > ADMIN_CHECK_CACHE_SIZE:
+            self._admin_cache.popitem(last=False)
+        return result
+
+    async def _deny_if_not_admin(self, interaction: discord.Interaction, deferred: bool = False) -> bool:
+        """Send the denial and return True if the user isn't a bot admin (deferred: reply via followup)"""
+        if self._check_admin(interaction):
+            return False
+        if deferred:
+            await interaction.followup.send(ADMIN_DENIED_TEXT, ephemeral=True)
+        else:
+            await interaction.response.send_message(ADMIN_DENIED_TEXT, ephemeral=True)
+        return True
+
     def _is_duplicate_interaction(self, interaction: discord.Interaction) -> bool:
         """Check if we've already processed this interaction (prevents duplicate commands)"""
         interaction_id = interaction.id
-        current_time = time.time()
-
-        # Check if we've seen this interaction in the last 5 seconds
-        if interaction_id in self._processed_interactions:
-            time_since = current_time - self._processed_interactions[interaction_id]
-            if time_since < 5:
-                logger.warning(f"⚠️ Duplicate interaction detected (ID: {interaction_id}, {time_since:.2f}s ago)")
-                return True
 
-        # Mark this interaction as processed
-        self._processed_interactions[interaction_id] = current_time
+        # Rotate the 5-second buckets; anything older than the previous bucket is dropped wholesale
+        epoch = int(time.monotonic() // DUPLICATE_WINDOW)
+        if epoch != self._bucket_epoch:
+            previous = self._recent_buckets[1] if epoch == self._bucket_epoch + 1 else set()
+            self._recent_buckets = [previous, set()]
+            self._bucket_epoch = epoch
 
-        # Cleanup old entries (keep last 100)
-        if len(self._processed_interactions) > 100:
-            oldest_keys = sorted(self._processed_interactions.keys(),
-                               key=lambda k: self._processed_interactions[k])[:50]
-            for key in oldest_keys:
-                del self._processed_interactions[key]
+        # Presence in either bucket means we saw it within the last one or two windows
+        if interaction_id in self._recent_buckets[0] or interaction_id in self._recent_buckets[1]:
+            logger.warning(f"⚠️ Duplicate interaction detected (ID: {interaction_id})")
+            return True
 
+        self._recent_buckets[1].add(interaction_id)
         return False
 
     # Command group
     fun_group = app_commands.Group(
         name="fun",
-        description="🎭 Secret fun commands (Admin only)"
+        description="🎭 Secret fun commands (Admin only)",
+        guild_only=True
     )
 
     @fun_group.command(name="target", description="🎯 Start trolling a user (Admin only)")
@@ -88,6 +343,7 @@ class FunCog(commands.Cog):
         timeout="Minutes between messages (default: 30)",
         engage="Should Harry argue back if they respond? (default: True)"
     )
+    @admin_guarded()
     async def target(
         self,
         interaction: discord.Interaction,
@@ -96,15 +352,6 @@ class FunCog(commands.Cog):
         engage: bool = True
     ):
         """Enable trolling for a specific user"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
         # Validation
         if timeout < 1:
             await interaction.response.send_message("❌ Timeout must be at least 1 minute!", ephemeral=True)
@@ -118,21 +365,16 @@ class FunCog(commands.Cog):
             await interaction.response.send_message("❌ Can't target bots, mate!", ephemeral=True)
             return
 
-        if not interaction.guild_id:
-            await interaction.response.send_message("❌ This command only works in a server!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
-        guild_targets[user.id] = {
-            'timeout': timeout,
-            'last_triggered': 0,  # Allow immediate first message
-            'target_name': user.display_name,
-            'enabled_by': interaction.user.id,
-            'enabled_by_name': interaction.user.display_name,
-            'engage': engage,
-            'argument_count': 0  # Track how many times Harry has argued back
-        }
+        guild_targets = self._targets_for_guild_rw(interaction.guild_id)
+        guild_targets[user.id] = TargetInfo(
+            timeout=timeout,
+            target_name=user.display_name,
+            enabled_by=interaction.user.id,
+            enabled_by_name=interaction.user.display_name,
+            engage=engage,
+        )
 
+        self._attach_listener()
         logger.info(f"🎯 {interaction.user.display_name} enabled trolling for {user.display_name} (timeout: {timeout}m, engage: {engage})")
 
         engage_text = "🔥 **Engage mode: ON** - Harry will argue if they respond!" if engage else "💤 **Engage mode: OFF**"
@@ -152,24 +394,13 @@ class FunCog(commands.Cog):
 
     @fun_group.command(name="untarget", description="🛑 Stop trolling a user (Admin only)")
     @app_commands.describe(user="The user to stop trolling")
+    @admin_guarded()
     async def untarget(self, interaction: discord.Interaction, user: discord.Member):
         """Disable trolling for a specific user"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
-        if not interaction.guild_id:
-            await interaction.response.send_message("❌ This command only works in a server!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
+        guild_targets = self._targets_for_guild_ro(interaction.guild_id)
         if user.id in guild_targets:
             guild_targets.pop(user.id)
+            self._detach_if_idle()
             logger.info(f"🛑 {interaction.user.display_name} disabled trolling for {user.display_name}")
 
             embed = discord.Embed(
@@ -190,6 +421,7 @@ class FunCog(commands.Cog):
         user="The targeted user",
         timeout="New timeout in minutes"
     )
+    @admin_guarded()
     async def set_timeout(
         self,
         interaction: discord.Interaction,
@@ -197,15 +429,6 @@ class FunCog(commands.Cog):
         timeout: int
     ):
         """Adjust the timeout for a targeted user"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
         # Validation
         if timeout < 1 or timeout > 1440:
             await interaction.response.send_message(
@@ -214,14 +437,10 @@ class FunCog(commands.Cog):
             )
             return
 
-        if not interaction.guild_id:
-            await interaction.response.send_message("❌ This command only works in a server!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
+        guild_targets = self._targets_for_guild_ro(interaction.guild_id)
         if user.id in guild_targets:
-            old_timeout = guild_targets[user.id]['timeout']
-            guild_targets[user.id]['timeout'] = timeout
+            old_timeout = guild_targets[user.id].timeout
+            guild_targets[user.id].timeout = timeout
 
             logger.info(f"⏱️ {interaction.user.display_name} changed timeout for {user.display_name}: {old_timeout}m → {timeout}m")
 
@@ -240,22 +459,10 @@ class FunCog(commands.Cog):
 
     @fun_group.command(name="toggle_engage", description="🔥 Toggle argument mode for a user (Admin only)")
     @app_commands.describe(user="The targeted user")
+    @admin_guarded()
     async def toggle_engage(self, interaction: discord.Interaction, user: discord.Member):
         """Toggle whether Harry will argue back if they respond"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
-        if not interaction.guild_id:
-            await interaction.response.send_message("❌ This command only works in a server!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
+        guild_targets = self._targets_for_guild_ro(interaction.guild_id)
         if user.id not in guild_targets:
             await interaction.response.send_message(
                 f"❌ {user.display_name} isn't being targeted in this server! Use `/fun target` first.",
@@ -265,10 +472,10 @@ class FunCog(commands.Cog):
 
         # Toggle engage mode
         target_info = guild_targets[user.id]
-        old_state = target_info.get('engage', False)
+        old_state = target_info.engage
         new_state = not old_state
-        target_info['engage'] = new_state
-        target_info['argument_count'] = 0  # Reset counter when toggling
+        target_info.engage = new_state
+        target_info.argument_count = 0  # Reset counter when toggling
 
         logger.info(f"🔥 {interaction.user.display_name} toggled engage mode for {user.display_name}: {old_state} → {new_state}")
 
@@ -281,26 +488,14 @@ class FunCog(commands.Cog):
                        f"{'Harry will now use AI to generate contextual comebacks when they reply!' if new_state else 'Harry will ignore their responses.'}",
             color=0xff0000 if new_state else 0x808080
         )
-        embed.set_footer(text="Argument counter reset to 0 | Max 5 arguments per user")
+        embed.set_footer(text=f"Argument counter reset to 0 | Max {MAX_ARGUMENTS} arguments per user")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @fun_group.command(name="status", description="📋 Check trolling status (Admin only)")
+    @admin_guarded()
     async def status(self, interaction: discord.Interaction):
         """View all currently targeted users"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
-        if not interaction.guild_id:
-            await interaction.response.send_message("❌ This command only works in a server!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
+        guild_targets = self._targets_for_guild_ro(interaction.guild_id)
         if not guild_targets:
             embed = discord.Embed(
                 title="📋 Trolling Status",
@@ -308,35 +503,33 @@ class FunCog(commands.Cog):
                 color=Colors.WARNING
             )
         else:
+            now = asyncio.get_running_loop().time()
+            lines = [f"Currently trolling **{len(guild_targets)}** user(s) in this server:"]
+            length = len(lines[0])
+            for shown, info in enumerate(guild_targets.values()):
+                if info.last_triggered is None:
+                    last_text, time_until = "never", 0
+                else:
+                    time_since = int(now - info.last_triggered) // 60
+                    last_text, time_until = f"{time_since}m ago", max(0, info.timeout - time_since)
+                engage_status = "🔥 ON" if info.engage else "💤 OFF"
+                line = (
+                    f"\n🎯 **{info.target_name}** (by {info.enabled_by_name})\n"
+                    f"⏱️ {info.timeout}m timeout · 🕐 {last_text} · ⏳ next in {time_until}m · "
+                    f"Engage {engage_status} · 💬 {info.argument_count}/{MAX_ARGUMENTS}"
+                )
+                length += len(line) + 1
+                if length > STATUS_DESCRIPTION_LIMIT:
+                    lines.append(f"\n…and {len(guild_targets) - shown} more")
+                    break
+                lines.append(line)
+
             embed = discord.Embed(
                 title="📋 Active Targets (this server)",
-                description=f"Currently trolling **{len(guild_targets)}** user(s) in this server:",
+                description="\n".join(lines),
                 color=0xff6b6b
             )
 
-            for user_id, info in guild_targets.items():
-                # Calculate time since last message
-                time_since = int((time.time() - info['last_triggered']) / 60)
-                time_until = max(0, info['timeout'] - time_since)
-
-                engage_status = "🔥 ON" if info.get('engage') else "💤 OFF"
-                arg_count = info.get('argument_count', 0)
-
-                status_text = (
-                    f"⏱️ **Timeout:** {info['timeout']} minutes\n"
-                    f"🕐 **Last triggered:** {time_since}m ago\n"
-                    f"⏳ **Next available:** {time_until}m\n"
-                    f"🔥 **Engage mode:** {engage_status}\n"
-                    f"💬 **Arguments:** {arg_count}/5\n"
-                    f"👤 **Enabled by:** {info.get('enabled_by_name', 'Unknown')}"
-                )
-
-                embed.add_field(
-                    name=f"🎯 {info['target_name']}",
-                    value=status_text,
-                    inline=False
-                )
-
         embed.set_footer(text="Targeting is per-server only | Harry's Secret Trolling System")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -346,6 +539,7 @@ class FunCog(commands.Cog):
         timeout="Minutes between messages (default: 30)",
         engage="Should Harry argue back if they respond? (default: True)"
     )
+    @admin_guarded(defer=True)
     async def target_all(
         self,
         interaction: discord.Interaction,
@@ -354,54 +548,59 @@ class FunCog(commands.Cog):
         engage: bool = True
     ):
         """Enable trolling for multiple users at once"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
         # Validation
         if timeout < 1 or timeout > 1440:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ Timeout must be between 1 and 1440 minutes (24 hours)!",
                 ephemeral=True
             )
             return
 
         # Parse mentions from the string
-        mention_pattern = r'<@!?(\d+)>'
-        user_ids = re.findall(mention_pattern, users)
+        user_ids = [int(m) for m in MENTION_RE.findall(users)]
 
         if not user_ids:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ No valid user mentions found!\n\n"
                 "**Usage:** `/fun target_all users:@user1 @user2 @user3 timeout:30`",
                 ephemeral=True
             )
             return
 
-        # Get guild members
-        if not interaction.guild:
-            await interaction.response.send_message("❌ This command only works in servers!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
-
         # Add all mentioned users (this server only)
+        new_targets: Dict[int, TargetInfo] = {}
         added = []
         skipped = []
 
-        for user_id_str in user_ids:
-            user_id = int(user_id_str)
-
-            # Try to get member
-            try:
-                member = await interaction.guild.fetch_member(user_id)
-            except Exception:
-                skipped.append(f"<@{user_id}> (not found)")
+        # Cached members cost nothing; fetch the rest concurrently instead of one round-trip at a time
+        guild = interaction.guild
+        members = {user_id: guild.get_member(user_id) for user_id in dict.fromkeys(user_ids)}
+        missing = [user_id for user_id, member in members.items() if member is None]
+        timed_out = set()
+        if missing:
+            # Each fetch gets its own budget so one slow lookup can't hold up the followup
+            fetched = await asyncio.gather(
+                *(asyncio.wait_for(guild.fetch_member(user_id), timeout=FETCH_MEMBER_TIMEOUT)
+                  for user_id in missing),
+                return_exceptions=True
+            )
+            for user_id, result in zip(missing, fetched):
+                # NotFound/Forbidden are HTTPExceptions; anything else (incl. cancellation) must propagate
+                if isinstance(result, asyncio.TimeoutError):
+                    logger.debug(f"🎯 Timed out fetching member {user_id}")
+                    timed_out.add(user_id)
+                    result = None
+                elif isinstance(result, discord.HTTPException):
+                    logger.debug(f"🎯 Couldn't fetch member {user_id}: {type(result).__name__}")
+                    result = None
+                elif isinstance(result, BaseException):
+                    raise result
+                members[user_id] = result
+
+        for user_id, member in members.items():
+            if member is None:
+                reason = "timeout" if user_id in timed_out else "not found"
+                skipped.append(f"<@{user_id}> ({reason})")
                 continue
 
             # Skip bots
@@ -409,26 +608,26 @@ class FunCog(commands.Cog):
                 skipped.append(f"{member.display_name} (bot)")
                 continue
 
-            guild_targets[user_id] = {
-                'timeout': timeout,
-                'last_triggered': 0,
-                'target_name': member.display_name,
-                'enabled_by': interaction.user.id,
-                'enabled_by_name': interaction.user.display_name,
-                'engage': engage,
-                'argument_count': 0
-            }
+            new_targets[user_id] = TargetInfo(
+                timeout=timeout,
+                target_name=member.display_name,
+                enabled_by=interaction.user.id,
+                enabled_by_name=interaction.user.display_name,
+                engage=engage,
+            )
             added.append(member.display_name)
 
         # Build response
         if not added:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ No users were added!\n\n" +
                 (f"**Skipped:** {', '.join(skipped)}" if skipped else ""),
                 ephemeral=True
             )
             return
 
+        self._targets_for_guild_rw(interaction.guild_id).update(new_targets)
+        self._attach_listener()
         logger.info(f"🎯 {interaction.user.display_name} enabled trolling for {len(added)} users (timeout: {timeout}m, engage: {engage})")
 
         engage_text = "🔥 **Engage mode: ON** - Harry will argue if they respond!" if engage else "💤 **Engage mode: OFF**"
@@ -456,21 +655,13 @@ class FunCog(commands.Cog):
             )
 
         embed.set_footer(text="Use /fun toggle_engage to disable | /fun untarget to stop")
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @fun_group.command(name="roast", description="🔥 Roast a user immediately (Admin only)")
     @app_commands.describe(user="The user to roast")
+    @admin_guarded()
     async def roast(self, interaction: discord.Interaction, user: discord.Member):
         """Roast a user immediately"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
         if user.bot:
             await interaction.response.send_message("❌ I don't roast my own kind, mate!", ephemeral=True)
             return
@@ -481,10 +672,8 @@ class FunCog(commands.Cog):
         try:
             if self.ai_assistant:
                 # Use AI for a fresh roast
-                prompt = f"""Generate a short, brutal, British slang-heavy roast for {user.display_name}.
-Make it vulgar, offensive, and funny. Max 2 sentences. End with an emoji.
-Do NOT start with "Oh," or "Look," - start directly with the roast."""
-                
+                prompt = _ROAST_PROMPT.format(user_name=user.display_name)
+
                 insult = await self.ai_assistant.ask_question(prompt, include_charter=False)
                 
                 # Mention them at the start if not included
@@ -501,29 +690,18 @@ Do NOT start with "Oh," or "Look," - start directly with the roast."""
             await interaction.followup.send(self._generate_dynamic_insult(user.mention))
 
     @fun_group.command(name="untarget_all", description="🛑 Stop trolling ALL users (Admin only)")
+    @admin_guarded()
     async def untarget_all(self, interaction: discord.Interaction):
         """Disable trolling for all users at once"""
-        # Check for duplicate interactions
-        if self._is_duplicate_interaction(interaction):
-            return
-
-        # Admin check
-        if not self.admin_manager or not self.admin_manager.is_admin(interaction.user, interaction):
-            await interaction.response.send_message("❌ Nice try, but no.", ephemeral=True)
-            return
-
-        if not interaction.guild_id:
-            await interaction.response.send_message("❌ This command only works in a server!", ephemeral=True)
-            return
-
-        guild_targets = self._targets_for_guild(interaction.guild_id)
+        guild_targets = self._targets_for_guild_ro(interaction.guild_id)
         if not guild_targets:
             await interaction.response.send_message("❌ No active targets in this server to remove!", ephemeral=True)
             return
 
         count = len(guild_targets)
-        target_names = [info['target_name'] for info in guild_targets.values()]
+        target_names = [info.target_name for info in guild_targets.values()]
         guild_targets.clear()
+        self._detach_if_idle()
 
         logger.info(f"🛑 {interaction.user.display_name} disabled trolling for all {count} users")
 
@@ -543,194 +721,141 @@ Do NOT start with "Oh," or "Look," - start directly with the roast."""
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Listen for messages from targeted users and handle both trolling and arguments"""
-        # Ignore bots
-        if message.author.bot:
+        # Nobody targeted anywhere - the common case, bail before any other lookups
+        if not self.targets:
             return
 
-        # Only act in servers (not DMs)
-        if not message.guild:
+        # Ignore bots and DMs
+        if message.author.bot or not message.guild:
             return
 
-        guild_targets = self._targets_for_guild(message.guild.id)
+        # Nobody targeted in this server - replies can only matter for a live target here too
+        guild_targets = self.targets.get(message.guild.id)
+        if not guild_targets:
+            return
 
         # PRIORITY 1: Check if this is a reply to Harry's troll message (argument mode)
-        if message.reference and message.reference.message_id:
-            await self._handle_argument_reply(message, guild_targets)
+        ref = message.reference
+        if ref is not None and ref.message_id:
+            if ref.message_id in self.troll_messages:
+                await self._handle_argument_reply(message, guild_targets)
             return  # Don't process as regular message if it's a reply
 
-        # PRIORITY 1.5: Targeted user said "Harry" or @mentioned Harry → respond EVERY time (no timeout)
-        bot_mentioned = self.bot.user in message.mentions
-        message_lower = (message.content or "").lower()
-        said_harry = "harry" in message_lower
+        target_info = guild_targets.get(message.author.id)
+        if target_info is None:
+            return
 
-        if message.author.id in guild_targets and (bot_mentioned or said_harry):
-            target_info = guild_targets[message.author.id]
+        # PRIORITY 1.5: Targeted user said "Harry" or @mentioned Harry → respond EVERY time (no timeout)
+        content = message.content or ""
+        if self.bot.user in message.mentions or _HARRY_RE.search(content):
             try:
                 insult = self._generate_dynamic_insult(message.author.mention)
                 sent_message = await message.channel.send(insult)
-                if target_info.get('engage'):
-                    self.troll_messages[sent_message.id] = (message.guild.id, message.author.id)
+                if target_info.engage:
+                    self._remember_troll(sent_message.id, message.guild.id, message.author.id)
                 logger.info(f"🎭 Harry responded to mention from {message.author.display_name} (no timeout)")
             except Exception as e:
                 logger.error(f"❌ Failed to send mention response: {e}")
             return
 
         # PRIORITY 1.6: Targeted user insulting (other keywords) + engage mode → argument with limit
-        if message.author.id in guild_targets:
-            target_info = guild_targets[message.author.id]
-            if target_info.get('engage'):
-                insult_keywords = ['fuck', 'shit', 'bot', 'ass', 'damn', 'hell', 'stupid', 'dumb', 'suck']
-                has_insult = any(k in message_lower for k in insult_keywords)
-                if has_insult and target_info.get('argument_count', 0) < 5:
-                    await self._handle_direct_insult(message, target_info)
-                    return
+        if target_info.engage:
+            has_insult = _INSULT_RE.search(content) is not None
+            if has_insult and target_info.argument_count < MAX_ARGUMENTS:
+                await self._send_comeback(message, target_info, "responded to direct insult from")
+                return
 
         # PRIORITY 2: Organic troll (they just posted) — timeout applies
-        if message.author.id not in guild_targets:
+
+        # Monotonic loop clock - no wall-clock syscall per message, immune to clock changes
+        current_time = asyncio.get_running_loop().time()
+        last_triggered = target_info.last_triggered
+        if last_triggered is not None and current_time - last_triggered < target_info.timeout * 60:
             return
 
-        target_info = guild_targets[message.author.id]
+        target_info.last_triggered = current_time
 
-        # REACTION TROLLING (25% chance to react with an emoji)
+        # REACTION TROLLING (25% chance to react with an emoji) - only alongside a troll,
+        # so cooldown chatter doesn't spend reaction API calls
         if random.random() < 0.25:
             try:
-                annoying_emojis = ["💩", "🤡", "👶", "🤢", "🤏", "🤥", "🖕", "🥱", "🚮", "🤨"]
-                await message.add_reaction(random.choice(annoying_emojis))
+                await message.add_reaction(random.choice(_REACTION_EMOJIS))
                 logger.info(f"🎭 Reacted to targeted user {message.author.display_name}")
             except Exception as e:
                 logger.error(f"❌ Failed to add reaction: {e}")
 
-        current_time = time.time()
-        time_since_last = current_time - target_info['last_triggered']
-        timeout_seconds = target_info['timeout'] * 60
-
-        if time_since_last < timeout_seconds:
-            return
-
-        target_info['last_triggered'] = current_time
-
         try:
             troll_message = self._generate_dynamic_insult(message.author.mention)
             sent_message = await message.channel.send(troll_message)
 
-            if target_info.get('engage'):
-                self.troll_messages[sent_message.id] = (message.guild.id, message.author.id)
+            if target_info.engage:
+                self._remember_troll(sent_message.id, message.guild.id, message.author.id)
             logger.info(f"🎭 Organic troll: {message.author.display_name} in #{message.channel.name}")
 
-            if len(self.troll_messages) > 100:
-                oldest_keys = list(self.troll_messages.keys())[:50]
-                for key in oldest_keys:
-                    del self.troll_messages[key]
-                logger.debug(f"🧹 Cleaned up {len(oldest_keys)} old troll message IDs")
-
         except Exception as e:
             logger.error(f"❌ Failed to send troll message: {e}")
 
-    async def _handle_direct_insult(self, message: discord.Message, target_info: Dict):
-        """Handle when targeted user insults Harry directly (not a reply)"""
+    async def _send_comeback(self, message: discord.Message, target_info: TargetInfo, action: str):
+        """Answer a targeted user (AI if available), bump their argument count and log `Harry <action> <name>`"""
+        name = message.author.display_name
         try:
-            their_message = message.content
-
-            # Use AI if available
-            if self.ai_assistant:
-                comeback = await self._generate_ai_comeback(their_message, message.author.display_name)
+            # Use AI if available - but while one comeback is still generating, rapid-fire replies get a canned one
+            if self.ai_assistant and not target_info.ai_lock.locked():
+                async with target_info.ai_lock:
+                    comeback = await self._generate_ai_comeback(message.content, name)
             else:
                 # Fallback: Use predefined comebacks
-                comeback = self._get_fallback_comeback(their_message)
+                comeback = self._get_fallback_comeback(message.content)
 
             await message.channel.send(comeback)
 
-            # Increment argument counter
-            target_info['argument_count'] = target_info.get('argument_count', 0) + 1
-
-            logger.info(f"🔥 Harry responded to direct insult from {message.author.display_name} (count: {target_info['argument_count']})")
+            # Increment on the record itself - another reply may have bumped it while we awaited
+            target_info.argument_count += 1
+            logger.info(f"🔥 Harry {action} {name} (count: {target_info.argument_count})")
 
         except Exception as e:
-            logger.error(f"❌ Failed to respond to insult: {e}")
+            logger.error(f"❌ Failed to send comeback to {name}: {e}")
 
-    async def _handle_argument_reply(self, message: discord.Message, guild_targets: Dict[int, Dict]):
+    async def _handle_argument_reply(self, message: discord.Message, guild_targets: Dict[int, TargetInfo]):
         """Handle replies to Harry's troll messages (argument mode). guild_targets is for message.guild."""
-        replied_to_id = message.reference.message_id
-
         # Check if they replied to a troll message
-        if replied_to_id not in self.troll_messages:
+        stored = self.troll_messages.get(message.reference.message_id)
+        if stored is None:
             return
 
-        stored_guild_id, target_user_id = self.troll_messages[replied_to_id]
-
-        # Only count replies in the same server where we sent the troll
-        if message.guild.id != stored_guild_id:
-            return
+        stored_guild_id, target_user_id = stored
 
-        # Verify the replier is the targeted user
-        if message.author.id != target_user_id:
+        # Only count replies in the same server, from the targeted user
+        if message.guild.id != stored_guild_id or message.author.id != target_user_id:
             return
 
         # Check if engage mode is on for this user (in this server)
-        if target_user_id not in guild_targets:
-            return
-
-        target_info = guild_targets[target_user_id]
-        if not target_info.get('engage'):
+        target_info = guild_targets.get(target_user_id)
+        if target_info is None or not target_info.engage:
             return
 
-        # Limit argument escalation (max 5 back-and-forth)
-        if target_info.get('argument_count', 0) >= 5:
+        # Limit argument escalation (max MAX_ARGUMENTS back-and-forth)
+        if target_info.argument_count >= MAX_ARGUMENTS:
             logger.info(f"🛑 Argument limit reached for {message.author.display_name}")
             return
 
-        # Generate AI comeback if available
-        try:
-            their_message = message.content
-
-            # Use AI if available
-            if self.ai_assistant:
-                comeback = await self._generate_ai_comeback(their_message, message.author.display_name)
-            else:
-                # Fallback: Use predefined comebacks
-                comeback = self._get_fallback_comeback(their_message)
-
-            await message.channel.send(comeback)
-
-            # Increment argument counter
-            target_info['argument_count'] = target_info.get('argument_count', 0) + 1
-
-            logger.info(f"🔥 Harry argued back with {message.author.display_name} (count: {target_info['argument_count']})")
-
-        except Exception as e:
-            logger.error(f"❌ Failed to generate comeback: {e}")
+        await self._send_comeback(message, target_info, "argued back with")
 
     async def _generate_ai_comeback(self, user_message: str, user_name: str) -> str:
         """Generate contextual AI comeback"""
         try:
-            prompt = f"""You are Harry, an extremely vulgar and rude British football bot who just told {user_name} "Fuck you" and they responded with: "{user_message}"
-
-Generate a SHORT, BRUTAL comeback that:
-- Is EXTREMELY rude and vulgar (use fuck, shit, cunt, wanker, bellend, twat, etc. liberally)
-- Is British slang-heavy (mate, ya muppet, bollocks, piss off, sod off, etc.)
-- References what they said and roasts them for it
-- Is deliberately offensive and insulting
-- Is 1-2 sentences max
-- Ends with an emoji
-
-Example comebacks:
-- "Oh fuck off, you whiny little bitch. Nobody gives a shit about your feelings, mate. 🖕"
-- "Cry harder, you absolute bellend! 😂"
-- "Listen here you fucking muppet, your opinion is worth less than dog shit. 💩"
-- "What a load of bollocks! Shut your fucking mouth, wanker. 🤐"
-- "You're dumber than a bag of fucking rocks, mate. 💀"
-
-Your BRUTAL comeback (max 200 chars):"""
+            prompt = _COMEBACK_PROMPT.format(
+                user_name=user_name, user_message=user_message, max_chars=COMEBACK_MAX_CHARS
+            )
 
             # Use AI to generate response
             response = await self.ai_assistant.ask_question(prompt, include_charter=False)
 
             # Trim if too long
-            if len(response) > 200:
-                response = response[:197] + "..."
+            if len(response) > COMEBACK_MAX_CHARS:
+                response = response[:COMEBACK_MAX_CHARS - len(TRUNCATION_SUFFIX)] + TRUNCATION_SUFFIX
 
             return response
 
@@ -740,84 +865,21 @@ Your BRUTAL comeback (max 200 chars):"""
 
     def _generate_dynamic_insult(self, mention: str) -> str:
         """Generate a random insult from phrases + swear words + objects (new combo each time)."""
-        phrases = [
-            "Fuck you", "Oi", "Look at this", "Absolute", "What a", "You're a",
-            "Shut your face", "Piss off", "Sod off", "Get lost", "Hey", "Oh look",
-            "Listen here", "Cry more", "Try harder", "Fuck off", "Yeah right",
-            "You absolute", "Check out this", "State of this", "Imagine being a",
-            "Holy shit it's", "Everybody look at", "Christ alive,", "Do one",
-            "Get stuffed", "Jog on", "Wind your neck in",
-        ]
-        swears = [
-            "fucking", "shit", "bloody", "sodding", "goddamn", "damn",
-            "wank", "bellend", "twat", "muppet", "pillock", "plonker",
-            "cockwomble", "thundercunt", "shitgibbon", "spunkbubble",
-            "fudgepacking", "tosspot", "numpty", "minging", "gormless",
-            "clapped", "noncey", "daft", "useless",
-        ]
-        objects = [
-            "muppet", "donut", "pillock", "waste of space", "chocolate teapot",
-            "bag of rocks", "wet wipe", "absolute weapon", "wanker", "bellend",
-            "twat", "plonker", "numpty", "melon", "div",
-            "knobhead", "dickhead", "tosser", "berk", "prat",
-            "nincompoop", "dipstick", "ninny", "wazzock",
-            "broken condom", "failed abortion", "inbred cabbage",
-            "sentient wank sock", "moldy cum rag", "village idiot",
-            "oxygen thief", "damp towel", "ham sandwich", "window licker",
-            "mouth breather", "fart in a jar", "stale biscuit",
-        ]
-        emojis = ["🖕", "💩", "🤬", "😈", "😂", "🗑️", "🔥", "🤡", "🤢", "🤏", "💀"]
-
-        p = random.choice(phrases)
-        s = random.choice(swears)
-        o = random.choice(objects)
-        e = random.choice(emojis)
-
         # Avoid "Fuck you you" when mention is "you" (used for comebacks)
-        if mention.strip().lower() == "you":
-            templates = [
-                f"{p}, you {s} {o}! {e}",
-                f"You're a {s} {o}. {p}! {e}",
-                f"What a {s} {o}. {p}! {e}",
-                f"Oi! You {s} {o}. {p}! {e}",
-                f"Look at you, the {s} {o}. {e}",
-                f"{p} you {s} {o}! {e}",
-            ]
-        else:
-            templates = [
-                f"{p} {mention}, you {s} {o}! {e}",
-                f"{mention} {p} you {s} {o}! {e}",
-                f"Oi {mention}! You're a {s} {o}. {e}",
-                f"{p} {mention}. What a {s} {o}! {e}",
-                f"Look at {mention}, the {s} {o}. {e}",
-                f"{p} you {s} {o}, {mention}! {e}",
-                f"{mention} — you {s} {o}. {p}! {e}",
-                f"What a {s} {o}. {p} {mention}! {e}",
-            ]
-        return random.choice(templates)
+        templates = _YOU_TEMPLATES if mention.strip().lower() == "you" else _MENTION_TEMPLATES
+        return random.choice(templates).format(
+            p=random.choice(_INSULT_PHRASES),
+            s=random.choice(_INSULT_SWEARS),
+            o=random.choice(_INSULT_OBJECTS),
+            e=random.choice(_INSULT_EMOJIS),
+            m=mention,
+        )
 
     def _get_fallback_comeback(self, user_message: str) -> str:
         """Fallback comeback if AI isn't available; 50% dynamic insult, 50% fixed."""
         if random.random() < 0.5:
             return self._generate_dynamic_insult("you")
-        fallbacks = [
-            "Oh fuck off, you whiny little bitch. 🖕",
-            "Cry more, you absolute bellend! 😂",
-            "Listen here you fucking muppet, shut your mouth. 🤐",
-            "What a load of bollocks! Piss off, wanker! 💩",
-            "You're dumber than a bag of fucking rocks, mate. 💀",
-            "Aww, did I hurt your feelings? Fucking good! 😈",
-            "You're a proper twat, aren't ya? 🎯",
-            "Is that the best you've got, you useless cunt? 😴",
-            "Mate, you're an embarrassment. Sod off! 🔥",
-            "Oh no, are you gonna cry now? Fucking pathetic! 😭",
-            "Try harder, that was shit! 💩",
-            "You're about as useful as a chocolate teapot, ya muppet! 🍫",
-            "Shut your fucking gob before I do it for you! 🤬",
-            "You talk a lot of shite for someone so fucking stupid! 🗑️",
-            "Get absolutely fucked, you wanker! 🖕",
-        ]
-        return random.choice(fallbacks)
+        return random.choice(FALLBACK_COMEBACKS)
 
 
 async def setup(bot: commands.Bot):
@@ -893,7 +893,7 @@ class RecruitingCog(commands.Cog):
             return
 
         server_config.set_recruiting_source(guild_id, source)
-        await server_config.save_to_discord()
+        server_config.mark_dirty(guild_id)
 
         source_name = "On3/Rivals" if source == RecruitingSource.ON3 else "247Sports Composite"
 
@@ -9,21 +9,36 @@ Tracks response times and performance for all commands:
 - Error rates
 """
 
+import heapq
 import logging
 import time
-from collections import defaultdict
-from typing import Dict, Optional
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional
 from functools import wraps
+from operator import itemgetter
 
 logger = logging.getLogger('CFB26Bot.Metrics')
 
+# Recent execution times kept per command (aggregates cover all calls)
+COMMAND_TIMES_WINDOW = 1000
+
 
 class PerformanceMetrics:
     """Track command performance metrics"""
     
+    __slots__ = (
+        '_command_times', '_total_times', '_min_times', '_max_times',
+        '_command_counts', '_error_counts', '_cache_hits', '_cache_misses', '_start_time',
+    )
+    
     def __init__(self):
-        # Command timing (command_name -> list of execution times)
-        self._command_times: Dict[str, list] = defaultdict(list)
+        # Command timing (command_name -> most recent execution times, bounded)
+        self._command_times: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=COMMAND_TIMES_WINDOW))
+        
+        # Running timing aggregates so stats don't rescan the samples
+        self._total_times: Dict[str, float] = defaultdict(float)
+        self._min_times: Dict[str, float] = {}
+        self._max_times: Dict[str, float] = {}
         
         # Command counts
         self._command_counts: Dict[str, int] = defaultdict(int)
@@ -48,6 +63,11 @@ class PerformanceMetrics:
         """
         self._command_times[command_name].append(execution_time)
         self._command_counts[command_name] += 1
+        self._total_times[command_name] += execution_time
+        if execution_time < self._min_times.get(command_name, float('inf')):
+            self._min_times[command_name] = execution_time
+        if execution_time > self._max_times.get(command_name, float('-inf')):
+            self._max_times[command_name] = execution_time
         
         # Log slow commands (>5s)
         if execution_time > 5.0:
@@ -75,14 +95,15 @@ class PerformanceMetrics:
         if command_name not in self._command_times:
             return None
         
-        times = self._command_times[command_name]
+        count = self._command_counts[command_name]
+        error_count = self._error_counts.get(command_name, 0)
         return {
-            'count': self._command_counts[command_name],
-            'avg_time': sum(times) / len(times),
-            'min_time': min(times),
-            'max_time': max(times),
-            'error_count': self._error_counts.get(command_name, 0),
-            'error_rate': self._error_counts.get(command_name, 0) / self._command_counts[command_name]
+            'count': count,
+            'avg_time': self._total_times[command_name] / count,
+            'min_time': self._min_times[command_name],
+            'max_time': self._max_times[command_name],
+            'error_count': error_count,
+            'error_rate': error_count / count
         }
     
     def get_all_stats(self) -> Dict:
@@ -104,14 +125,13 @@ class PerformanceMetrics:
     
     def get_slowest_commands(self, limit: int = 5) -> list:
         """Get the slowest commands by average time"""
-        command_avgs = []
-        for command_name, times in self._command_times.items():
-            if times:
-                avg = sum(times) / len(times)
-                command_avgs.append((command_name, avg, len(times)))
-        
-        command_avgs.sort(key=lambda x: x[1], reverse=True)
-        return command_avgs[:limit]
+        command_avgs = (
+            (command_name, self._total_times[command_name] / count, count)
+            for command_name, count in self._command_counts.items()
+            if count
+        )
+        # Partial selection - no need to sort every tracked command
+        return heapq.nlargest(limit, command_avgs, key=itemgetter(1))
     
     def log_summary(self):
         """Log a summary of performance metrics"""
@@ -154,14 +174,14 @@ def track_performance(command_name: str = None):
             # Auto-detect command name from function if not provided
             cmd_name = command_name or func.__name__
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 _metrics.record_command(cmd_name, execution_time)
                 return result
             except Exception as e:
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 _metrics.record_command(cmd_name, execution_time)
                 _metrics.record_error(cmd_name)
                 raise
@@ -11,14 +11,73 @@ Provides centralized error tracking and monitoring:
 
 import logging
 import os
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger('CFB26Bot.Sentry')
 
-# Global Sentry client
+# Global Sentry client. _sentry_enabled is only set True together with
+# _sentry_sdk, so the capture helpers gate on the flag alone.
 _sentry_sdk = None
 _sentry_enabled = False
 
+# Trace sampling: skip health checks, sample slash commands a bit higher
+COMMAND_TRACES_SAMPLE_RATE = 0.05
+DEFAULT_TRACES_SAMPLE_RATE = 0.02
+
+
+def _make_traces_sampler(base_rate: float):
+    """Build a per-transaction sampler with base_rate for non-command traffic"""
+    def traces_sampler(sampling_context: dict) -> float:
+        # Keep distributed traces consistent with the upstream decision
+        parent_sampled = sampling_context.get('parent_sampled')
+        if parent_sampled is not None:
+            return float(parent_sampled)
+
+        name = (sampling_context.get('transaction_context') or {}).get('name') or ''
+        if 'health' in name or 'ping' in name:
+            return 0.0
+        if name.startswith('/cfb'):
+            return COMMAND_TRACES_SAMPLE_RATE
+        return base_rate
+
+    return traces_sampler
+
+
+# Transport backpressure: drop new events rather than serialize them on the
+# event loop while the send queue is backed up, and bound the flush on exit
+SENTRY_MAX_QUEUED_EVENTS = 30
+SENTRY_SHUTDOWN_TIMEOUT = 2
+
+
+def _transport_backlog() -> int:
+    """Events waiting in the Sentry transport queue (0 if the SDK internals can't be read)"""
+    try:
+        if hasattr(_sentry_sdk, 'get_client'):
+            client = _sentry_sdk.get_client()
+        else:
+            client = _sentry_sdk.Hub.current.client
+        return int(client.transport._worker._queue.qsize())
+    except Exception:
+        return 0
+
+
+def _before_send(event: dict, hint: dict) -> Optional[dict]:
+    """Drop events while the transport is backed up"""
+    if _transport_backlog() > SENTRY_MAX_QUEUED_EVENTS:
+        return None
+    return event
+
+
+@lru_cache(maxsize=1)
+def _get_release_version() -> str:
+    """Release string for Sentry, resolved once (skipped entirely when Sentry is off)"""
+    try:
+        from ..utils.version_manager import CURRENT_VERSION
+        return CURRENT_VERSION
+    except Exception:
+        return "unknown"
+
 
 def init_sentry():
     """Initialize Sentry error tracking"""
@@ -35,19 +94,24 @@ def init_sentry():
         from sentry_sdk.integrations.logging import LoggingIntegration
         from sentry_sdk.integrations.aiohttp import AioHttpIntegration
         
-        # Get version info
-        try:
-            from ..utils.version_manager import VersionManager
-            version_mgr = VersionManager()
-            release_version = version_mgr.get_current_version()
-        except Exception:
-            release_version = "unknown"
+        release_version = _get_release_version()
         
         # Configure logging integration
         logging_integration = LoggingIntegration(
-            level=logging.INFO,  # Capture info and above as breadcrumbs
+            level=logging.WARNING,  # Breadcrumbs for warnings and above (INFO is too chatty)
             event_level=logging.ERROR  # Send errors as events
         )
+        integrations = [
+            logging_integration,
+            AioHttpIntegration(),
+        ]
+
+        # Capture exceptions and spans from background asyncio tasks (older SDKs lack it)
+        try:
+            from sentry_sdk.integrations.asyncio import AsyncioIntegration
+            integrations.append(AsyncioIntegration())
+        except ImportError:
+            logger.info("ℹ️ Sentry AsyncioIntegration unavailable - upgrade sentry-sdk for task coverage")
         
         sentry_sdk.init(
             dsn=sentry_dsn,
@@ -55,20 +119,23 @@ def init_sentry():
             release=f"cfb-rules-bot@{release_version}",
             
             # Integrations
-            integrations=[
-                logging_integration,
-                AioHttpIntegration(),
-            ],
+            integrations=integrations,
             
             # Performance monitoring
-            traces_sample_rate=float(os.getenv('SENTRY_TRACES_SAMPLE_RATE', '0.1')),  # 10% of transactions
+            traces_sampler=_make_traces_sampler(
+                float(os.getenv('SENTRY_TRACES_SAMPLE_RATE', str(DEFAULT_TRACES_SAMPLE_RATE)))
+            ),
             
             # Error sampling
             sample_rate=1.0,  # Capture all errors
             
             # Additional options
-            attach_stacktrace=True,
+            attach_stacktrace=os.getenv('SENTRY_ATTACH_STACKTRACE', 'false').lower() == 'true',
+            max_breadcrumbs=30,
+            max_request_body_size="never",
             send_default_pii=False,  # Don't send PII by default
+            before_send=_before_send,
+            shutdown_timeout=SENTRY_SHUTDOWN_TIMEOUT,
         )
         
         _sentry_sdk = sentry_sdk
@@ -93,14 +160,13 @@ def capture_exception(exception: Exception, context: dict = None):
         exception: The exception to capture
         context: Additional context dict
     """
-    if not _sentry_enabled or not _sentry_sdk:
+    if not _sentry_enabled:
         return
     
     try:
         if context:
             with _sentry_sdk.push_scope() as scope:
-                for key, value in context.items():
-                    scope.set_context(key, value)
+                scope.set_context("extra", context)
                 _sentry_sdk.capture_exception(exception)
         else:
             _sentry_sdk.capture_exception(exception)
@@ -117,14 +183,13 @@ def capture_message(message: str, level: str = "info", context: dict = None):
         level: Message level (debug, info, warning, error, fatal)
         context: Additional context dict
     """
-    if not _sentry_enabled or not _sentry_sdk:
+    if not _sentry_enabled:
         return
     
     try:
         if context:
             with _sentry_sdk.push_scope() as scope:
-                for key, value in context.items():
-                    scope.set_context(key, value)
+                scope.set_context("extra", context)
                 _sentry_sdk.capture_message(message, level=level)
         else:
             _sentry_sdk.capture_message(message, level=level)
@@ -140,7 +205,7 @@ def set_user_context(user_id: str, username: str = None):
         user_id: Discord user ID
         username: Discord username (optional)
     """
-    if not _sentry_enabled or not _sentry_sdk:
+    if not _sentry_enabled:
         return
     
     try:
@@ -160,7 +225,7 @@ def set_tag(key: str, value: str):
         key: Tag key
         value: Tag value
     """
-    if not _sentry_enabled or not _sentry_sdk:
+    if not _sentry_enabled:
         return
     
     try:
@@ -169,7 +234,30 @@ def set_tag(key: str, value: str):
         logger.error(f"Failed to set tag: {e}")
 
 
-def start_transaction(name: str, op: str = "function") -> Optional[object]:
+class _NullTransaction:
+    """No-op stand-in for a Sentry transaction so callers can always use 'with'"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_tag(self, *args, **kwargs):
+        pass
+
+    def set_data(self, *args, **kwargs):
+        pass
+
+    def finish(self, *args, **kwargs):
+        pass
+
+
+_NULL_TRANSACTION = _NullTransaction()
+
+
+def start_transaction(name: str, op: str = "function") -> object:
     """
     Start a performance transaction
     
@@ -178,16 +266,17 @@ def start_transaction(name: str, op: str = "function") -> Optional[object]:
         op: Operation type
     
     Returns:
-        Transaction object (use with 'with' statement)
+        Transaction object (use with 'with' statement); a shared no-op
+        transaction when Sentry is disabled or fails
     """
-    if not _sentry_enabled or not _sentry_sdk:
-        return None
+    if not _sentry_enabled:
+        return _NULL_TRANSACTION
     
     try:
         return _sentry_sdk.start_transaction(name=name, op=op)
     except Exception as e:
         logger.error(f"Failed to start transaction: {e}")
-        return None
+        return _NULL_TRANSACTION
 
 
 # Example usage:
@@ -17,7 +17,8 @@ HTTP_READ_TIMEOUT = 30  # Read timeout
 
 # API Rate Limiting
 API_RETRY_ATTEMPTS = 3  # Number of retries for failed API calls
-API_RETRY_BACKOFF = 2  # Exponential backoff multiplier (2^attempt seconds)
+API_RETRY_BACKOFF = 2  # Base retry delay in seconds (jittered backoff grows from here)
+API_RETRY_MAX_DELAY = 60  # Cap on any single retry wait
 
 # Input Validation
 MAX_INPUT_LENGTH = 2000  # Maximum characters for user input
@@ -28,7 +29,7 @@ LOG_MESSAGE_TRUNCATE = 100  # Truncate logged messages to this length
 REDACT_PATTERNS = [
     r'http[s]?://[^\s]+',  # URLs
     r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Emails
-    r'(?i)(password|token|key|secret)[\s:=]+[\S]+',  # Secrets
+    r'(?i)(?:password|token|key|secret)[\s:=]{1,8}\S{1,256}',  # Secrets (bounded so matching stays linear)
 ]
 
 # Cache Limits
@@ -43,20 +44,22 @@ DISCORD_COMMAND_COOLDOWN = 3  # Seconds between commands
 MAX_AI_CONTEXT_LENGTH = 8000  # Max tokens for AI context
 MAX_AI_RESPONSE_LENGTH = 1000  # Max tokens for AI response
 
+# Compiled once - sanitize_ai_response runs on every AI reply. One pass covers both:
+# OpenAI-style keys (the sk- class includes '-', so sk-proj-... too) and long
+# token-looking strings (50+ alphanumeric/underscore/dash only - likely keys/tokens)
+_AI_SECRET_RE = re.compile(r'sk-[A-Za-z0-9_-]{20,}|[A-Za-z0-9_-]{50,}')
+# Shortest possible match: 'sk-' plus 20 key characters
+_MIN_SECRET_LEN = 23
+
+
 def sanitize_ai_response(text: str) -> str:
     """Redact any key/token-like content from AI response before sending to users. Call on every AI reply."""
-    if not text or not isinstance(text, str):
+    if not text or not isinstance(text, str) or len(text) < _MIN_SECRET_LEN:
+        return text
+    # Neither pattern can match a short reply without an sk- prefix
+    if len(text) < 50 and 'sk-' not in text:
         return text
-    out = text
-    # OpenAI / generic API key patterns
-    out = re.sub(r'sk-[a-zA-Z0-9_-]{20,}', '[REDACTED]', out)
-    out = re.sub(r'sk-proj-[a-zA-Z0-9_-]{20,}', '[REDACTED]', out)
-    # Long token-looking strings (50+ alphanumeric/underscore/dash only - likely keys/tokens)
-    def replace_long(m):
-        s = m.group(0)
-        return '[REDACTED]' if len(s) >= 50 and re.match(r'^[A-Za-z0-9_-]+$', s) else s
-    out = re.sub(r'[A-Za-z0-9_-]{50,}', replace_long, out)
-    return out
+    return _AI_SECRET_RE.sub('[REDACTED]', text)
 
 # Web Scraping Limits
 MAX_SCRAPE_RETRIES = 2  # Max retries for web scraping
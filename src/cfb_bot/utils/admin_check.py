@@ -16,6 +16,8 @@ class AdminManager:
 
     def __init__(self):
         self.admin_ids: Set[int] = set()
+        # Bumped whenever admin_ids changes so callers can invalidate cached checks
+        self.version = 0
         self._load_admins()
 
     def _load_admins(self):
@@ -50,6 +52,7 @@ class AdminManager:
         if user_id in self.admin_ids:
             return False
         self.admin_ids.add(user_id)
+        self.version += 1
         logger.info(f"✅ Added admin: {user_id}")
         return True
 
@@ -58,6 +61,7 @@ class AdminManager:
         if user_id not in self.admin_ids:
             return False
         self.admin_ids.remove(user_id)
+        self.version += 1
         logger.info(f"✅ Removed admin: {user_id}")
         return True
 
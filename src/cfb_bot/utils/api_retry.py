@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-API Retry Logic with Exponential Backoff
+API Retry Logic with Jittered Exponential Backoff
 
 Handles transient failures gracefully:
 - Network timeouts
@@ -10,31 +10,94 @@ Handles transient failures gracefully:
 
 import asyncio
 import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
 from typing import Callable, Any, Optional
 import aiohttp
 
-from ..security import API_RETRY_ATTEMPTS, API_RETRY_BACKOFF, HTTP_TIMEOUT
+from ..security import API_RETRY_ATTEMPTS, API_RETRY_BACKOFF, API_RETRY_MAX_DELAY, HTTP_TIMEOUT
 
 logger = logging.getLogger('CFB26Bot.APIRetry')
 
+# Shared session so repeated API calls reuse pooled TCP/TLS connections
+_session: Optional[aiohttp.ClientSession] = None
+
 
 class APIRetryError(Exception):
     """Raised when all retry attempts are exhausted"""
     pass
 
 
+async def get_session() -> aiohttp.ClientSession:
+    """Get the shared pooled ClientSession, creating it on first use"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            ),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared ClientSession (call on bot shutdown)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def _next_delay(base: float, prev_delay: float) -> float:
+    """Decorrelated jitter: random wait between base and 3x the previous wait, capped"""
+    return min(API_RETRY_MAX_DELAY, random.uniform(base, prev_delay * 3))
+
+
+def _parse_retry_after(value: Optional[str], default: float) -> float:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds to wait"""
+    if value is None:
+        return default
+    try:
+        return max(0.0, float(int(value)))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return default
+    if retry_at is None:
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _prune_exception_types(types: tuple) -> tuple:
+    """Drop duplicate exception types and ones already covered by a listed base class"""
+    unique = tuple(dict.fromkeys(types))
+    return tuple(
+        t for t in unique
+        if not any(t is not u and issubclass(t, u) for u in unique)
+    )
+
+
 def with_retry(
     max_attempts: int = API_RETRY_ATTEMPTS,
     backoff_factor: float = API_RETRY_BACKOFF,
     retry_on: tuple = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError)
 ):
     """
-    Decorator to add retry logic with exponential backoff to async functions
+    Decorator to add retry logic with jittered exponential backoff to async functions
 
     Args:
         max_attempts: Maximum number of retry attempts
-        backoff_factor: Exponential backoff multiplier (delay = backoff_factor ^ attempt)
+        backoff_factor: Base delay in seconds; each wait is random in [base, 3 * previous wait]
         retry_on: Tuple of exception types to retry on
 
     Usage:
@@ -44,10 +107,13 @@ def with_retry(
                 async with session.get(url) as response:
                     return await response.json()
     """
+    retry_on = _prune_exception_types(retry_on)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
             last_exception = None
+            delay = backoff_factor
 
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -60,9 +126,9 @@ def with_retry(
                         logger.error(f"❌ {func.__name__} failed after {max_attempts} attempts: {e}")
                         raise APIRetryError(f"Failed after {max_attempts} attempts") from e
 
-                    # Calculate backoff delay: 2^attempt seconds (2s, 4s, 8s...)
-                    delay = backoff_factor ** attempt
-                    logger.warning(f"⚠️ {func.__name__} attempt {attempt}/{max_attempts} failed: {e}. Retrying in {delay}s...")
+                    # Jittered so concurrent callers don't retry in lockstep
+                    delay = _next_delay(backoff_factor, delay)
+                    logger.warning(f"⚠️ {func.__name__} attempt {attempt}/{max_attempts} failed: {e}. Retrying in {delay:.1f}s...")
 
                     await asyncio.sleep(delay)
 
@@ -103,11 +169,11 @@ async def fetch_with_retry(
     """
     @with_retry(max_attempts=max_attempts)
     async def _fetch():
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-            async with session.request(method, url, **kwargs) as response:
-                # Raise for 4xx/5xx errors
-                response.raise_for_status()
-                return await response.json()
+        session = await get_session()
+        async with session.request(method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as response:
+            # Raise for 4xx/5xx errors
+            response.raise_for_status()
+            return await response.json()
 
     return await _fetch()
 
@@ -123,8 +189,8 @@ async def fetch_with_rate_limit_handling(
     Fetch data with automatic rate limit (429) handling
 
     If a 429 response is received, this will:
-    1. Check for 'Retry-After' header
-    2. Wait the specified time (or use exponential backoff)
+    1. Check for 'Retry-After' header (seconds or HTTP-date)
+    2. Wait the specified time, capped at API_RETRY_MAX_DELAY (or use exponential backoff)
     3. Retry the request
 
     Args:
@@ -138,27 +204,30 @@ async def fetch_with_rate_limit_handling(
         JSON response as dict
     """
     last_exception = None
+    delay = API_RETRY_BACKOFF
 
     for attempt in range(1, max_attempts + 1):
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-                async with session.request(method, url, **kwargs) as response:
+            session = await get_session()
+            async with session.request(method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as response:
 
-                    # Handle rate limiting
-                    if response.status == 429:
-                        retry_after = response.headers.get('Retry-After', API_RETRY_BACKOFF ** attempt)
-                        retry_after = int(retry_after)
+                # Handle rate limiting
+                if response.status == 429:
+                    retry_after = min(
+                        API_RETRY_MAX_DELAY,
+                        _parse_retry_after(response.headers.get('Retry-After'), API_RETRY_BACKOFF ** attempt),
+                    )
 
-                        if attempt == max_attempts:
-                            raise APIRetryError(f"Rate limited after {max_attempts} attempts")
+                    if attempt == max_attempts:
+                        raise APIRetryError(f"Rate limited after {max_attempts} attempts")
 
-                        logger.warning(f"⏱️ Rate limited. Waiting {retry_after}s before retry {attempt}/{max_attempts}")
-                        await asyncio.sleep(retry_after)
-                        continue
+                    logger.warning(f"⏱️ Rate limited. Waiting {retry_after:.1f}s before retry {attempt}/{max_attempts}")
+                    await asyncio.sleep(retry_after)
+                    continue
 
-                    # Raise for other 4xx/5xx errors
-                    response.raise_for_status()
-                    return await response.json()
+                # Raise for other 4xx/5xx errors
+                response.raise_for_status()
+                return await response.json()
 
         except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as e:
             last_exception = e
@@ -167,8 +236,8 @@ async def fetch_with_rate_limit_handling(
                 logger.error(f"❌ Request to {url} failed after {max_attempts} attempts: {e}")
                 raise APIRetryError(f"Failed after {max_attempts} attempts") from e
 
-            delay = API_RETRY_BACKOFF ** attempt
-            logger.warning(f"⚠️ Request failed (attempt {attempt}/{max_attempts}): {e}. Retrying in {delay}s...")
+            delay = _next_delay(API_RETRY_BACKOFF, delay)
+            logger.warning(f"⚠️ Request failed (attempt {attempt}/{max_attempts}): {e}. Retrying in {delay:.1f}s...")
             await asyncio.sleep(delay)
 
     raise last_exception
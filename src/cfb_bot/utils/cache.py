@@ -67,19 +67,21 @@ class SimpleCache:
             del self._cache[cache_key]
             logger.debug(f"Cache DELETE: {cache_key}")
 
-    def clear(self, namespace: Optional[str] = None):
-        """Clear cache for a namespace or all cache"""
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Clear cache for a namespace or all cache, returning how many entries were removed"""
         if namespace:
             # Clear specific namespace
             keys_to_delete = [k for k in self._cache.keys() if k.startswith(f"{namespace}:")]
             for key in keys_to_delete:
                 del self._cache[key]
             logger.info(f"Cache cleared for namespace: {namespace} ({len(keys_to_delete)} entries)")
-        else:
-            # Clear all
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info(f"Cache cleared completely ({count} entries)")
+            return len(keys_to_delete)
+
+        # Clear all
+        count = len(self._cache)
+        self._cache.clear()
+        logger.info(f"Cache cleared completely ({count} entries)")
+        return count
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -8,12 +8,18 @@ Prevents issues from malicious or overly-long inputs:
 - Safe string handling
 """
 
+import re
 from functools import wraps
 from typing import Any, Callable
-import discord
 
 from ..security import MAX_INPUT_LENGTH
 
+# Discord mentions: <@123456789> or <@!123456789> (\Z so a trailing newline doesn't match)
+_MENTION_RE = re.compile(r'^<@!?\d+>\Z')
+
+# Control characters stripped by sanitize_string in one translate pass (keeps tab, LF, CR)
+_STRIP_TABLE = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
 
 def validate_input_length(max_length: int = MAX_INPUT_LENGTH):
     """
@@ -30,12 +36,8 @@ def validate_input_length(max_length: int = MAX_INPUT_LENGTH):
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Find the interaction object
-            interaction = None
-            for arg in args:
-                if isinstance(arg, discord.Interaction):
-                    interaction = arg
-                    break
+            # Slash command methods are always (self, interaction, ...)
+            interaction = args[1] if len(args) > 1 and hasattr(args[1], 'response') else None
 
             if not interaction:
                 # If no interaction found, just run the function
@@ -72,11 +74,8 @@ def sanitize_string(text: str, max_length: int = MAX_INPUT_LENGTH) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    # Remove null bytes
-    text = text.replace('\x00', '')
-
-    # Trim whitespace
-    text = text.strip()
+    # Remove null bytes and other control characters, then trim whitespace
+    text = text.translate(_STRIP_TABLE).strip()
 
     # Truncate if too long
     if len(text) > max_length:
@@ -121,10 +120,7 @@ def validate_discord_mention(mention: str) -> bool:
     Returns:
         True if valid Discord mention format
     """
-    import re
-    # Discord mentions: <@123456789> or <@!123456789>
-    pattern = r'^<@!?\d+>$'
-    return bool(re.match(pattern, mention))
+    return _MENTION_RE.match(mention) is not None
 
 
 # Example usage in commands:
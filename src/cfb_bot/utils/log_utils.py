@@ -13,7 +13,18 @@ import re
 import logging
 from typing import Any
 
-from .security import LOG_MESSAGE_TRUNCATE, REDACT_PATTERNS
+from ..security import LOG_MESSAGE_TRUNCATE, REDACT_PATTERNS
+
+# All redaction patterns fused into one compiled alternation, so a log line is scanned once.
+# Inline (?i) flags are dropped - they're only legal at the very start - since IGNORECASE covers them.
+_REDACT_UNION = re.compile(
+    "|".join(f"(?:{pattern.replace('(?i)', '')})" for pattern in REDACT_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Substrings one of the patterns needs in order to match: '://' for URLs, '@' for emails,
+# or a secret keyword. Lines with none of them skip the regex entirely.
+_SECRET_WORDS = ('password', 'token', 'key', 'secret')
 
 
 def sanitize_for_log(message: Any) -> str:
@@ -34,9 +45,12 @@ def sanitize_for_log(message: Any) -> str:
     if len(message) > LOG_MESSAGE_TRUNCATE:
         message = message[:LOG_MESSAGE_TRUNCATE] + "... (truncated)"
     
-    # Redact sensitive patterns
-    for pattern in REDACT_PATTERNS:
-        message = re.sub(pattern, '[REDACTED]', message, flags=re.IGNORECASE)
+    # Redact sensitive patterns (most lines have nothing to redact - check cheaply first)
+    if '://' in message or '@' in message:
+        return _REDACT_UNION.sub('[REDACTED]', message)
+    lowered = message.lower()
+    if any(word in lowered for word in _SECRET_WORDS):
+        return _REDACT_UNION.sub('[REDACTED]', message)
     
     return message
 
@@ -25,22 +25,30 @@ class ScheduleManager:
         self._load_schedule()
 
     def _load_schedule(self) -> bool:
-        """Load schedule data from JSON file"""
+        """Load schedule data from JSON file
+
+        The file is parsed and validated into locals first and only then swapped
+        in, so a bad file leaves the previously loaded schedule fully intact.
+        """
         try:
-            if SCHEDULE_FILE.exists():
-                with open(SCHEDULE_FILE, 'r') as f:
-                    self.schedule_data = json.load(f)
-                self.season = self.schedule_data.get('season', 1)
-                self.teams = self.schedule_data.get('teams', [])
-                logger.info(f"✅ Loaded schedule for Season {self.season} ({len(self.teams)} teams)")
-                return True
-            else:
+            if not SCHEDULE_FILE.exists():
                 logger.warning(f"⚠️ Schedule file not found: {SCHEDULE_FILE}")
                 return False
+
+            with open(SCHEDULE_FILE, 'r') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+            season = data.get('season', 1)
+            teams = list(data.get('teams', []))
         except Exception as e:
             logger.error(f"❌ Failed to load schedule: {e}")
             return False
 
+        self.schedule_data, self.season, self.teams = data, season, teams
+        logger.info(f"✅ Loaded schedule for Season {season} ({len(teams)} teams)")
+        return True
+
     def reload_schedule(self) -> bool:
         """Reload schedule data from file"""
         return self._load_schedule()
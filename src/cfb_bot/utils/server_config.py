@@ -8,13 +8,19 @@ Modules:
 - LEAGUE: Timer, advance, charter, rules, league staff, pick commish
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 from enum import Enum
 
 logger = logging.getLogger('CFB26Bot.ServerConfig')
 
+# Quiet period before a batch of mark_dirty() calls is written to storage
+SAVE_DEBOUNCE_SECONDS = 0.5
+# Ceiling for the retry delay while storage keeps rejecting saves
+SAVE_BACKOFF_MAX_SECONDS = 60
+
 
 class FeatureModule(Enum):
     """Available feature modules"""
@@ -157,6 +163,15 @@ class ServerConfigManager:
 
     def __init__(self):
         self._configs: Dict[int, Dict[str, Any]] = {}
+        # Per-guild counter bumped on every mutation (lets callers cache rendered config)
+        self._versions: Dict[int, int] = {}
+        # Guilds with unsaved changes, written by the background flush task
+        self._dirty_guilds: Set[int] = set()
+        self._dirty_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.save_delay = SAVE_DEBOUNCE_SECONDS
+        # Consecutive failed saves; stretches the flush loop's wait, reset on success
+        self._save_failures = 0
         self._bot = None
         self._loaded = False
 
@@ -167,6 +182,14 @@ class ServerConfigManager:
         from .storage import set_storage_bot
         set_storage_bot(bot)
 
+    def version(self, guild_id: int) -> int:
+        """Get the config version for a guild (changes whenever its config is mutated)"""
+        return self._versions.get(guild_id, 0)
+
+    def _bump_version(self, guild_id: int):
+        """Mark a guild's config as changed"""
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+
     def get_config(self, guild_id: int) -> Dict[str, Any]:
         """Get configuration for a guild, creating default if needed"""
         if guild_id not in self._configs:
@@ -209,6 +232,7 @@ class ServerConfigManager:
 
         config = self.get_config(guild_id)
         config["modules"][module.value] = True
+        self._bump_version(guild_id)
         logger.info(f"✅ Enabled {module.value} for guild {guild_id}")
         return True
 
@@ -220,9 +244,21 @@ class ServerConfigManager:
 
         config = self.get_config(guild_id)
         config["modules"][module.value] = False
+        self._bump_version(guild_id)
         logger.info(f"❌ Disabled {module.value} for guild {guild_id}")
         return True
 
+    def set_enabled_modules(self, guild_id: int, modules: Iterable[FeatureModule]):
+        """Enable exactly the given modules for a guild, disabling the rest (CORE stays on)"""
+        enabled = {m.value for m in modules}
+        config = self.get_config(guild_id)
+        config["modules"].update(
+            (mod.value, mod == FeatureModule.CORE or mod.value in enabled)
+            for mod in FeatureModule
+        )
+        self._bump_version(guild_id)
+        logger.info(f"⚙️ Set enabled modules for guild {guild_id}: {sorted(enabled)}")
+
     def get_enabled_modules(self, guild_id: int) -> Set[str]:
         """Get set of enabled module names for a guild"""
         config = self.get_config(guild_id)
@@ -238,6 +274,7 @@ class ServerConfigManager:
         if "settings" not in config:
             config["settings"] = {}
         config["settings"][key] = value
+        self._bump_version(guild_id)
 
     def get_setting(self, guild_id: int, key: str, default: Any = None) -> Any:
         """Get a guild-specific setting"""
@@ -300,6 +337,69 @@ class ServerConfigManager:
             logger.info(f"✅ Saved configs for {len(self._configs)} servers")
         return success
 
+    def mark_dirty(self, guild_id: int):
+        """
+        Queue a save for a guild's config instead of awaiting save_to_discord().
+
+        The write happens in a background task after a short quiet period, so a
+        burst of changes costs one upload. Must be called from a running event loop.
+        """
+        self._dirty_guilds.add(guild_id)
+        self._dirty_event.set()
+        self._ensure_flush_task()
+
+    def _ensure_flush_task(self):
+        """Start the background flush loop if it isn't running"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def flush(self) -> bool:
+        """Save immediately if any guild has unsaved changes"""
+        if not self._dirty_guilds:
+            return True
+        pending = set(self._dirty_guilds)
+        self._dirty_guilds.clear()
+        self._dirty_event.clear()
+        error = None
+        try:
+            success = await self.save_to_discord()
+        except Exception as e:
+            error = e
+            success = False
+        if success:
+            if self._save_failures:
+                logger.info(f"✅ Server config saves recovered after {self._save_failures} failed attempts")
+            self._save_failures = 0
+            return True
+
+        self._save_failures += 1
+        detail = f": {error}" if error else ""
+        if self._save_failures == 1:
+            logger.warning(f"⚠️ Server config save failed, will retry with backoff{detail}")
+        else:
+            logger.debug(f"Server config save failed ({self._save_failures} in a row){detail}")
+        # Re-queue so _flush_loop retries instead of dropping the changes
+        self._dirty_guilds |= pending
+        self._dirty_event.set()
+        self._ensure_flush_task()
+        return False
+
+    def _retry_delay(self) -> float:
+        """Wait before the next flush: save_delay, doubled per consecutive failure up to the cap"""
+        if not self._save_failures:
+            return self.save_delay
+        return min(self.save_delay * 2 ** min(self._save_failures, 16), SAVE_BACKOFF_MAX_SECONDS)
+
+    async def _flush_loop(self):
+        """Background task: coalesce bursts of mark_dirty() calls into one save"""
+        while True:
+            await self._dirty_event.wait()
+            await asyncio.sleep(self._retry_delay())  # Let a burst settle, or back off after failures
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Failed to flush server configs: {e}")
+
     async def load_from_discord(self):
         """Load configs from storage backend (name kept for backwards compatibility)"""
         if self._loaded:
@@ -347,6 +447,10 @@ class ServerConfigManager:
                     self._configs = {}
                     logger.info("📝 No existing server configs found")
 
+            # Everything we knew about may have been replaced
+            for guild_id in set(self._versions) | set(self._configs):
+                self._bump_version(guild_id)
+
             self._loaded = True
             return True
 
@@ -413,6 +517,7 @@ class ServerConfigManager:
 
         if channel_id not in config["enabled_channels"]:
             config["enabled_channels"].append(channel_id)
+            self._bump_version(guild_id)
             logger.info(f"✅ Enabled channel {channel_id} for guild {guild_id}")
         return True
 
@@ -424,6 +529,7 @@ class ServerConfigManager:
 
         if channel_id in config["enabled_channels"]:
             config["enabled_channels"].remove(channel_id)
+            self._bump_version(guild_id)
             logger.info(f"❌ Disabled channel {channel_id} for guild {guild_id}")
         return True
 
@@ -443,6 +549,7 @@ class ServerConfigManager:
             config["channel_overrides"][channel_key] = {}
 
         config["channel_overrides"][channel_key][key] = value
+        self._bump_version(guild_id)
         logger.info(f"⚙️ Set channel {channel_id} override: {key}={value}")
 
     def get_channel_override(self, guild_id: int, channel_id: int, key: str) -> Any:
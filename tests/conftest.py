@@ -5,6 +5,7 @@ Pytest configuration and shared fixtures for CFB 26 League Bot tests.
 This file provides:
 - Mock Discord objects (Bot, Interaction, User, Guild, Channel)
 - Server config fixtures
+- League fixtures (schedule manager, timekeeper)
 - Test player data
 - Common test utilities
 """
@@ -123,6 +124,8 @@ def mock_server_config():
     config.get_recruiting_source = MagicMock(return_value="on3")
     config.auto_responses_enabled = MagicMock(return_value=True)
     config.save_to_discord = AsyncMock()
+    config.mark_dirty = MagicMock()
+    config.flush = AsyncMock(return_value=True)
 
     return config
 
@@ -313,6 +316,127 @@ def mock_hs_stats_scraper():
     return scraper
 
 
+# ==================== LEAGUE FIXTURES ====================
+
+@pytest.fixture(scope="session")
+def _schedule_fakes():
+    """Plain schedule data and fake ScheduleManager methods, built once per session"""
+    teams = ["Hawaii", "LSU", "Nebraska", "Stanford", "Texas", "USF", "Western Michigan"]
+    
+    schedules = {
+        0: {
+            "bye_teams": ["LSU", "Nebraska"],
+            "games": [
+                {"away": "Western Michigan", "home": "USF"},
+                {"away": "Delaware", "home": "Hawaii"},
+                {"away": "Stanford", "home": "Texas"}
+            ]
+        },
+        12: {
+            "bye_teams": [],
+            "games": [
+                {"away": "Nebraska", "home": "Indiana"},
+                {"away": "LSU", "home": "Missouri"},
+                {"away": "Texas", "home": "Mississippi St"},
+                {"away": "Oregon St", "home": "Hawaii"},
+                {"away": "Western Michigan", "home": "Northern Illinois"},
+                {"away": "USF", "home": "FAU"},
+                {"away": "Stanford", "home": "NC State"}
+            ]
+        }
+    }
+
+    # Mock get_week_schedule to return week data
+    def get_week_schedule(week):
+        return schedules.get(week)
+    
+    # Mock formatting methods (set for O(1) user-team membership)
+    team_set = frozenset(teams)
+    
+    def format_team(team_name):
+        if team_name in team_set:
+            return f"**{team_name}**"
+        return team_name
+    
+    def format_game(game, emoji="🏈"):
+        away = format_team(game['away'])
+        home = format_team(game['home'])
+        return f"{emoji} {away} @ {home}"
+    
+    def format_bye_teams(bye_teams):
+        return ", ".join([format_team(t) for t in bye_teams])
+    
+    def get_bye_teams(week):
+        week_data = get_week_schedule(week)
+        if not week_data:
+            return []
+        return week_data.get('bye_teams', [])
+    
+    # (week, team_lower) -> game record, built once so get_team_game is a dict lookup
+    team_game_index = {}
+    for week, week_data in schedules.items():
+        for game in week_data.get('games', []):
+            matchup = f"{format_team(game['away'])} @ {format_team(game['home'])}"
+            team_game_index[(week, game['home'].lower())] = {
+                'bye': False,
+                'team': game['home'],
+                'opponent': game['away'],
+                'location': 'home',
+                'matchup': matchup
+            }
+            team_game_index[(week, game['away'].lower())] = {
+                'bye': False,
+                'team': game['away'],
+                'opponent': game['home'],
+                'location': 'away',
+                'matchup': matchup
+            }
+        # Byes win over games, as in the real lookup
+        for team in week_data.get('bye_teams', []):
+            team_game_index[(week, team.lower())] = {'bye': True, 'team': team}
+    
+    def get_team_game(team, week):
+        return team_game_index.get((week, team.lower()))
+    
+    return {
+        'teams': teams,
+        'get_week_schedule': get_week_schedule,
+        'format_team': format_team,
+        'format_game': format_game,
+        'format_bye_teams': format_bye_teams,
+        'get_bye_teams': get_bye_teams,
+        'get_team_game': get_team_game,
+    }
+
+
+@pytest.fixture
+def mock_schedule_manager(_schedule_fakes):
+    """Mock ScheduleManager (fresh mock per test, session-built fake methods)"""
+    manager = MagicMock()
+    manager.teams = list(_schedule_fakes['teams'])
+    manager.season = 1
+    manager.get_week_schedule = _schedule_fakes['get_week_schedule']
+    manager.format_team = _schedule_fakes['format_team']
+    manager.format_game = _schedule_fakes['format_game']
+    manager.format_bye_teams = _schedule_fakes['format_bye_teams']
+    manager.get_bye_teams = _schedule_fakes['get_bye_teams']
+    manager.get_team_game = _schedule_fakes['get_team_game']
+    manager.reload_schedule = MagicMock(return_value=True)
+    return manager
+
+
+@pytest.fixture
+def mock_timekeeper():
+    """Mock TimekeeperManager"""
+    manager = MagicMock()
+    manager.get_season_week = MagicMock(return_value={'season': 5, 'week': 12})
+    manager.get_status = MagicMock(return_value={'active': False, 'hours': 0, 'minutes': 0})
+    manager.start_timer = AsyncMock(return_value=True)
+    manager.stop_timer = AsyncMock()
+    manager.increment_week = AsyncMock()
+    return manager
+
+
 # ==================== HELPER FUNCTIONS ====================
 
 def create_mock_recruit(
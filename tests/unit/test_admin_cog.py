@@ -13,6 +13,8 @@ Tests:
 - /admin config - Configure modules
 - /admin sync - Sync commands
 - /admin channels - Manage channel whitelist
+- /admin zyte - Zyte usage report
+- /admin budget - Budget status and reconcile
 """
 
 import pytest
@@ -34,8 +36,9 @@ class TestAdminSetChannel:
         # Call the callback directly for testing
         await cog.set_channel.callback(cog, mock_interaction, channel=MagicMock())
 
-        mock_interaction.response.send_message.assert_called_once()
-        call_kwargs = mock_interaction.response.send_message.call_args
+        mock_interaction.response.defer.assert_called_once()
+        mock_interaction.followup.send.assert_called_once()
+        call_kwargs = mock_interaction.followup.send.call_args
         assert call_kwargs.kwargs.get('ephemeral') == True
         assert "admin" in str(call_kwargs.args[0]).lower()
 
@@ -56,7 +59,27 @@ class TestAdminSetChannel:
             await cog.set_channel.callback(cog, mock_interaction, channel=mock_channel)
 
             mock_server_config.set_admin_channel.assert_called_once()
-            mock_server_config.save_to_discord.assert_called_once()
+            mock_server_config.mark_dirty.assert_called_once_with(mock_interaction.guild.id)
+
+    @pytest.mark.asyncio
+    async def test_set_channel_rejects_unknown_id(self, mock_interaction, mock_server_config):
+        """A channel ID that isn't in this guild is not saved"""
+        import discord
+        from cfb_bot.cogs.admin import AdminCog
+
+        mock_interaction.guild.fetch_channel = AsyncMock(
+            side_effect=discord.NotFound(MagicMock(status=404), "Unknown Channel")
+        )
+
+        with patch('cfb_bot.cogs.admin.server_config', mock_server_config):
+            cog = AdminCog(MagicMock())
+            cog.admin_manager = MagicMock()
+            cog.admin_manager.is_admin.return_value = True
+
+            await cog.set_channel.callback(cog, mock_interaction, channel_id="424242")
+
+            mock_interaction.guild.fetch_channel.assert_called_once_with(424242)
+            mock_server_config.set_admin_channel.assert_not_called()
 
 
 class TestAdminAddRemove:
@@ -98,6 +121,54 @@ class TestAdminAddRemove:
 
         cog.admin_manager.remove_admin.assert_called_once_with(999)
 
+    @pytest.mark.asyncio
+    async def test_add_requires_admin_manager(self, mock_interaction, mock_admin_user):
+        """Without an admin manager even Discord admins are denied"""
+        from cfb_bot.cogs.admin import AdminCog
+
+        mock_interaction.user = mock_admin_user
+
+        cog = AdminCog(MagicMock())
+        cog.admin_manager = None
+
+        await cog.add.callback(cog, mock_interaction, user=MagicMock())
+
+        mock_interaction.followup.send.assert_called_once()
+        assert mock_interaction.followup.send.call_args.kwargs.get('ephemeral') == True
+
+    def test_admin_check_cached_until_admins_change(self, mock_interaction):
+        """Repeated checks reuse the result until AdminManager.version moves"""
+        from cfb_bot.cogs.admin import AdminCog
+
+        cog = AdminCog(MagicMock())
+        cog.admin_manager = MagicMock()
+        cog.admin_manager.version = 0
+        cog.admin_manager.is_admin.return_value = True
+
+        assert cog._has_admin(mock_interaction, allow_guild_admins=False)
+        assert cog._has_admin(mock_interaction, allow_guild_admins=False)
+        assert cog.admin_manager.is_admin.call_count == 1
+
+        # AdminManager bumps its version on every add/remove, whoever calls it
+        cog.admin_manager.version += 1
+        cog.admin_manager.is_admin.return_value = False
+
+        assert not cog._has_admin(mock_interaction, allow_guild_admins=False)
+
+    def test_admin_check_cache_evicts_oldest(self):
+        """The admin check cache stays bounded, dropping the oldest entries first"""
+        from cfb_bot.cogs.admin import AdminCog, ADMIN_CHECK_CACHE_SIZE
+
+        cog = AdminCog(MagicMock())
+        cog.admin_manager = MagicMock()
+        cog.admin_manager.version = 0
+        for user_id in range(ADMIN_CHECK_CACHE_SIZE + 1):
+            interaction = MagicMock(user=MagicMock(id=user_id), guild=MagicMock(id=1))
+            cog._has_admin(interaction, allow_guild_admins=False)
+
+        assert len(cog._admin_check_cache) == ADMIN_CHECK_CACHE_SIZE
+        assert (0, 1, False) not in cog._admin_check_cache
+
     @pytest.mark.asyncio
     async def test_add_already_admin(self, mock_interaction):
         """Test adding someone who is already admin"""
@@ -114,11 +185,55 @@ class TestAdminAddRemove:
         await cog.add.callback(cog, mock_interaction, user=user)
 
         # Should send "already admin" message
-        call_kwargs = mock_interaction.response.send_message.call_args
+        call_kwargs = mock_interaction.followup.send.call_args
         embed = call_kwargs.kwargs.get('embed')
         assert "Already" in embed.title
 
 
+class TestAdminList:
+    """Tests for /admin list"""
+
+    @pytest.mark.asyncio
+    async def test_list_admins_fetches_concurrently(self, mock_interaction, mock_bot):
+        """Unresolvable admins fall back to their ID without failing the list"""
+        from cfb_bot.cogs.admin import AdminCog
+
+        found = MagicMock()
+        found.display_name = "Found Admin"
+        found.name = "found"
+        mock_bot.get_user = MagicMock(return_value=None)
+        mock_bot.fetch_user = AsyncMock(side_effect=[found, Exception("Unknown User")])
+
+        cog = AdminCog(mock_bot)
+        cog.admin_manager = MagicMock()
+        cog.admin_manager.get_admin_list.return_value = [1, 2]
+
+        await cog.list_admins.callback(cog, mock_interaction)
+
+        embed = mock_interaction.followup.send.call_args.kwargs.get('embed')
+        assert "Found Admin" in embed.description
+        assert "User ID: 2" in embed.description
+
+    @pytest.mark.asyncio
+    async def test_list_admins_uses_user_cache(self, mock_interaction, mock_bot):
+        """A second /admin list does not hit the API again"""
+        from cfb_bot.cogs.admin import AdminCog
+
+        user = MagicMock()
+        user.display_name = "Cached Admin"
+        mock_bot.get_user = MagicMock(return_value=None)
+        mock_bot.fetch_user = AsyncMock(return_value=user)
+
+        cog = AdminCog(mock_bot)
+        cog.admin_manager = MagicMock()
+        cog.admin_manager.get_admin_list.return_value = [1]
+
+        await cog.list_admins.callback(cog, mock_interaction)
+        await cog.list_admins.callback(cog, mock_interaction)
+
+        mock_bot.fetch_user.assert_called_once_with(1)
+
+
 class TestAdminConfig:
     """Tests for /admin config command"""
 
@@ -136,6 +251,25 @@ class TestAdminConfig:
             mock_interaction.response.defer.assert_called_once()
             mock_interaction.followup.send.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_config_view_cached_until_version_changes(self, mock_interaction, mock_server_config):
+        """Repeat views reuse the rendered embed until the guild's config version moves"""
+        from cfb_bot.cogs.admin import AdminCog
+
+        mock_server_config.version.return_value = 1
+
+        with patch('cfb_bot.cogs.admin.server_config', mock_server_config):
+            cog = AdminCog(MagicMock())
+            cog.admin_manager = None
+
+            await cog.config.callback(cog, mock_interaction, action="view")
+            await cog.config.callback(cog, mock_interaction, action="view")
+            assert mock_server_config.get_enabled_modules.call_count == 1
+
+            mock_server_config.version.return_value = 2
+            await cog.config.callback(cog, mock_interaction, action="view")
+            assert mock_server_config.get_enabled_modules.call_count == 2
+
     @pytest.mark.asyncio
     async def test_config_enable_requires_admin(self, mock_interaction, mock_server_config):
         """Test enabling module requires admin"""
@@ -149,7 +283,7 @@ class TestAdminConfig:
 
             await cog.config.callback(cog, mock_interaction, action="enable", module="recruiting")
 
-            call_kwargs = mock_interaction.response.send_message.call_args
+            call_kwargs = mock_interaction.followup.send.call_args
             assert call_kwargs.kwargs.get('ephemeral') == True
 
     @pytest.mark.asyncio
@@ -168,7 +302,28 @@ class TestAdminConfig:
             await cog.config.callback(cog, mock_interaction, action="enable", module="cfb_data")
 
             mock_server_config.enable_module.assert_called_once()
-            mock_server_config.save_to_discord.assert_called_once()
+            mock_server_config.mark_dirty.assert_called_once_with(mock_interaction.guild.id)
+
+    @pytest.mark.asyncio
+    async def test_config_enable_all_single_write(self, mock_interaction, mock_server_config, mock_admin_user):
+        """enable_all sets every non-core module in one call and saves once"""
+        from cfb_bot.cogs.admin import AdminCog
+        from cfb_bot.utils.server_config import FeatureModule
+
+        mock_interaction.user = mock_admin_user
+
+        with patch('cfb_bot.cogs.admin.server_config', mock_server_config):
+            cog = AdminCog(MagicMock())
+            cog.admin_manager = MagicMock()
+            cog.admin_manager.is_admin.return_value = True
+
+            await cog.config.callback(cog, mock_interaction, action="enable_all")
+
+            mock_server_config.set_enabled_modules.assert_called_once()
+            modules = mock_server_config.set_enabled_modules.call_args.args[1]
+            assert set(modules) == set(FeatureModule) - {FeatureModule.CORE}
+            mock_server_config.enable_module.assert_not_called()
+            mock_server_config.mark_dirty.assert_called_once_with(mock_interaction.guild.id)
 
     @pytest.mark.asyncio
     async def test_config_cannot_disable_core(self, mock_interaction, mock_server_config, mock_admin_user):
@@ -187,6 +342,28 @@ class TestAdminConfig:
             # Should NOT call disable_module for core
             mock_server_config.disable_module.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_config_disable_module(self, mock_interaction, mock_server_config, mock_admin_user):
+        """Test disabling a module as admin"""
+        from cfb_bot.cogs.admin import AdminCog
+        from cfb_bot.utils.server_config import FeatureModule
+
+        mock_interaction.user = mock_admin_user
+
+        with patch('cfb_bot.cogs.admin.server_config', mock_server_config):
+            cog = AdminCog(MagicMock())
+            cog.admin_manager = MagicMock()
+            cog.admin_manager.is_admin.return_value = True
+
+            await cog.config.callback(cog, mock_interaction, action="disable", module="recruiting")
+
+            mock_server_config.disable_module.assert_called_once_with(
+                mock_interaction.guild.id, FeatureModule.RECRUITING
+            )
+            mock_server_config.enable_module.assert_not_called()
+            embed = mock_interaction.followup.send.call_args.kwargs['embed']
+            assert embed.title == "❌ Module Disabled"
+
 
 class TestAdminChannels:
     """Tests for /admin channels command"""
@@ -253,7 +430,7 @@ class TestAdminSync:
 
         await cog.sync_commands.callback(cog, mock_interaction)
 
-        call_kwargs = mock_interaction.response.send_message.call_args
+        call_kwargs = mock_interaction.followup.send.call_args
         assert call_kwargs.kwargs.get('ephemeral') == True
 
     @pytest.mark.asyncio
@@ -274,6 +451,108 @@ class TestAdminSync:
         mock_bot.tree.sync.assert_called_once()
 
 
+class TestAdminZyte:
+    """Tests for /admin zyte command"""
+
+    @pytest.mark.asyncio
+    async def test_zyte_api_view_cached(self, mock_interaction, mock_admin_user):
+        """Repeated views reuse the Zyte Stats API response"""
+        from cfb_bot.cogs.admin import AdminCog, USAGE_CACHE_NAMESPACE
+        from cfb_bot.utils.cache import get_cache
+
+        get_cache().clear(USAGE_CACHE_NAMESPACE)
+        mock_interaction.user = mock_admin_user
+
+        scraper = MagicMock()
+        scraper.get_zyte_usage.return_value = {'is_available': True}
+        scraper.get_zyte_usage_from_api = AsyncMock(return_value={'results': []})
+
+        with patch('cfb_bot.cogs.admin.get_recruiting_scraper', return_value=(scraper, "On3/Rivals")):
+            cog = AdminCog(MagicMock())
+            await cog.zyte_usage.callback(cog, mock_interaction, view="api")
+            await cog.zyte_usage.callback(cog, mock_interaction, view="api")
+
+        scraper.get_zyte_usage_from_api.assert_awaited_once_with(days=30)
+        get_cache().clear(USAGE_CACHE_NAMESPACE)
+
+    @pytest.mark.asyncio
+    async def test_zyte_api_view_cooldown(self, mock_interaction, mock_admin_user):
+        """A retry during the cooldown says so instead of reporting setup required"""
+        from cfb_bot.cogs.admin import AdminCog, USAGE_CACHE_NAMESPACE, _ZYTE_STATS_UNAVAILABLE_EMBED
+        from cfb_bot.utils.cache import get_cache
+
+        get_cache().clear(USAGE_CACHE_NAMESPACE)
+        mock_interaction.user = mock_admin_user
+
+        scraper = MagicMock()
+        scraper.get_zyte_usage.return_value = {'is_available': True}
+        scraper.get_zyte_usage_from_api = AsyncMock(return_value=None)
+
+        with patch('cfb_bot.cogs.admin.get_recruiting_scraper', return_value=(scraper, "On3/Rivals")):
+            cog = AdminCog(MagicMock())
+            await cog.zyte_usage.callback(cog, mock_interaction, view="api")
+            assert mock_interaction.followup.send.call_args.kwargs['embed'] is _ZYTE_STATS_UNAVAILABLE_EMBED
+
+            await cog.zyte_usage.callback(cog, mock_interaction, view="api")
+
+        scraper.get_zyte_usage_from_api.assert_awaited_once_with(days=30)
+        args, kwargs = mock_interaction.followup.send.call_args
+        assert "try again in" in args[0]
+        assert kwargs.get('ephemeral') == True
+
+
+class TestAdminBudget:
+    """Tests for /admin budget command"""
+
+    def test_budget_emoji_and_bar_thresholds(self):
+        """Lookup tables match the 50%/80% thresholds and clamp out-of-range values"""
+        from cfb_bot.cogs.admin import _budget_emoji, _progress_bar
+
+        assert [_budget_emoji(p) for p in (-5, 49.9, 50, 79.9, 80, 250)] == ["🟢", "🟢", "🟡", "🟡", "🔴", "🔴"]
+        assert _progress_bar(0) == "[░░░░░░░░░░]"
+        assert _progress_bar(45) == "[████░░░░░░]"
+        assert _progress_bar(180) == "[██████████]"
+
+    @pytest.mark.asyncio
+    async def test_reconcile_fetches_both_providers(self, mock_interaction, mock_admin_user):
+        """Reconcile stores both provider costs with a single write"""
+        from datetime import datetime
+        from cfb_bot.cogs.admin import AdminCog
+
+        mock_interaction.user = mock_admin_user
+
+        scraper = MagicMock()
+        scraper.get_zyte_usage_from_api = AsyncMock(
+            return_value={'results': [{'cost_microusd_total': 2_500_000}]}
+        )
+        bot = MagicMock()
+        bot.ai_assistant.get_openai_cost_for_current_month = AsyncMock(return_value=1.25)
+
+        per_provider = {'ai': 10.0, 'zyte': 10.0, 'total': 10.0}
+        tracker = MagicMock()
+        tracker.zyte_spend_limit = 0
+        tracker.set_monthly_costs = AsyncMock()
+        tracker.get_budget_status = AsyncMock(return_value={
+            'percentages': per_provider, 'costs': per_provider,
+            'budgets': per_provider, 'remaining': per_provider,
+        })
+
+        with patch('cfb_bot.cogs.admin.get_recruiting_scraper', return_value=(scraper, "On3/Rivals")), \
+             patch('cfb_bot.cogs.admin.get_cost_tracker', return_value=tracker):
+            cog = AdminCog(bot)
+            await cog.budget_status.callback(cog, mock_interaction, action="reconcile")
+
+            tracker.set_monthly_costs.assert_awaited_once_with(ai_cost=1.25, zyte_cost=2.5)
+            embed = mock_interaction.followup.send.call_args.kwargs['embed']
+            assert [f.name for f in embed.fields][-1] == "ℹ️ About Budgets"
+            assert datetime.now().strftime('%B %Y') in embed.description
+
+            # A second reconcile right away is refused without touching the APIs
+            await cog.budget_status.callback(cog, mock_interaction, action="reconcile")
+            scraper.get_zyte_usage_from_api.assert_awaited_once()
+            assert "try again" in mock_interaction.followup.send.call_args.args[0]
+
+
 class TestAdminBlockChannel:
     """Tests for /admin block and /admin unblock"""
 
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Unit tests for api_retry helpers."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from cfb_bot.utils.api_retry import _parse_retry_after, _prune_exception_types
+
+
+class TestParseRetryAfter:
+    """Retry-After may be delta-seconds or an HTTP-date (RFC 7231)."""
+
+    def test_missing_header_uses_default(self):
+        assert _parse_retry_after(None, 4) == 4
+
+    def test_delta_seconds(self):
+        assert _parse_retry_after("7", 4) == 7
+
+    def test_negative_seconds_clamped(self):
+        assert _parse_retry_after("-3", 4) == 0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        wait = _parse_retry_after(format_datetime(retry_at, usegmt=True), 4)
+        assert 25 <= wait <= 30
+
+    def test_past_http_date_is_zero(self):
+        retry_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert _parse_retry_after(format_datetime(retry_at, usegmt=True), 4) == 0
+
+    def test_garbage_uses_default(self):
+        assert _parse_retry_after("soon-ish", 4) == 4
+
+
+class TestPruneExceptionTypes:
+    """with_retry normalizes its retry_on tuple once at decoration time."""
+
+    def test_drops_duplicates_and_subclasses(self):
+        pruned = _prune_exception_types((ConnectionResetError, OSError, ConnectionError, OSError))
+        assert pruned == (OSError,)
+
+    def test_keeps_unrelated_types_in_order(self):
+        assert _prune_exception_types((ValueError, KeyError)) == (ValueError, KeyError)
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Unit tests for FunCog
+
+Tests:
+- Admin gating on /fun commands
+- /fun target - Start trolling a user
+- /fun status - List targets
+- /fun target_all - Target several users at once
+- /fun roast - AI roast
+- on_message - Idle short-circuit and mention replies
+"""
+
+import asyncio
+
+import discord
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def _make_cog(is_admin: bool = True):
+    from cfb_bot.cogs.fun import FunCog
+
+    cog = FunCog(MagicMock())
+    cog.set_dependencies(admin_manager=MagicMock(), ai_assistant=None)
+    cog.admin_manager.version = 0
+    cog.admin_manager.is_admin.return_value = is_admin
+    return cog
+
+
+class TestFunAdminCheck:
+    """Tests for FunCog admin gating"""
+
+    @pytest.mark.asyncio
+    async def test_non_admin_denied(self, mock_interaction):
+        """Non-admins get the denial and no target is stored"""
+        cog = _make_cog(is_admin=False)
+
+        await cog.target.callback(cog, mock_interaction, user=MagicMock(bot=False))
+
+        assert mock_interaction.response.send_message.call_args.kwargs.get('ephemeral') == True
+        assert not cog.targets.get(mock_interaction.guild_id)
+
+    def test_admin_check_cached_until_admin_list_changes(self, mock_interaction):
+        """Repeated checks reuse the result until AdminManager.version moves"""
+        cog = _make_cog()
+
+        assert cog._check_admin(mock_interaction)
+        assert cog._check_admin(mock_interaction)
+        assert cog.admin_manager.is_admin.call_count == 1
+
+        cog.admin_manager.version += 1
+        cog.admin_manager.is_admin.return_value = False
+        assert not cog._check_admin(mock_interaction)
+
+    def test_admin_cache_evicts_oldest(self):
+        """The admin cache stays bounded, dropping the oldest entries first"""
+        from cfb_bot.cogs.fun import ADMIN_CHECK_CACHE_SIZE
+
+        cog = _make_cog()
+        for user_id in range(ADMIN_CHECK_CACHE_SIZE + 1):
+            cog._check_admin(MagicMock(user=MagicMock(id=user_id), guild_id=1))
+
+        assert len(cog._admin_cache) == ADMIN_CHECK_CACHE_SIZE
+        assert (0, 1) not in cog._admin_cache
+
+    def test_duplicate_interactions_expire_with_buckets(self):
+        """An id is a duplicate within the window and forgotten once its bucket rotates out"""
+        cog = _make_cog()
+        interaction = MagicMock(id=42)
+
+        assert not cog._is_duplicate_interaction(interaction)
+        assert cog._is_duplicate_interaction(interaction)
+
+        cog._bucket_epoch -= 2  # two windows have passed
+        assert not cog._is_duplicate_interaction(interaction)
+
+
+class TestFunTarget:
+    """Tests for /fun target"""
+
+    @pytest.mark.asyncio
+    async def test_target_adds_user(self, mock_interaction):
+        """Admin can target a member in this server"""
+        cog = _make_cog()
+        user = MagicMock(bot=False, id=555, display_name="Victim")
+
+        await cog.target.callback(cog, mock_interaction, user=user, timeout=10)
+
+        target = cog.targets[mock_interaction.guild_id][555]
+        assert target.timeout == 10
+        assert target.engage is True
+
+    @pytest.mark.asyncio
+    async def test_listener_only_attached_while_targeting(self, mock_interaction):
+        """on_message is registered with the first target and dropped with the last"""
+        cog = _make_cog()
+        user = MagicMock(bot=False, id=555, display_name="Victim")
+
+        await cog.target.callback(cog, mock_interaction, user=user)
+        cog.bot.add_listener.assert_called_once_with(cog.on_message, 'on_message')
+
+        mock_interaction.id = 2  # a fresh interaction, not a duplicate
+        await cog.untarget.callback(cog, mock_interaction, user=user)
+        cog.bot.remove_listener.assert_called_once_with(cog.on_message, 'on_message')
+        assert cog.targets == {}
+
+
+class TestFunStatus:
+    """Tests for /fun status"""
+
+    @pytest.mark.asyncio
+    async def test_status_lists_targets_in_description(self, mock_interaction):
+        """Every target is listed in one description, even past the 25-field embed cap"""
+        from cfb_bot.cogs.fun import TargetInfo
+
+        cog = _make_cog()
+        cog.targets[mock_interaction.guild_id] = {
+            uid: TargetInfo(30, f"Victim{uid}", 1, "Admin") for uid in range(30)
+        }
+
+        await cog.status.callback(cog, mock_interaction)
+
+        embed = mock_interaction.response.send_message.call_args.kwargs['embed']
+        assert not embed.fields
+        assert "Victim0" in embed.description and "Victim29" in embed.description
+        assert len(embed.description) <= 4096
+
+    @pytest.mark.asyncio
+    async def test_status_does_not_create_guild_entry(self, mock_interaction):
+        """Read-only commands leave self.targets sparse"""
+        cog = _make_cog()
+
+        await cog.status.callback(cog, mock_interaction)
+
+        assert cog.targets == {}
+
+
+class TestFunTargetAll:
+    """Tests for /fun target_all"""
+
+    @pytest.mark.asyncio
+    async def test_target_all_defers_then_adds_members(self, mock_interaction):
+        """Defers before fetching members and reports via followup"""
+        cog = _make_cog()
+        member = MagicMock(bot=False, id=42, display_name="Member")
+        mock_interaction.guild.get_member = MagicMock(return_value=None)
+        mock_interaction.guild.fetch_member = AsyncMock(return_value=member)
+
+        await cog.target_all.callback(cog, mock_interaction, users="<@42>")
+
+        mock_interaction.response.defer.assert_called_once_with(ephemeral=True)
+        mock_interaction.response.send_message.assert_not_called()
+        assert 42 in cog.targets[mock_interaction.guild_id]
+        assert mock_interaction.followup.send.call_args.kwargs['embed'].title == "🎯 Multiple Targets Acquired"
+
+    @pytest.mark.asyncio
+    async def test_target_all_uses_member_cache(self, mock_interaction):
+        """Cached members skip the HTTP fetch; unknown ids are fetched and skipped if missing"""
+        cog = _make_cog()
+        cached = MagicMock(bot=False, id=1, display_name="Cached")
+        mock_interaction.guild.get_member = MagicMock(side_effect=lambda uid: cached if uid == 1 else None)
+        not_found = discord.NotFound(MagicMock(status=404, reason="Not Found"), "Unknown Member")
+        mock_interaction.guild.fetch_member = AsyncMock(side_effect=not_found)
+
+        await cog.target_all.callback(cog, mock_interaction, users="<@1> <@!2> <@1>")
+
+        mock_interaction.guild.fetch_member.assert_awaited_once_with(2)
+        assert list(cog.targets[mock_interaction.guild_id]) == [1]
+
+    @pytest.mark.asyncio
+    async def test_target_all_skips_slow_fetches(self, mock_interaction):
+        """A member fetch that blows its budget is skipped as a timeout"""
+        cog = _make_cog()
+        mock_interaction.guild.get_member = MagicMock(return_value=None)
+
+        async def slow_fetch(user_id):
+            await asyncio.sleep(1)
+
+        mock_interaction.guild.fetch_member = slow_fetch
+
+        with patch('cfb_bot.cogs.fun.FETCH_MEMBER_TIMEOUT', 0.01):
+            await cog.target_all.callback(cog, mock_interaction, users="<@3>")
+
+        assert "(timeout)" in mock_interaction.followup.send.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_target_all_does_not_swallow_unexpected_errors(self, mock_interaction):
+        """Only Discord HTTP errors count as 'not found'"""
+        cog = _make_cog()
+        mock_interaction.guild.get_member = MagicMock(return_value=None)
+        mock_interaction.guild.fetch_member = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await cog.target_all.callback(cog, mock_interaction, users="<@3>")
+
+
+class TestFunOnMessage:
+    """Tests for the FunCog message listener"""
+
+    def _message(self, content: str = "hello", author_id: int = 555):
+        message = MagicMock()
+        message.author.bot = False
+        message.author.id = author_id
+        message.guild.id = 987654321
+        message.content = content
+        message.reference = None
+        message.mentions = []
+        message.channel.send = AsyncMock()
+        message.add_reaction = AsyncMock()
+        return message
+
+    @pytest.mark.asyncio
+    async def test_idle_cog_ignores_messages(self):
+        """With nobody targeted, messages are ignored without touching the guild"""
+        cog = _make_cog()
+        message = self._message("harry you're rubbish")
+
+        await cog.on_message(message)
+
+        message.channel.send.assert_not_called()
+        assert cog.targets == {}
+
+    @pytest.mark.asyncio
+    async def test_target_saying_harry_gets_insulted(self):
+        """A targeted user mentioning Harry gets a reply regardless of timeout"""
+        cog = _make_cog()
+        from cfb_bot.cogs.fun import TargetInfo
+
+        cog.targets[987654321] = {555: TargetInfo(60, "Victim", 1, "Admin", engage=False)}
+        message = self._message("oi harry")
+
+        await cog.on_message(message)
+
+        message.channel.send.assert_called_once()
+
+    def test_troll_messages_bounded(self):
+        """Oldest troll messages are dropped once the limit is hit"""
+        from cfb_bot.cogs.fun import MAX_TROLL_MESSAGES
+
+        cog = _make_cog()
+        for message_id in range(MAX_TROLL_MESSAGES + 5):
+            cog._remember_troll(message_id, 1, 2)
+
+        assert len(cog.troll_messages) == MAX_TROLL_MESSAGES
+        assert 0 not in cog.troll_messages
+        assert MAX_TROLL_MESSAGES + 4 in cog.troll_messages
+
+    @pytest.mark.asyncio
+    async def test_organic_troll_respects_timeout(self):
+        """First post is trolled (and reacted to) straight away, the next waits for the timeout"""
+        from cfb_bot.cogs.fun import TargetInfo
+
+        cog = _make_cog()
+        target = TargetInfo(60, "Victim", 1, "Admin", engage=False)
+        cog.targets[987654321] = {555: target}
+        message = self._message("just chatting")
+
+        with patch('cfb_bot.cogs.fun.random.random', return_value=0.0):
+            await cog.on_message(message)
+            await cog.on_message(message)
+
+        message.channel.send.assert_called_once()
+        message.add_reaction.assert_called_once()
+        assert target.last_triggered is not None
+
+    @pytest.mark.asyncio
+    async def test_engaged_target_insult_gets_comeback(self):
+        """Insult keywords match inside words, like the old substring check"""
+        from cfb_bot.cogs.fun import TargetInfo
+
+        cog = _make_cog()
+        target = TargetInfo(60, "Victim", 1, "Admin", last_triggered=float("inf"))
+        cog.targets[987654321] = {555: target}
+        message = self._message("this is so STUPIDLY rigged")
+
+        await cog.on_message(message)
+
+        message.channel.send.assert_called_once()
+        assert target.argument_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reply_to_troll_argues_back_until_limit(self):
+        """Replies to a troll message get comebacks until MAX_ARGUMENTS"""
+        from cfb_bot.cogs.fun import MAX_ARGUMENTS, TargetInfo
+
+        cog = _make_cog()
+        target = TargetInfo(60, "Victim", 1, "Admin", argument_count=MAX_ARGUMENTS - 1)
+        cog.targets[987654321] = {555: target}
+        cog._remember_troll(777, 987654321, 555)
+        message = self._message("no you")
+        message.reference = MagicMock(message_id=777)
+
+        await cog.on_message(message)
+        await cog.on_message(message)
+
+        message.channel.send.assert_called_once()
+        assert target.argument_count == MAX_ARGUMENTS
+
+    @pytest.mark.asyncio
+    async def test_overlapping_comeback_uses_fallback(self):
+        """A second comeback while the AI is still busy for that target skips the AI"""
+        from cfb_bot.cogs.fun import TargetInfo
+
+        cog = _make_cog()
+        cog.ai_assistant = MagicMock()
+        cog.ai_assistant.ask_question = AsyncMock(return_value="AI comeback")
+        target = TargetInfo(60, "Victim", 1, "Admin")
+        message = self._message("you're rubbish")
+
+        async with target.ai_lock:
+            await cog._send_comeback(message, target, "argued back with")
+        cog.ai_assistant.ask_question.assert_not_called()
+
+        await cog._send_comeback(message, target, "argued back with")
+        cog.ai_assistant.ask_question.assert_awaited_once()
+        assert target.argument_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ai_comeback_prompt_and_trim(self):
+        """The prompt carries the user's words and long replies are trimmed"""
+        from cfb_bot.cogs.fun import COMEBACK_MAX_CHARS
+
+        cog = _make_cog()
+        cog.ai_assistant = MagicMock()
+        cog.ai_assistant.ask_question = AsyncMock(return_value="x" * 300)
+
+        comeback = await cog._generate_ai_comeback("{not a placeholder}", "Victim")
+
+        prompt = cog.ai_assistant.ask_question.call_args.args[0]
+        assert 'told Victim "Fuck you"' in prompt and '"{not a placeholder}"' in prompt
+        assert len(comeback) == COMEBACK_MAX_CHARS and comeback.endswith("...")
+
+
+class TestFunRoast:
+    """Tests for /fun roast"""
+
+    @pytest.mark.asyncio
+    async def test_roast_uses_ai_prompt_and_mentions_user(self, mock_interaction):
+        """The AI roast prompt names the user and the reply mentions them"""
+        cog = _make_cog()
+        cog.ai_assistant = MagicMock()
+        cog.ai_assistant.ask_question = AsyncMock(return_value="You absolute melon 🍈")
+        user = MagicMock(bot=False, display_name="Victim", mention="<@555>")
+
+        await cog.roast.callback(cog, mock_interaction, user=user)
+
+        assert "roast for Victim." in cog.ai_assistant.ask_question.call_args.args[0]
+        mock_interaction.followup.send.assert_called_once_with("<@555> You absolute melon 🍈")
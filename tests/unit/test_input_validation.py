@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Unit tests for input_validation helpers."""
+
+from typing import Optional
+
+import pytest
+
+from cfb_bot.utils.input_validation import (
+    sanitize_string,
+    validate_discord_mention,
+    validate_input_length,
+)
+
+
+class TestSanitizeString:
+    """sanitize_string strips control characters, trims and truncates."""
+
+    def test_strips_null_and_control_chars(self):
+        assert sanitize_string("  who\x00 won\x07 today?\x1b ") == "who won today?"
+
+    def test_keeps_tabs_and_newlines(self):
+        assert sanitize_string("line one\n\tline two") == "line one\n\tline two"
+
+    def test_truncates_to_max_length(self):
+        assert sanitize_string("abcdef", max_length=3) == "abc"
+
+    def test_non_string_is_converted(self):
+        assert sanitize_string(42) == "42"
+
+
+class TestValidateDiscordMention:
+    """Mentions are <@id> or <@!id> and nothing else."""
+
+    def test_valid_mentions(self):
+        assert validate_discord_mention("<@123456789>")
+        assert validate_discord_mention("<@!123456789>")
+
+    def test_rejects_trailing_newline(self):
+        assert not validate_discord_mention("<@123456789>\n")
+
+
+class TestValidateInputLength:
+    """The decorator rejects over-long str arguments before running the command."""
+
+    @pytest.mark.asyncio
+    async def test_rejects_long_string_argument(self, mock_interaction):
+        calls = []
+
+        class Cog:
+            @validate_input_length(max_length=5)
+            async def ask(self, interaction, question: str, note: Optional[str] = None, count: int = 0):
+                calls.append(question)
+
+        await Cog().ask(mock_interaction, question="short", note="far too long")
+
+        assert calls == []
+        mock_interaction.response.send_message.assert_called_once()
+        assert "'note'" in mock_interaction.response.send_message.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_checks_strings_whatever_the_annotation(self, mock_interaction):
+        calls = []
+
+        class Cog:
+            @validate_input_length(max_length=5)
+            async def ask(self, interaction, question: 'str | None' = None, note=None):
+                calls.append(question)
+
+        await Cog().ask(mock_interaction, question="hi", note="far too long")
+
+        assert calls == []
+        assert "'note'" in mock_interaction.response.send_message.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_runs_command_when_inputs_fit(self, mock_interaction):
+        calls = []
+
+        class Cog:
+            @validate_input_length(max_length=5)
+            async def ask(self, interaction, question: str):
+                calls.append(question)
+
+        await Cog().ask(mock_interaction, question="hi")
+
+        assert calls == ["hi"]
+        mock_interaction.response.send_message.assert_not_called()
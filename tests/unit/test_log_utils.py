@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Unit tests for log_utils (sanitize_for_log, redact_api_key)."""
+
+from cfb_bot.security import LOG_MESSAGE_TRUNCATE
+from cfb_bot.utils.log_utils import redact_api_key, sanitize_for_log
+
+
+class TestSanitizeForLog:
+    """Test that log lines are truncated and scrubbed of URLs, emails and secrets."""
+
+    def test_passes_through_plain_text(self):
+        """Ordinary log text is unchanged."""
+        assert sanitize_for_log("Nebraska 24, Texas 17") == "Nebraska 24, Texas 17"
+
+    def test_redacts_urls_emails_and_secrets(self):
+        """URLs, emails and key=value secrets are all redacted."""
+        out = sanitize_for_log("see https://x.io/a mail bob@example.com TOKEN=abc123")
+        assert "x.io" not in out and "bob@" not in out and "abc123" not in out
+        assert out.count("[REDACTED]") == 3
+
+    def test_redacts_short_secret_without_url_or_email(self):
+        """Short lines still get secret redaction even with no '@' or '://'."""
+        assert "hunter2" not in sanitize_for_log("password=hunter2")
+
+    def test_redacts_prefixed_secret_names(self):
+        """Keys like API_KEY= or auth_token: are still caught."""
+        out = sanitize_for_log("API_KEY=abc123 auth_token: xyz789")
+        assert "abc123" not in out and "xyz789" not in out
+
+    def test_truncates_and_converts_non_strings(self):
+        """Long or non-string input is stringified and truncated."""
+        assert sanitize_for_log(42) == "42"
+        out = sanitize_for_log("a" * (LOG_MESSAGE_TRUNCATE + 50))
+        assert out.endswith("... (truncated)")
+
+
+def test_redact_api_key():
+    """Only the first and last four characters of a key survive."""
+    assert redact_api_key("sk-1234567890abcd") == "sk-1...abcd"
+    assert redact_api_key("short") == "[REDACTED]"
@@ -5,14 +5,25 @@ Unit tests for monitoring modules
 Tests Sentry integration and performance metrics
 """
 
+import logging
+import sys
 import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from src.cfb_bot.monitoring.performance_metrics import (PerformanceMetrics,
+from src.cfb_bot.monitoring.performance_metrics import (COMMAND_TIMES_WINDOW,
+                                                        PerformanceMetrics,
                                                         get_metrics,
                                                         track_performance)
+from src.cfb_bot.monitoring.sentry_integration import (COMMAND_TRACES_SAMPLE_RATE,
+                                                       SENTRY_MAX_QUEUED_EVENTS,
+                                                       _before_send,
+                                                       _make_traces_sampler,
+                                                       capture_exception,
+                                                       init_sentry,
+                                                       set_user_context,
+                                                       start_transaction)
 
 
 class TestPerformanceMetrics:
@@ -36,7 +47,7 @@ class TestPerformanceMetrics:
 
         assert metrics._command_counts["test_cmd"] == 2
         assert len(metrics._command_times["test_cmd"]) == 2
-        assert metrics._command_times["test_cmd"] == [1.5, 2.0]
+        assert list(metrics._command_times["test_cmd"]) == [1.5, 2.0]
 
     def test_record_error(self):
         """Test recording command errors"""
@@ -75,7 +86,22 @@ class TestPerformanceMetrics:
         assert stats['min_time'] == 1.0
         assert stats['max_time'] == 3.0
         assert stats['error_count'] == 1
-        assert abs(stats['error_rate'] - 0.333) < 0.01
+        assert stats['error_rate'] == pytest.approx(1 / 3, abs=0.01)
+
+    def test_command_times_are_bounded(self):
+        """Only recent samples are kept, but stats cover every call"""
+        metrics = PerformanceMetrics()
+
+        metrics.record_command("busy_cmd", 10.0)
+        for _ in range(COMMAND_TIMES_WINDOW):
+            metrics.record_command("busy_cmd", 1.0)
+
+        stats = metrics.get_command_stats("busy_cmd")
+
+        assert len(metrics._command_times["busy_cmd"]) == COMMAND_TIMES_WINDOW
+        assert stats['count'] == COMMAND_TIMES_WINDOW + 1
+        assert stats['max_time'] == 10.0
+        assert stats['min_time'] == 1.0
 
     def test_get_command_stats_nonexistent(self):
         """Test getting stats for non-existent command"""
@@ -124,8 +150,6 @@ class TestPerformanceMetrics:
 
     def test_slow_command_warning(self, caplog):
         """Test that slow commands trigger warnings"""
-        import logging
-
         metrics = PerformanceMetrics()
 
         with caplog.at_level(logging.WARNING):
@@ -154,17 +178,17 @@ class TestTrackPerformanceDecorator:
 
         @track_performance("test_command")
         async def dummy_command():
-            await asyncio.sleep(0.1)
             return "success"
 
-        # Patch the global metrics instance
-        with patch('src.cfb_bot.monitoring.performance_metrics._metrics', metrics):
+        # Patch the global metrics instance and the clock (start, end)
+        with patch('src.cfb_bot.monitoring.performance_metrics._metrics', metrics), \
+                patch('src.cfb_bot.monitoring.performance_metrics.time.perf_counter', side_effect=[0.0, 0.15]):
             result = await dummy_command()
 
         assert result == "success"
         assert metrics._command_counts["test_command"] == 1
         assert len(metrics._command_times["test_command"]) == 1
-        assert metrics._command_times["test_command"][0] >= 0.1
+        assert metrics._command_times["test_command"][0] == pytest.approx(0.15)
 
     async def test_track_performance_error(self):
         """Test decorator tracks errors"""
@@ -202,35 +226,28 @@ class TestSentryIntegration:
     @patch('src.cfb_bot.monitoring.sentry_integration.os.getenv')
     def test_init_sentry_no_dsn(self, mock_getenv):
         """Test Sentry initialization without DSN"""
-        from src.cfb_bot.monitoring.sentry_integration import init_sentry
-
         mock_getenv.return_value = None
 
         result = init_sentry()
 
         assert result is False
 
+    @patch('src.cfb_bot.monitoring.sentry_integration._sentry_enabled', False)
+    @patch('src.cfb_bot.monitoring.sentry_integration._sentry_sdk', None)
     @patch('src.cfb_bot.monitoring.sentry_integration.os.getenv')
     def test_init_sentry_success(self, mock_getenv):
         """Test successful Sentry initialization.
         sentry_sdk is imported inside init_sentry(), so we patch sys.modules
-        so that import gets our mock."""
-        import sys
-        mock_sentry = MagicMock()
-        mock_sentry.init = MagicMock()
-        mock_sentry.integrations = MagicMock()
-        mock_sentry.integrations.logging.LoggingIntegration = MagicMock()
-        mock_sentry.integrations.aiohttp.AioHttpIntegration = MagicMock()
-
-        # Properly mock the module structure so from ... import works
-        mock_logging_integration = MagicMock()
-        mock_aiohttp_integration = MagicMock()
-        
-        mock_sentry.integrations.logging = MagicMock()
-        mock_sentry.integrations.logging.LoggingIntegration = mock_logging_integration
-        
-        mock_sentry.integrations.aiohttp = MagicMock()
-        mock_sentry.integrations.aiohttp.AioHttpIntegration = mock_aiohttp_integration
+        so that import gets our mock. The mocks are spec-restricted so a typo
+        in init_sentry fails instead of silently creating a child mock."""
+        logging_module = MagicMock(spec=['LoggingIntegration'])
+        aiohttp_module = MagicMock(spec=['AioHttpIntegration'])
+        asyncio_module = MagicMock(spec=['AsyncioIntegration'])
+        mock_sentry = MagicMock(spec=['init', 'integrations'])
+        mock_sentry.integrations = MagicMock(spec=['logging', 'aiohttp', 'asyncio'])
+        mock_sentry.integrations.logging = logging_module
+        mock_sentry.integrations.aiohttp = aiohttp_module
+        mock_sentry.integrations.asyncio = asyncio_module
 
         mock_getenv.side_effect = lambda key, default=None: {
             'SENTRY_DSN': 'https://test@sentry.io/123',
@@ -241,21 +258,21 @@ class TestSentryIntegration:
         # We need to patch the actual import in the function
         with patch.dict(sys.modules, {
             'sentry_sdk': mock_sentry,
-            'sentry_sdk.integrations.logging': mock_sentry.integrations.logging,
-            'sentry_sdk.integrations.aiohttp': mock_sentry.integrations.aiohttp,
+            'sentry_sdk.integrations.logging': logging_module,
+            'sentry_sdk.integrations.aiohttp': aiohttp_module,
+            'sentry_sdk.integrations.asyncio': asyncio_module,
         }):
-            from src.cfb_bot.monitoring.sentry_integration import init_sentry
             result = init_sentry()
 
         assert result is True
         mock_sentry.init.assert_called_once()
+        integrations = mock_sentry.init.call_args.kwargs['integrations']
+        assert asyncio_module.AsyncioIntegration.return_value in integrations
 
     @patch('src.cfb_bot.monitoring.sentry_integration._sentry_enabled', True)
     @patch('src.cfb_bot.monitoring.sentry_integration._sentry_sdk')
     def test_capture_exception(self, mock_sentry):
         """Test capturing exception"""
-        from src.cfb_bot.monitoring.sentry_integration import capture_exception
-
         test_exception = ValueError("Test error")
         capture_exception(test_exception)
 
@@ -265,21 +282,19 @@ class TestSentryIntegration:
     @patch('src.cfb_bot.monitoring.sentry_integration._sentry_sdk')
     def test_capture_exception_with_context(self, mock_sentry):
         """Test capturing exception with context"""
-        from src.cfb_bot.monitoring.sentry_integration import capture_exception
-
         test_exception = ValueError("Test error")
         context = {'command': 'test', 'user': '123'}
 
         capture_exception(test_exception, context=context)
 
         mock_sentry.push_scope.assert_called_once()
+        scope = mock_sentry.push_scope.return_value.__enter__.return_value
+        scope.set_context.assert_called_once_with("extra", context)
 
     @patch('src.cfb_bot.monitoring.sentry_integration._sentry_enabled', True)
     @patch('src.cfb_bot.monitoring.sentry_integration._sentry_sdk')
     def test_set_user_context(self, mock_sentry):
         """Test setting user context"""
-        from src.cfb_bot.monitoring.sentry_integration import set_user_context
-
         set_user_context("123", "testuser")
 
         mock_sentry.set_user.assert_called_once_with({
@@ -287,15 +302,36 @@ class TestSentryIntegration:
             "username": "testuser"
         })
 
+    def test_traces_sampler(self):
+        """Health checks are dropped, commands sampled higher than the base rate"""
+        sampler = _make_traces_sampler(0.02)
+
+        assert sampler({'transaction_context': {'name': 'healthcheck'}}) == 0.0
+        assert sampler({'transaction_context': {'name': '/cfb player'}}) == COMMAND_TRACES_SAMPLE_RATE
+        assert sampler({'transaction_context': {'name': 'on_message'}}) == 0.02
+        assert sampler({'parent_sampled': True, 'transaction_context': {'name': 'ping'}}) == 1.0
+
+    @patch('src.cfb_bot.monitoring.sentry_integration._sentry_sdk')
+    def test_before_send_drops_when_transport_backed_up(self, mock_sentry):
+        """Events are dropped once the transport queue passes the limit"""
+        queue = mock_sentry.get_client.return_value.transport._worker._queue
+        event = {'message': 'boom'}
+
+        queue.qsize.return_value = 0
+        assert _before_send(event, {}) is event
+
+        queue.qsize.return_value = SENTRY_MAX_QUEUED_EVENTS + 1
+        assert _before_send(event, {}) is None
+
+    @patch('src.cfb_bot.monitoring.sentry_integration._sentry_enabled', False)
+    def test_start_transaction_disabled_is_noop_context(self):
+        """Disabled Sentry still hands back something usable with 'with'"""
+        with start_transaction(name="/cfb player", op="command") as tx:
+            tx.set_tag("team", "Nebraska")
+
     @patch('src.cfb_bot.monitoring.sentry_integration._sentry_enabled', False)
     def test_capture_exception_disabled(self):
         """Test capture_exception when Sentry is disabled"""
-        from src.cfb_bot.monitoring.sentry_integration import capture_exception
-
         # Should not raise error when disabled
         test_exception = ValueError("Test error")
         capture_exception(test_exception)
-
-
-# Import asyncio for async tests
-import asyncio
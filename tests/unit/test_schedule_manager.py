@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Unit tests for ScheduleManager loading and reloads."""
+
+import json
+from unittest.mock import patch
+
+from cfb_bot.utils import schedule_manager as schedule_module
+from cfb_bot.utils.schedule_manager import ScheduleManager
+
+
+def test_bad_reload_keeps_previous_schedule(tmp_path):
+    """A reload that fails validation leaves season, teams and data untouched."""
+    schedule_file = tmp_path / "schedule.json"
+    schedule_file.write_text(json.dumps({"season": 2, "teams": ["LSU", "Texas"], "schedule": {}}))
+
+    with patch.object(schedule_module, "SCHEDULE_FILE", schedule_file):
+        manager = ScheduleManager()
+        assert (manager.season, manager.teams) == (2, ["LSU", "Texas"])
+
+        schedule_file.write_text(json.dumps(["not", "a", "schedule"]))
+        assert manager.reload_schedule() is False
+
+    assert (manager.season, manager.teams) == (2, ["LSU", "Texas"])
+    assert manager.schedule_data["season"] == 2
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Unit tests for server_config (bulk module writes, versioning, debounced saves)."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from cfb_bot.utils.server_config import SAVE_BACKOFF_MAX_SECONDS, FeatureModule, ServerConfigManager
+
+
+def test_set_enabled_modules_keeps_core_on():
+    """set_enabled_modules enables exactly the given modules, CORE always on."""
+    manager = ServerConfigManager()
+
+    manager.set_enabled_modules(1, {FeatureModule.LEAGUE})
+    assert manager.get_enabled_modules(1) == {"core", "league"}
+
+    manager.set_enabled_modules(1, set())
+    assert manager.get_enabled_modules(1) == {"core"}
+
+
+def test_version_bumps_on_mutation():
+    """Every mutator moves the guild's version; reads don't."""
+    manager = ServerConfigManager()
+    v0 = manager.version(1)
+
+    manager.get_enabled_modules(1)
+    assert manager.version(1) == v0
+
+    manager.enable_module(1, FeatureModule.LEAGUE)
+    v1 = manager.version(1)
+    assert v1 > v0
+
+    manager.set_setting(1, "schedule_announcement", False)
+    assert manager.version(1) > v1
+    assert manager.version(2) == 0
+
+
+@pytest.mark.asyncio
+async def test_mark_dirty_coalesces_saves():
+    """A burst of mark_dirty calls results in a single save."""
+    manager = ServerConfigManager()
+    manager.save_to_discord = AsyncMock(return_value=True)
+    manager.save_delay = 0.01
+
+    try:
+        for guild_id in (1, 2, 1):
+            manager.mark_dirty(guild_id)
+        await asyncio.sleep(0.05)
+    finally:
+        manager._flush_task.cancel()
+
+    manager.save_to_discord.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_flush_noop_when_clean():
+    """flush() does not hit storage when nothing is pending."""
+    manager = ServerConfigManager()
+    manager.save_to_discord = AsyncMock(return_value=True)
+
+    assert await manager.flush() is True
+    manager.save_to_discord.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("save", [
+    AsyncMock(return_value=False),
+    AsyncMock(side_effect=RuntimeError("storage down")),
+], ids=["returns_false", "raises"])
+async def test_flush_requeues_failed_save(save):
+    """A failed save keeps the guilds dirty so the flush loop retries."""
+    manager = ServerConfigManager()
+    manager._dirty_guilds.update({1, 2})
+    manager.save_to_discord = save
+
+    try:
+        assert await manager.flush() is False
+        assert manager._dirty_guilds == {1, 2}
+        assert manager._dirty_event.is_set()
+        assert not manager._flush_task.done()
+    finally:
+        manager._flush_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_flush_backs_off_after_repeated_failures():
+    """Back-to-back failed saves wait longer than save_delay before retrying."""
+    manager = ServerConfigManager()
+    manager.save_delay = 0.01
+    loop = asyncio.get_running_loop()
+    attempts = []
+
+    async def failing_save():
+        attempts.append(loop.time())
+        return False
+
+    manager.save_to_discord = failing_save
+    try:
+        manager.mark_dirty(1)
+        for _ in range(100):
+            if len(attempts) >= 3:
+                break
+            await asyncio.sleep(0.005)
+    finally:
+        manager._flush_task.cancel()
+
+    assert attempts[1] - attempts[0] > manager.save_delay
+    assert attempts[2] - attempts[1] > attempts[1] - attempts[0]
+    assert manager._save_failures >= 2
+
+
+def test_retry_delay_is_capped():
+    """The backoff never exceeds SAVE_BACKOFF_MAX_SECONDS."""
+    manager = ServerConfigManager()
+    assert manager._retry_delay() == manager.save_delay
+
+    manager._save_failures = 100
+    assert manager._retry_delay() == SAVE_BACKOFF_MAX_SECONDS